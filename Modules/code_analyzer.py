@@ -1,5 +1,8 @@
 import os
 
+# Číta a počíta riadky všetkých .py súborov v priečinku - v samostatnom procese
+MODULE_HEAVY = True
+
 class CodeAnalyzer:
     def __init__(self):
         self.supported_commands = [
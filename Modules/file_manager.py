@@ -9,6 +9,14 @@ import fnmatch
 from datetime import datetime
 import paramiko  # pre SSH
 import subprocess
+import asyncio
+
+from core.content_search import ContentSearch
+from core.disk_usage import DiskUsage
+from core.folder_sync import FolderSync
+from core.remote_files import RemoteFiles
+from core.file_index import FileIndex
+from plugins.base_plugins import StreamResult
 
 class FileManager:
     def __init__(self, config_manager=None):
@@ -32,14 +40,43 @@ class FileManager:
             "vyhľadaj v súboroch", "search in files", "hľadaj v dokumentoch",
             "zoznam všetkých súborov", "manifest zložky", "folder manifest",
             "veľkosť zložky", "folder size", "veľkosť priečinka",
+            "využitie disku", "disk usage",
+            "synchronizuj zložky", "sync folders",
+            
+            # Sieťové zariadenia
+            "pripoj zariadenie", "connect device", "zoznam zariadení", "list devices",
+            "vzdialený zoznam", "remote list", "nahraj na zariadenie", "upload to device",
+            "stiahni zo zariadenia", "download from device",
         ]
         
+        self.config_manager = config_manager
         self.connected_devices = {}
         self.search_history = []
         self.file_cache = {}
         
+        # Index metadát súborov (SQLite) - prvé indexovanie beží na pozadí
+        settings = config_manager.snapshot if config_manager is not None else {}
+        self.file_index = None
+        if settings.get("file_index", {}).get("enabled", True):
+            config_dir = getattr(config_manager, 'config_dir', 'config')
+            self.file_index = FileIndex.from_settings(settings, config_dir)
+            self.file_index.start()
+        self.content_search = ContentSearch.from_settings(settings)
+        self.disk_usage = DiskUsage.from_settings(settings)
+        self.folder_sync = FolderSync.from_settings(settings)
+        self.remote_files = RemoteFiles.from_settings(settings)
+        
         print("✅ Ultimate FileManager inicializovaný")
     
+    async def shutdown(self):
+        """Zastaví indexovanie a sledovanie súborov, odpojí zariadenia"""
+        if self.file_index is not None:
+            self.file_index.close()
+        self.remote_files.close()
+        for info in self.connected_devices.values():
+            info['ssh'].close()
+        self.connected_devices.clear()
+    
     def can_handle(self, command: str) -> bool:
         return any(cmd in command.lower() for cmd in self.supported_commands)
     
@@ -77,13 +114,14 @@ class FileManager:
             
             # POKROČILÉ OPERÁCIE
             elif "nájdi súbor" in command_lower or "find file" in command_lower:
-                return self.advanced_file_search(command)
+                return await self.advanced_file_search(command)
             elif "vyhľadaj v súboroch" in command_lower or "search in files" in command_lower:
                 return self.search_in_files(command)
             elif "zoznam všetkých súborov" in command_lower or "manifest zložky" in command_lower:
-                return self.generate_comprehensive_manifest(command)
-            elif "veľkosť zložky" in command_lower or "folder size" in command_lower:
-                return self.get_folder_size(command)
+                return await self.generate_comprehensive_manifest(command)
+            elif any(phrase in command_lower for phrase in ("veľkosť zložky", "veľkosť priečinka", "folder size",
+                                                            "využitie disku", "disk usage")):
+                return await self.get_folder_size(command)
             elif "zjednoť zložky" in command_lower or "unite folders" in command_lower:
                 return await self.unite_folders(command)
             elif "kompresuj zložku" in command_lower or "compress folder" in command_lower:
@@ -96,6 +134,12 @@ class FileManager:
                 return self.list_devices()
             elif "synchronizuj zložky" in command_lower or "sync folders" in command_lower:
                 return await self.sync_folders(command)
+            elif "vzdialený zoznam" in command_lower or "remote list" in command_lower:
+                return await self.list_remote(command)
+            elif "nahraj na zariadenie" in command_lower or "upload to device" in command_lower:
+                return await self.transfer_to_device(command)
+            elif "stiahni zo zariadenia" in command_lower or "download from device" in command_lower:
+                return await self.transfer_from_device(command)
             
             # UI
             elif "otvor file manager" in command_lower or "open file browser" in command_lower:
@@ -221,8 +265,8 @@ class FileManager:
             return f"❌ Chyba pri čítaní: {str(e)}"
 
     # POKROČILÉ VYHĽADÁVANIE
-    def advanced_file_search(self, command: str) -> str:
-        """Pokročilé vyhľadávanie súborov"""
+    async def advanced_file_search(self, command: str) -> str:
+        """Pokročilé vyhľadávanie súborov cez index (podreťazec, `prefix*`, glob `*.pdf`)"""
         search_pattern = r'["\']([^"\']+)["\']'
         matches = re.findall(search_pattern, command)
         
@@ -230,30 +274,34 @@ class FileManager:
             return "❌ Zadajte hľadaný výraz v úvodzovkách."
         
         search_term = matches[0]
-        start_path = self.extract_paths(command)
-        start_path = start_path[0] if start_path else "C:\\"
-        
-        results = []
-        try:
-            for root, dirs, files in os.walk(start_path):
-                for file in files:
-                    if search_term.lower() in file.lower():
-                        full_path = os.path.join(root, file)
-                        size = os.path.getsize(full_path)
-                        modified = datetime.fromtimestamp(os.path.getmtime(full_path))
-                        results.append({
-                            'path': full_path,
-                            'size': size,
-                            'modified': modified
-                        })
-                
-                if len(results) >= 50:  # Obmedzenie výsledkov
-                    break
-        except Exception as e:
-            return f"❌ Chyba pri vyhľadávaní: {str(e)}"
+        # extract_paths bez cesty vráti texty v úvodzovkách - hľadaný výraz nie je zložka
+        start_path = [path for path in self.extract_paths(command) if path != search_term]
+        start_path = start_path[0] if start_path else None
+        if start_path and not os.path.isdir(start_path):
+            return f"❌ Zložka neexistuje: {start_path}"
+        
+        loop = asyncio.get_running_loop()
+        notice = ""
+        if self.file_index is None:
+            # Prechod disku (aj celého domovského priečinka) beží mimo event loopu
+            results = await loop.run_in_executor(None, self._walk_file_search, search_term,
+                                                 start_path or os.path.expanduser("~"))
+        else:
+            # Nezaindexovaná zložka sa začne indexovať; dovtedy sú výsledky neúplné
+            if start_path and not self.file_index.is_indexed(start_path):
+                self.file_index.index_root(start_path)
+            try:
+                # search overuje výsledky cez lstat - tiež mimo event loopu
+                results = await loop.run_in_executor(
+                    None, lambda: self.file_index.search(search_term, root=start_path, limit=50)
+                )
+            except Exception as e:
+                return f"❌ Chyba pri vyhľadávaní: {str(e)}"
+            if self.file_index.is_crawling():
+                notice = "\n⏳ Indexovanie súborov ešte prebieha - výsledky môžu byť neúplné"
         
         if not results:
-            return f"🔍 Nenašiel sa žiadny súbor obsahujúci '{search_term}'"
+            return f"🔍 Nenašiel sa žiadny súbor obsahujúci '{search_term}'{notice}"
         
         result_text = f"🔍 Nájdených {len(results)} súborov pre '{search_term}':\n"
         for i, result in enumerate(results[:10], 1):
@@ -261,6 +309,7 @@ class FileManager:
         
         if len(results) > 10:
             result_text += f"... a ďalších {len(results) - 10} súborov"
+        result_text += notice
         
         # Ulož do histórie
         self.search_history.append({
@@ -271,7 +320,67 @@ class FileManager:
         
         return result_text
 
-    def generate_comprehensive_manifest(self, command: str) -> str:
+    def search_in_files(self, command: str):
+        """Vyhľadá text v obsahu súborov - zhody s číslami riadkov posiela do chatu priebežne.
+
+        Príklad: vyhľadaj v súboroch "TODO" ./projekt (regex / presne = regulárny výraz / rozlišovať veľkosť)
+        """
+        term = self.extract_content(command)
+        if not term:
+            return "❌ Zadajte hľadaný text v úvodzovkách."
+        paths = [path for path in self.extract_paths(command) if path != term]
+        root = paths[0] if paths else "."
+        if not os.path.exists(root):
+            return f"❌ Zložka neexistuje: {root}"
+        
+        command_lower = command.lower()
+        regex = "regex" in command_lower or "regulárn" in command_lower
+        ignore_case = not ("presne" in command_lower or "case sensitive" in command_lower)
+        if regex:
+            try:
+                re.compile(term)
+            except re.error as e:
+                return f"❌ Neplatný regulárny výraz: {e}"
+        
+        self.search_history.append({'term': term, 'content': True, 'timestamp': datetime.now()})
+        return StreamResult(self._stream_content_matches(root, term, regex, ignore_case))
+
+    async def _stream_content_matches(self, root: str, term: str, regex: bool, ignore_case: bool):
+        yield f"🔎 Hľadám '{term}' v {os.path.abspath(root)}...\n"
+        async for item in self.content_search.stream(root, term, regex=regex, ignore_case=ignore_case):
+            if not isinstance(item, dict):
+                lines = [f"📄 {item[0].path}"] + [f"   {match.line_number}: {match.line}" for match in item]
+                yield "\n".join(lines) + "\n"
+            elif 'error' in item:
+                yield f"❌ Chyba pri vyhľadávaní: {item['error']}"
+            else:
+                summary = (f"✅ {item['matches']} zhôd v {item['files_matched']} súboroch "
+                           f"(prehľadaných {item['files_scanned']} súborov, "
+                           f"{self._format_size(item['bytes_scanned'])}, {item['duration_s']:.2f} s)")
+                if item['truncated']:
+                    summary += f"\n⚠️  Zastavené po {item['matches']} zhodách - upresnite hľadaný výraz alebo zložku"
+                if not item['matches']:
+                    summary = f"🔍 Text '{term}' sa nenašiel (prehľadaných {item['files_scanned']} súborov)"
+                yield summary
+
+    def _walk_file_search(self, search_term: str, start_path: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Vyhľadávanie prechodom disku (keď je index vypnutý)"""
+        results = []
+        term = search_term.lower()
+        for root, dirs, files in os.walk(start_path):
+            for file in files:
+                if term in file.lower():
+                    full_path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(full_path)
+                    except OSError:
+                        continue
+                    results.append({'path': full_path, 'size': stat.st_size, 'modified': stat.st_mtime})
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    async def generate_comprehensive_manifest(self, command: str) -> str:
         """Komplexný manifest zložky"""
         paths = self.extract_paths(command)
         path = paths[0] if paths else "."
@@ -279,37 +388,75 @@ class FileManager:
         try:
             if not os.path.exists(path):
                 return f"❌ Zložka neexistuje: {path}"
-            
-            file_types = {}
-            total_size = 0
-            file_count = 0
-            
-            for root, dirs, files in os.walk(path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        size = os.path.getsize(file_path)
-                        total_size += size
-                        file_count += 1
-                        
-                        # Štatistika typov súborov
-                        ext = os.path.splitext(file)[1].lower()
-                        file_types[ext] = file_types.get(ext, 0) + 1
-                    except:
-                        continue
-            
-            result = f"📊 KOMPLETNÝ MANIFEST: {path}\n"
-            result += f"📁 Celkový počet súborov: {file_count}\n"
-            result += f"💾 Celková veľkosť: {self._format_size(total_size)}\n\n"
-            
-            result += "📈 Štatistika typov súborov:\n"
-            for ext, count in sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:10]:
-                result += f"  {ext or 'žiadna'}: {count} súborov\n"
-            
-            return result
+            # Prvé skenovanie veľkého stromu trvá - nesmie blokovať event loop
+            return await asyncio.get_running_loop().run_in_executor(None, self._build_manifest, path)
         except Exception as e:
             return f"❌ Chyba pri generovaní manifestu: {str(e)}"
 
+    def _build_manifest(self, path: str) -> str:
+        usage = self.disk_usage.scan(path)
+        
+        result = f"📊 KOMPLETNÝ MANIFEST: {path}\n"
+        result += f"📁 Celkový počet súborov: {usage.total_files}\n"
+        result += f"💾 Celková veľkosť: {self._format_size(usage.total_size)}\n\n"
+        
+        result += "📈 Štatistika typov súborov:\n"
+        extensions = sorted(self.disk_usage.by_extension(path), key=lambda item: item[2], reverse=True)
+        for ext, size, count in extensions[:10]:
+            result += f"  {ext or 'žiadna'}: {count} súborov ({self._format_size(size)})\n"
+        
+        return result
+
+    async def get_folder_size(self, command: str) -> str:
+        """Veľkosť zložky s najväčšími podzložkami a súbormi"""
+        paths = self.extract_paths(command)
+        path = paths[0] if paths else "."
+        
+        try:
+            if not os.path.isdir(path):
+                return f"❌ Zložka neexistuje: {path}"
+            return await asyncio.get_running_loop().run_in_executor(None, self.disk_usage_report, path)
+        except Exception as e:
+            return f"❌ Chyba pri zisťovaní veľkosti: {str(e)}"
+
+    def disk_usage_report(self, path: str, limit: int = 10) -> str:
+        """Prehľad využitia disku (ako ncdu) - zmenené podstromy sa prepočítajú, ostatné sú z cache"""
+        usage = self.disk_usage.scan(path)
+        stats = self.disk_usage.stats
+        
+        result = f"💾 VYUŽITIE DISKU: {usage.path}\n"
+        result += (f"📦 Celkom {self._format_size(usage.total_size)} - "
+                   f"{usage.total_files} súborov, {usage.total_dirs} zložiek\n")
+        result += (f"⏱️  {stats['duration_s']:.2f} s (prečítaných {stats['dirs_scanned']} zložiek, "
+                   f"{stats['dirs_cached']} z cache)\n")
+        
+        directories = self.disk_usage.largest_dirs(path, limit)
+        if directories:
+            result += "\n📁 Najväčšie zložky:\n"
+            for directory in directories:
+                result += (f"  {self._usage_bar(directory.total_size, usage.total_size)} "
+                           f"{self._format_size(directory.total_size):>10}  {os.path.basename(directory.path)}/\n")
+        
+        files = self.disk_usage.largest_files(path, limit)
+        if files:
+            result += "\n📄 Najväčšie súbory:\n"
+            for size, file_path in files:
+                result += f"  {self._format_size(size):>10}  {os.path.relpath(file_path, usage.path)}\n"
+        
+        extensions = self.disk_usage.by_extension(path)[:limit]
+        if extensions:
+            result += "\n📈 Podľa prípony:\n"
+            for ext, size, count in extensions:
+                result += f"  {self._format_size(size):>10}  {ext or 'žiadna'} ({count} súborov)\n"
+        
+        return result.rstrip("\n")
+
+    @staticmethod
+    def _usage_bar(size: int, total: int, width: int = 20) -> str:
+        """Textový stĺpec podielu na celku"""
+        filled = round(width * size / total) if total else 0
+        return "[" + "#" * filled + "." * (width - filled) + "]"
+
     # SIETOVÉ ZARIADENIA
     async def connect_device(self, command: str) -> str:
         """Pripojí sieťové zariadenie"""
@@ -319,13 +466,23 @@ class FileManager:
             return "❌ Zadajte údaje zariadenia: 'pripoj zariadenie názov@ip'"
         
         name, hostname, username, password = device_info
+        port = 22
+        if re.fullmatch(r'[^:\[\]]+:\d+', hostname):
+            hostname, port = hostname.rsplit(':', 1)
+            port = int(port)
         
         try:
             # SSH pripojenie
             ssh = paramiko.SSHClient()
             ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(hostname, username=username, password=password)
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: ssh.connect(hostname, port=port, username=username, password=password,
+                                          look_for_keys=not password, allow_agent=not password))
             
+            previous = self.connected_devices.pop(name, None)
+            if previous is not None:
+                previous['ssh'].close()
+            self.remote_files.attach(name, ssh)
             self.connected_devices[name] = {
                 'ssh': ssh,
                 'hostname': hostname,
@@ -349,35 +506,140 @@ class FileManager:
         return result
 
     async def sync_folders(self, command: str) -> str:
-        """Synchronizuje zložky medzi zariadeniami"""
-        paths = self.extract_paths(command)
+        """Synchronizuje zložky - kopíruje len zmenené súbory.
+
+        Príklad: synchronizuj zložky "/data/foto" "/zaloha/foto" (zmaž navyše / skúšobne)
+        So zariadením: synchronizuj zložky /data/foto moj_pc:/zaloha/foto (opačné poradie = zo zariadenia)
+        """
+        remote = self._extract_remote_path(command)
+        if remote:
+            device, remote_path, local_paths, remote_first = remote
+            if not local_paths:
+                return "❌ Zadajte lokálnu zložku a zložku na zariadení (názov:/cesta)"
+            direction = "download" if remote_first else "upload"
+            return await self._remote_operation(
+                lambda: self.remote_files.sync(device, local_paths[0], remote_path, direction=direction))
+        
+        paths = self._extract_path_pair(command)
         if len(paths) < 2:
             return "❌ Zadajte zdrojovú a cieľovú zložku"
         
         source, target = paths[0], paths[1]
+        if not os.path.isdir(source):
+            return f"❌ Zdrojová zložka neexistuje: {source}"
+        
+        command_lower = command.lower()
+        delete_orphans = any(flag in command_lower for flag in ("zmaž navyše", "--delete", "delete orphans"))
+        dry_run = "skúšobne" in command_lower or "dry run" in command_lower
         
         try:
-            # Jednoduchá synchronizácia
-            if not os.path.exists(target):
-                os.makedirs(target)
-            
-            copied = 0
-            for root, dirs, files in os.walk(source):
-                for file in files:
-                    src_file = os.path.join(root, file)
-                    rel_path = os.path.relpath(src_file, source)
-                    dst_file = os.path.join(target, rel_path)
-                    
-                    # Vytvor podzložky
-                    os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-                    
-                    # Kopíruj súbor
-                    shutil.copy2(src_file, dst_file)
-                    copied += 1
-            
-            return f"✅ Synchronizovaných {copied} súborov z {source} do {target}"
+            report = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: self.folder_sync.sync(source, target, delete_orphans=delete_orphans or None, dry_run=dry_run))
         except Exception as e:
             return f"❌ Chyba pri synchronizácii: {str(e)}"
+        return self._format_sync_report(report)
+
+    def _format_sync_report(self, report: Dict[str, Any]) -> str:
+        """Textová správa o synchronizácii"""
+        prefix = "🧪 Skúšobná synchronizácia" if report['dry_run'] else "✅ Synchronizované"
+        result = f"{prefix}: {report['source']} → {report['target']}\n"
+        result += (f"📤 Prenesené: {report['copied']} súborov ({self._format_size(report['bytes_transferred'])})\n"
+                   f"⏭️  Preskočené: {report['skipped']} súborov ({self._format_size(report['bytes_skipped'])})")
+        if report['hashed']:
+            result += f", porovnaných hashom: {report['hashed']}"
+        if report['deleted']:
+            result += f"\n🗑️  Zmazané v cieli: {report['deleted']}"
+        result += f"\n⏱️  {report['duration_s']:.2f} s"
+        if report['errors']:
+            result += f"\n⚠️  Chyby ({len(report['errors'])}):\n" + "\n".join(f"  {error}" for error in report['errors'][:5])
+        return result
+
+    # VZDIALENÉ OPERÁCIE (SFTP)
+    async def list_remote(self, command: str) -> str:
+        """Výpis zložky na zariadení - vzdialený zoznam moj_pc:/cesta"""
+        remote = self._extract_remote_path(command)
+        if not remote:
+            return "❌ Zadajte zariadenie a cestu: 'vzdialený zoznam názov:/cesta'"
+        device, remote_path, _, _ = remote
+        try:
+            items = await asyncio.get_running_loop().run_in_executor(
+                None, self.remote_files.listdir, device, remote_path)
+        except Exception as e:
+            return f"❌ Chyba pri čítaní zložky na zariadení: {str(e)}"
+        
+        result = f"📁 {device}:{remote_path}\n"
+        for item in items[:100]:
+            if item['is_dir']:
+                result += f"📁 {item['name']}/\n"
+            else:
+                result += f"📄 {item['name']} ({self._format_size(item['size'])})\n"
+        if len(items) > 100:
+            result += f"... a ďalších {len(items) - 100} položiek"
+        return result.rstrip("\n")
+
+    async def transfer_to_device(self, command: str) -> str:
+        """Nahrá súbor/zložku - nahraj na zariadenie /lokálna/cesta moj_pc:/cieľ"""
+        remote = self._extract_remote_path(command)
+        if not remote or not remote[2]:
+            return "❌ Zadajte lokálnu cestu a cieľ na zariadení (názov:/cesta)"
+        device, remote_path, local_paths, _ = remote
+        if not os.path.exists(local_paths[0]):
+            return f"❌ Súbor neexistuje: {local_paths[0]}"
+        return await self._remote_operation(lambda: self.remote_files.upload(device, local_paths[0], remote_path))
+
+    async def transfer_from_device(self, command: str) -> str:
+        """Stiahne súbor/zložku - stiahni zo zariadenia moj_pc:/cesta /lokálny/cieľ"""
+        remote = self._extract_remote_path(command)
+        if not remote:
+            return "❌ Zadajte cestu na zariadení (názov:/cesta) a lokálny cieľ"
+        device, remote_path, local_paths, _ = remote
+        return await self._remote_operation(
+            lambda: self.remote_files.download(device, remote_path, local_paths[0] if local_paths else "."))
+
+    async def _remote_operation(self, operation) -> str:
+        """Spustí prenos mimo event loopu a sformátuje správu"""
+        try:
+            report = await asyncio.get_running_loop().run_in_executor(None, operation)
+        except Exception as e:
+            return f"❌ Chyba pri prenose: {str(e)}"
+        
+        prefix = "✅ Nahrané" if report['direction'] == "upload" else "✅ Stiahnuté"
+        if report['errors']:
+            prefix = "⚠️  Prenos s chybami"
+        result = f"{prefix}: {report['local']} ↔ {report['remote']}\n"
+        result += (f"📤 Prenesené: {report['copied']} súborov ({self._format_size(report['bytes_transferred'])})\n"
+                   f"⏭️  Preskočené: {report['skipped']} súborov ({self._format_size(report['bytes_skipped'])})")
+        if report['resumed']:
+            result += f"\n🔁 Obnovené prerušené prenosy: {report['resumed']}"
+        result += f"\n⏱️  {report['duration_s']:.2f} s"
+        if report['errors']:
+            result += "\n" + "\n".join(f"  {error}" for error in report['errors'][:5])
+        return result
+
+    def _extract_remote_path(self, command: str):
+        """(zariadenie, vzdialená cesta, lokálne cesty, zariadenie je prvé) z 'názov:/cesta' v príkaze"""
+        for match in re.finditer(r'(?<![\w:/\\])([\w.-]{2,}):(?:["\']([^"\']*)["\']|(\S*))', command):
+            device = match.group(1)
+            if device not in self.connected_devices and not self.remote_files.has_device(device):
+                continue
+            remote_path = (match.group(2) if match.group(2) is not None else match.group(3)) or "."
+            rest = command[:match.start()] + " " + command[match.end():]
+            local_paths = [path.strip() for path in self._extract_path_pair(rest) if path.strip()]
+            if not local_paths:
+                local_paths = [path.strip() for path in self.extract_paths(rest) if path.strip()]
+            local_first = bool(local_paths) and 0 <= command.find(local_paths[0]) < match.start()
+            return device, remote_path, local_paths, not local_first
+        return None
+
+    def _extract_path_pair(self, command: str) -> List[str]:
+        """Dve cesty z príkazu - v úvodzovkách, inak oddelené medzerou"""
+        paths = re.findall(r'["\']([^"\']+)["\']', command)
+        if len(paths) >= 2:
+            return paths
+        paths = self.extract_paths(command)
+        if len(paths) >= 2:
+            return paths
+        return [token for token in command.split() if "/" in token or "\\" in token]
 
     # POMOCNÉ METÓDY
     def extract_content(self, command: str) -> str:
@@ -469,7 +731,7 @@ class FileManager:
         except Exception as e:
             return f"❌ Chyba pri otváraní File Manageru: {str(e)}"
 
-    # Zvyšok pôvodných metód (delete_directory, rename_item, move_item, copy_item, delete_file, unite_folders, search_in_files, get_folder_size)
+    # Zvyšok pôvodných metód (delete_directory, rename_item, move_item, copy_item, delete_file, unite_folders)
     # ... (zachovať pôvodnú funkcionalitu)
 
 # UI PRE FILE MANAGER
@@ -511,6 +773,20 @@ class FileManagerUI:
         self.search_button = ctk.CTkButton(search_frame, text="Hľadať", command=self.search_files)
         self.search_button.pack(side="left", padx=5)
         
+        # Využitie disku - prechod do podzložiek
+        usage_frame = ctk.CTkFrame(main_frame)
+        usage_frame.pack(fill="x", pady=(0, 10))
+        
+        self.usage_button = ctk.CTkButton(usage_frame, text="💾 Využitie disku", command=self.show_disk_usage)
+        self.usage_button.pack(side="left", padx=10)
+        self.usage_up_button = ctk.CTkButton(usage_frame, text="⬆️ Vyššie", width=80, command=self.disk_usage_up)
+        self.usage_up_button.pack(side="left", padx=5)
+        ctk.CTkLabel(usage_frame, text="Podzložka:").pack(side="left", padx=(10, 5))
+        self.usage_children = ctk.CTkOptionMenu(usage_frame, values=["-"], width=300, command=self.disk_usage_open)
+        self.usage_children.pack(side="left", padx=5)
+        self.usage_path = os.path.abspath(".")
+        self.usage_child_paths = {}
+        
         # Zobrazenie súborov
         self.files_text = ctk.CTkTextbox(main_frame, wrap="none")
         self.files_text.pack(fill="both", expand=True)
@@ -521,10 +797,60 @@ class FileManagerUI:
     def search_files(self):
         """Spustí vyhľadávanie"""
         search_term = self.search_entry.get()
-        if search_term:
-            result = self.file_manager.advanced_file_search(f'nájdi súbor "{search_term}"')
-            self.files_text.delete("1.0", "end")
-            self.files_text.insert("1.0", result)
+        if not search_term:
+            return
+        
+        def search():
+            try:
+                result = asyncio.run(self.file_manager.advanced_file_search(f'nájdi súbor "{search_term}"'))
+            except Exception as e:
+                result = f"❌ Chyba pri vyhľadávaní: {str(e)}"
+            self.window.after(0, lambda: self._show_search_result(result))
+        
+        threading.Thread(target=search, daemon=True).start()
+    
+    def _show_search_result(self, result):
+        self.files_text.delete("1.0", "end")
+        self.files_text.insert("1.0", result)
+    
+    def show_disk_usage(self, path=None):
+        """Zobrazí využitie disku zložky - skenovanie beží mimo vlákna UI"""
+        self.usage_path = os.path.abspath(path or self.usage_path)
+        self.usage_button.configure(state="disabled")
+        self.files_text.delete("1.0", "end")
+        self.files_text.insert("1.0", f"⏳ Počítam veľkosti v {self.usage_path}...")
+        
+        def scan():
+            try:
+                report = self.file_manager.disk_usage_report(self.usage_path)
+                children = self.file_manager.disk_usage.largest_dirs(self.usage_path, 50)
+            except Exception as e:
+                report, children = f"❌ Chyba pri zisťovaní veľkosti: {str(e)}", []
+            self.window.after(0, lambda: self._show_disk_usage_result(report, children))
+        
+        threading.Thread(target=scan, daemon=True).start()
+    
+    def _show_disk_usage_result(self, report, children):
+        self.usage_button.configure(state="normal")
+        self.files_text.delete("1.0", "end")
+        self.files_text.insert("1.0", report)
+        self.usage_child_paths = {
+            f"{os.path.basename(child.path)}/ ({self.file_manager._format_size(child.total_size)})": child.path
+            for child in children
+        }
+        values = list(self.usage_child_paths) or ["-"]
+        self.usage_children.configure(values=values)
+        self.usage_children.set(values[0] if self.usage_child_paths else "-")
+    
+    def disk_usage_open(self, choice):
+        """Prejde do vybranej podzložky (z cache sa zobrazí hneď)"""
+        path = self.usage_child_paths.get(choice)
+        if path:
+            self.show_disk_usage(path)
+    
+    def disk_usage_up(self):
+        """Prejde do nadradenej zložky"""
+        self.show_disk_usage(os.path.dirname(self.usage_path))
     
     def refresh_devices(self):
         """Obnoví zoznam zariadení"""
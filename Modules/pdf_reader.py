@@ -1,6 +1,9 @@
 import os
 import asyncio
 
+# Parsovanie PDF (PyPDF2) zaťaží CPU - v samostatnom procese
+MODULE_HEAVY = True
+
 class PdfReader:
     def __init__(self):
         self.supported_commands = [
@@ -1,15 +1,28 @@
+import asyncio
+import concurrent.futures
 import ollama
 from typing import Dict, Any, List, Callable
 import importlib
 import os
 import time
 import importlib.util  # ✅ PRIDANÉ - chýbajúci import
+from collections import deque
 
-try:
-    from modules.gmail_manager import GmailManager
-except ImportError:
-    print("⚠️  GmailManager nie je dostupný")
-    GmailManager = None  # ✅ PRIDANÉ - definovať ako None pri chybe
+from .command_router import CommandRouter
+from .event_loop import AssistantEventLoop
+from .response_cache import ResponseCache
+from .module_manifest import ModuleManifest, LazyModule
+from .module_watcher import ModuleWatcher
+from .process_pool import ModuleProcessPool
+from .conversation_memory import ConversationMemory
+from .scheduler import RequestScheduler, SERIAL_SOURCES
+from .intent_router import IntentRouter
+from .semantic_router import SemanticRouter
+from .long_term_memory import LongTermMemory
+from .ollama_pool import OllamaPool
+from .tracing import Tracer
+from .metrics import MetricsRegistry
+from plugins.base_plugins import as_plugin, render_result, StreamResult
 
 try:
     from .voice_engine import VoiceEngine  # ✅ PRIDANÉ try-except
@@ -17,38 +30,123 @@ except ImportError:
     print("⚠️  VoiceEngine nie je dostupný")
     VoiceEngine = None
 
+def response_field(response, name, default=None):
+    """Prečíta pole z odpovede Ollama (dict v starších verziách, model v novších)"""
+    try:
+        value = response[name]
+    except (KeyError, TypeError):
+        value = getattr(response, name, default)
+    return default if value is None else value
+
+SYSTEM_PROMPT = """Si Aura, osobný AI asistent. Odpovedaj prirodzene a stručne v jazyku používateľa.
+Ber do úvahy predchádzajúcu konverzáciu - ak sa používateľ pýta na niečo, čo už bolo spomenuté, použij históriu."""
+
 class AIAssistant:
     def __init__(self, config_manager):
         self.config_manager = config_manager
-        self.model_name = "qwen3"
+        self.model_name = self.config_manager.get("ai", "model_name", "qwen3")
         self.modules = {}
+        self.modules_version = 0  # zvyšuje sa pri každej zmene `modules` (sémantický index)
+        self.module_files = {}
+        self.router = CommandRouter()
+        self._plugins = {}
+        self._plugin_semaphores = {}
+        self._plugin_warmups = {}
+        self._module_listeners = []
+        
+        # Jeden dlhožijúci event loop a Ollama klient pre všetky požiadavky
+        self.event_loop = AssistantEventLoop()
+        self._ollama_client = None
+        self.event_loop.add_shutdown_callback(self._shutdown_plugins)
+        self.event_loop.add_shutdown_callback(self._close_ollama_client)
+        
+        # Nemenný snapshot nastavení (bez čítania súboru); zmeny prídu cez subscribe
+        settings = self.config_manager.snapshot
+        config_dir = getattr(self.config_manager, 'config_dir', 'config')
+        
+        # Trasovanie spracovania príkazov (spany do JSONL, zapínateľné za behu)
+        self.tracer = Tracer.from_settings(settings, config_dir)
+        
+        # Metriky výkonu (počítadlá a histogramy latencie pre dashboard) - vždy zapnuté
+        self.metrics = MetricsRegistry()
+        
+        # Prioritná fronta požiadaviek s obmedzeným počtom súbežných spracovaní
+        self.scheduler = RequestScheduler.from_settings(self.event_loop, settings)
+        
+        # Cache odpovedí modelu (pamäť + SQLite)
+        self.cache_settings = settings.get("cache", {})
+        self.response_cache = ResponseCache.from_settings(settings) if self.cache_settings.get("enabled", True) else None
+        
+        # Sémantické smerovanie parafráz na moduly (embeddingy fráz modulov)
+        self.semantic_router = SemanticRouter.from_settings(settings, config_dir)
+        
+        # Voliteľný malý model na rozpoznanie zámeru (rýchla cesta pred veľkým modelom)
+        self.intent_router = IntentRouter.from_settings(settings)
         
         # ✅ OPRAVENÉ: Bezpečná inicializácia VoiceEngine
         self.voice_engine = VoiceEngine() if VoiceEngine else None
         
-        # ✅ OPRAVENÉ: Bezpečná inicializácia GmailManager
-        self.gmail_manager = None
-        if GmailManager:
-            try:
-                self.gmail_manager = GmailManager(config_manager)
-            except Exception as e:
-                print(f"⚠️  Nepodarilo sa inicializovať GmailManager: {e}")
-        
-        # Konverzačný stav
+        # Konverzačný stav (história a entity sú v ConversationMemory)
+        self.memory = ConversationMemory.from_settings(settings)
         self.conversation_context = {
-            'history': [],
             'current_topic': None,
-            'mentioned_entities': set(),
             'user_preferences': {},
             'last_intent': None
         }
         
+        # Dlhodobá pamäť minulých relácií - načíta sa a indexuje na pozadí
+        self.long_term_memory = LongTermMemory.from_settings(settings, config_dir)
+        if self.long_term_memory is not None:
+            self.event_loop.submit(self._start_long_term_memory())
+        
+        # Meranie prompt-eval (overenie znovupoužitia KV cache v Ollama)
+        self.measure_prompt_eval = settings.get("ai", {}).get("measure_prompt_eval", False)
+        self.prompt_metrics = deque(maxlen=100)
+        self._last_messages = []
+        
+        # Stav modelu: cold -> warming -> ready / offline / error
+        self.model_status = "cold"
+        
+        # Zmeny nastavení za behu (uloženie v UI alebo úprava settings.json)
+        self._unsubscribe_settings = self.config_manager.subscribe(
+            self._on_settings_changed, sections=("ai", "tracing"))
+        
+        # Ťažké moduly (MODULE_HEAVY alebo zoznam v nastaveniach) bežia v teplom pooli procesov
+        pool_settings = settings.get("process_pool", {})
+        self.process_pool_enabled = pool_settings.get("enabled", True)
+        self.heavy_module_names = set(pool_settings.get("modules", []))
+        self.process_pool = ModuleProcessPool.from_settings(settings, config_dir)
+        
         self.load_modules()
+        self._preload_heavy_modules()
+        self.event_loop.submit(self._warm_up_plugins())
+        
+        # Hot reload - zmenené súbory modulov sa načítajú a vymenia za behu
+        self.module_watcher = ModuleWatcher.from_settings(self, settings)
+        self.module_watcher.start()
         print("✅ AIAssistant inicializovaný s modelom:", self.model_name)
         
+    @property
+    def gmail_manager(self):
+        """GmailManager (Google API) sa importuje až pri prvom použití"""
+        module = self.modules.get("gmail_manager")
+        if isinstance(module, LazyModule):
+            try:
+                return module.load()
+            except Exception as e:
+                print(f"⚠️  Nepodarilo sa inicializovať GmailManager: {e}")
+                return None
+        return module
+    
     def load_modules(self):
-        """Načítaj všetky dostupné moduly"""
+        """Načítaj všetky dostupné moduly.
+        
+        Moduly so staticky zistiteľnými príkazmi sa zaregistrujú len podľa
+        manifestu a importujú sa až pri prvom príkaze, ktorý im patrí.
+        """
         modules_dir = "modules"
+        config_dir = getattr(self.config_manager, 'config_dir', 'config')
+        self.module_manifest = ModuleManifest(os.path.join(config_dir, "modules_manifest.json"))
         if not os.path.exists(modules_dir):
             print("❌ Priečinok modules neexistuje - vytváram...")
             os.makedirs(modules_dir, exist_ok=True)
@@ -56,115 +154,773 @@ class AIAssistant:
             
         print(f"🔍 Hľadám moduly v {modules_dir}...")
         
-        for filename in os.listdir(modules_dir):
+        for filename in sorted(os.listdir(modules_dir)):
             if filename.endswith(".py") and filename != "__init__.py":
                 module_name = filename[:-3]
-                try:
-                    print(f"🔧 Načítavam modul: {module_name}")
-                    
-                    # ✅ OPRAVENÉ: Správna cesta k modulu
-                    module_path = os.path.join(modules_dir, filename)
-                    spec = importlib.util.spec_from_file_location(module_name, module_path)
-                    if spec is None:
-                        print(f"❌ Nepodarilo sa načítať špecifikáciu pre {module_name}")
-                        continue
-                        
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    # Nájdeme hlavnú triedu
-                    class_name = module_name.title().replace('_', '')
-                    if hasattr(module, class_name):
-                        module_class = getattr(module, class_name)
-                        # ✅ OPRAVENÉ: Pokúsme sa inicializovať s config_manager
-                        try:
-                            module_instance = module_class(self.config_manager)
-                            self.modules[module_name] = module_instance
-                            print(f"✅ Načítaný modul: {module_name}")
-                        except TypeError:
-                            # Ak neakceptuje config_manager, skúsme bez neho
-                            module_instance = module_class()
-                            self.modules[module_name] = module_instance
-                            print(f"✅ Načítaný modul: {module_name} (bez config_manager)")
-                    else:
-                        print(f"⚠️  Modul {module_name} nemá triedu {class_name}")
-                        
-                except Exception as e:
-                    print(f"❌ Chyba pri načítaní modulu {module_name}: {e}")
+                # ✅ OPRAVENÉ: Správna cesta k modulu
+                module_path = os.path.join(modules_dir, filename)
+                module_instance, module_file = self._load_module_file(module_name, module_path)
+                if module_instance is not None:
+                    self.modules[module_name] = module_instance
+                    self.module_files[module_name] = module_file
+        self.modules_version += 1
+        
+        self.module_manifest.save()
+        self.router.sync(self.modules)
+        self.router.rebuild()
+        stats = self.router.get_stats()
+        print(f"🧭 Router príkazov: {stats['modules']} modulov, {stats['phrases']} fráz")
+    
+    def _load_module_file(self, module_name: str, module_path: str, eager: bool = False):
+        """Vráti (LazyModule alebo importovaná inštancia, vlastnosti súboru modulu).
+
+        Vlastnosti sa do `module_files` nezapisujú - urobí to volajúci až po
+        úspešnom načítaní, aby pri chybe ďalej platili tie starej verzie.
+        """
+        entry = self.module_manifest.get(module_path) or {}
+        class_name = entry.get('class_name') or module_name.title().replace('_', '')
+        # Vlastnosti pre plánovanie známe bez importu (manifest), po importe ich spresní inštancia
+        module_file = {
+            'path': module_path,
+            'class_name': class_name,
+            'heavy': bool(entry.get('heavy')),
+            'max_concurrency': entry.get('max_concurrency', 0),
+            'warmup_on_start': bool(entry.get('warmup_on_start'))
+        }
+        if not eager and entry.get('found') and entry.get('commands'):
+            print(f"📋 Zaregistrovaný modul: {module_name} ({len(entry['commands'])} príkazov, načíta sa pri použití)")
+            return LazyModule(module_name, module_path, entry, self._import_module), module_file
+        
+        # Príkazy nie sú známe bez importu (alebo je import vyžiadaný) - načítaj hneď
+        module_instance = self._import_module(module_name, module_path, class_name)
+        if module_instance is not None:
+            plugin = as_plugin(module_instance, module_name)
+            module_file.update(
+                heavy=module_file['heavy'] or plugin.expected_cost == 'cpu',
+                max_concurrency=plugin.max_concurrency,
+                warmup_on_start=plugin.warmup_on_start
+            )
+        return module_instance, module_file
     
-    async def process_command(self, command: str) -> str:
-        """Spracuj príkaz od používateľa s využitím kontextu"""
+    def _import_module(self, module_name: str, module_path: str, class_name: str):
+        """Importuje súbor modulu a vytvorí inštanciu jeho hlavnej triedy"""
         try:
-            print(f"🔍 Spracovávam príkaz: {command}")
-            
-            # Spracuj hlasové hotkeys
-            if command.startswith("🔧 HOTKEY:"):
-                return await self.process_hotkey(command)
+            print(f"🔧 Načítavam modul: {module_name}")
             
-            # Získaj kontextový súhrn
-            context_summary = self.get_context_summary()
-            
-            # Najprv skús nájsť špecifický modul pre príkaz
-            for module_name, module_instance in self.modules.items():
-                if hasattr(module_instance, 'can_handle') and callable(getattr(module_instance, 'can_handle')):
-                    if module_instance.can_handle(command):
-                        print(f"🔧 Používam modul: {module_name}")
-                        if hasattr(module_instance, 'handle') and callable(getattr(module_instance, 'handle')):
-                            response = await module_instance.handle(command)
-                            self.update_conversation_context(command, response, f"module_{module_name}")
-                            return response
+            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            if spec is None:
+                print(f"❌ Nepodarilo sa načítať špecifikáciu pre {module_name}")
+                return None
+                
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
             
-            # Ak žiaden modul nevie spracovať, použi AI s kontextom
-            print("🤖 Používam AI model...")
-            response = await self._ask_ai_with_context(command, context_summary)
-            self.update_conversation_context(command, response, "ai_general")
-            return response
+            # Nájdeme hlavnú triedu
+            if not hasattr(module, class_name):
+                print(f"⚠️  Modul {module_name} nemá triedu {class_name}")
+                return None
             
+            module_class = getattr(module, class_name)
+            # ✅ OPRAVENÉ: Pokúsme sa inicializovať s config_manager
+            try:
+                module_instance = module_class(self.config_manager)
+                print(f"✅ Načítaný modul: {module_name}")
+            except TypeError:
+                # Ak neakceptuje config_manager, skúsme bez neho
+                module_instance = module_class()
+                print(f"✅ Načítaný modul: {module_name} (bez config_manager)")
+            return module_instance
+                
         except Exception as e:
-            error_msg = f"❌ Chyba pri spracovaní príkazu: {str(e)}"
-            self.update_conversation_context(command, error_msg, "error")
-            return error_msg
+            print(f"❌ Chyba pri načítaní modulu {module_name}: {e}")
+            return None
     
-    async def _ask_ai_with_context(self, prompt: str, context_summary: str) -> str:
-        """Komunikácia s Ollama modelom s kontextom"""
-        try:
-            # Vytvor prompt s kontextom
-            if context_summary:
-                contextual_prompt = f"""Predchádzajúca konverzácia:
-{context_summary}
+    def _call_in_loop(self, function: Callable, *args):
+        """Zavolá funkciu vo vlákne event loopu a počká na výsledok.
 
-Aktuálna otázka: {prompt}
+        Smerovanie (router fráz, sémantický podpis modulov) číta `modules`
+        v event loope - zmeny z UI alebo reload vlákna preto idú cezeň.
+        """
+        loop = self.event_loop
+        if not loop.is_running() or loop.in_loop_thread():
+            return function(*args)
+        future = concurrent.futures.Future()
 
-Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používateľ pýta na niečo, čo už bolo spomenuté, použij históriu."""
-            else:
-                contextual_prompt = prompt
+        def run():
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        loop.call_soon(run)
+        return future.result(5.0)
+    
+    def register_module(self, module_name: str, module_instance, module_file: Dict[str, Any] = None):
+        """Pridá alebo nahradí modul (s vlastnosťami súboru z `_load_module_file`) a aktualizuje router"""
+        self._call_in_loop(self._register_module, module_name, module_instance, module_file)
+    
+    def _register_module(self, module_name: str, module_instance, module_file: Dict[str, Any] = None):
+        old = self.modules.get(module_name)
+        self.modules[module_name] = module_instance
+        if module_file is not None:
+            self.module_files[module_name] = module_file
+        self.modules_version += 1
+        self.router.add_module(module_name, module_instance)
+        if old is not None and old is not module_instance:
+            self._retire_plugin(module_name)
+    
+    def unregister_module(self, module_name: str) -> bool:
+        """Odstráni modul a aktualizuje router - vráti True, ak bol zaregistrovaný"""
+        return self._call_in_loop(self._unregister_module, module_name)
+    
+    def _unregister_module(self, module_name: str) -> bool:
+        old = self.modules.pop(module_name, None)
+        self.modules_version += 1
+        self.module_files.pop(module_name, None)
+        self.router.remove_module(module_name)
+        if old is not None:
+            self._retire_plugin(module_name)
+        return old is not None
+    
+    def reload_module(self, module_name: str):
+        """Znovu načíta modul zo súboru na pozadí - vráti Future s výsledkom"""
+        return self.module_watcher.reload_module(module_name)
+    
+    def remove_module(self, module_name: str, delete_file: bool = False) -> bool:
+        """Odregistruje modul (voliteľne zmaže aj jeho súbor) - vráti True, ak existoval"""
+        if not self.unregister_module(module_name):
+            return False
+        if delete_file:
+            module_file = os.path.join("modules", f"{module_name}.py")
+            try:
+                os.remove(module_file)
+            except OSError as e:
+                print(f"⚠️  Súbor modulu {module_file} sa nepodarilo zmazať: {e}")
+        self._notify_module_change(module_name, "removed")
+        return True
+    
+    def add_module_listener(self, callback: Callable[[str, str], None]):
+        """Callback(názov_modulu, 'loaded'|'removed') pri zmene modulov za behu (volá sa z vlákna na pozadí)"""
+        self._module_listeners.append(callback)
+    
+    def remove_module_listener(self, callback: Callable[[str, str], None]):
+        if callback in self._module_listeners:
+            self._module_listeners.remove(callback)
+    
+    def _notify_module_change(self, module_name: str, action: str):
+        for callback in list(self._module_listeners):
+            try:
+                callback(module_name, action)
+            except Exception as e:
+                print(f"⚠️  Chyba v callbacku zmeny modulu: {e}")
+    
+    def get_module_reload_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky hot reloadu modulov"""
+        return self.module_watcher.get_stats()
+    
+    def is_heavy_module(self, module_name: str) -> bool:
+        """Beží modul v samostatnom procese? (MODULE_HEAVY v súbore alebo process_pool.modules)"""
+        if not self.process_pool_enabled or module_name not in self.module_files:
+            return False
+        return module_name in self.heavy_module_names or self.module_files[module_name]['heavy']
+    
+    def _preload_heavy_modules(self):
+        """Spustí pool a načíta v ňom ťažké moduly, aby prvý príkaz nečakal na import"""
+        for module_name, module_file in self.module_files.items():
+            if self.is_heavy_module(module_name):
+                self.process_pool.preload(module_name, module_file['path'], module_file['class_name'])
+    
+    async def _handle_module(self, module_name: str, module_instance, command: str):
+        """Zavolá `handle` modulu - ťažký modul vo worker procese, ostatné v event loope.
+        
+        Pred prvým príkazom sa plugin zahreje a súbežné volania sa obmedzia
+        na jeho `max_concurrency`. Vráti reťazec alebo štruktúrovaný výsledok.
+        """
+        if self.is_heavy_module(module_name):
+            module_file = self.module_files[module_name]
+            return await self.process_pool.call(module_name, module_file['path'], module_file['class_name'], command)
+        
+        semaphore = self._plugin_semaphore(module_name)
+        if semaphore is None:
+            return await self._call_plugin(module_name, module_instance, command)
+        async with semaphore:
+            return await self._call_plugin(module_name, module_instance, command)
+    
+    async def _call_plugin(self, module_name: str, module_instance, command: str):
+        await asyncio.shield(self._ensure_plugin_warm(module_name, module_instance))
+        return await module_instance.handle(command)
+    
+    def _ensure_plugin_warm(self, module_name: str, module_instance) -> asyncio.Future:
+        """Jeden warm-up na plugin - súbežné prvé príkazy čakajú na ten istý"""
+        warmup = self._plugin_warmups.get(module_name)
+        if warmup is None:
+            warmup = asyncio.ensure_future(self._warm_up_plugin(module_name, module_instance))
+            self._plugin_warmups[module_name] = warmup
+        return warmup
+    
+    def _plugin_semaphore(self, module_name: str):
+        """Semafor pre plugin s obmedzenou súbežnosťou (None = bez obmedzenia)"""
+        limit = self.module_files.get(module_name, {}).get('max_concurrency') or 0
+        if limit <= 0:
+            return None
+        semaphore = self._plugin_semaphores.get(module_name)
+        if semaphore is None:
+            semaphore = self._plugin_semaphores[module_name] = asyncio.Semaphore(limit)
+        return semaphore
+    
+    def _plugin_for(self, module_name: str, module_instance=None):
+        """BasePlugin pre načítaný modul (starší modul v adaptéri); None pre ešte nenačítaný lenivý"""
+        if module_instance is None:
+            module_instance = self.modules.get(module_name)
+        if isinstance(module_instance, LazyModule):
+            if not module_instance.loaded:
+                return None
+            module_instance = module_instance.load()
+        if module_instance is None:
+            return None
+        cached = self._plugins.get(module_name)
+        if cached is not None and cached[0] is module_instance:
+            return cached[1]
+        plugin = as_plugin(module_instance, module_name)
+        self._plugins[module_name] = (module_instance, plugin)
+        return plugin
+    
+    async def _warm_up_plugin(self, module_name: str, module_instance, timeout: float = 30.0):
+        """Zahreje plugin (lenivý modul najprv importuje) - chyba warm-upu nebráni použitiu"""
+        try:
+            if isinstance(module_instance, LazyModule) and not module_instance.loaded:
+                await asyncio.get_running_loop().run_in_executor(None, module_instance.load)
+        except Exception:
+            return  # chybu importu ohlási až samotné spracovanie príkazu
+        plugin = self._plugin_for(module_name, module_instance)
+        if plugin is None or not plugin.has_warmup:
+            return
+        try:
+            with self.tracer.span("plugin.warmup", module=module_name), \
+                    self.metrics.timer("plugin_warmup", module=module_name):
+                await asyncio.wait_for(plugin.warmup(), timeout)
+            print(f"🔥 Plugin {module_name} pripravený")
+        except Exception as e:
+            print(f"⚠️  Warm-up pluginu {module_name} zlyhal: {e}")
+    
+    async def _warm_up_plugins(self):
+        """Po štarte zahreje len pluginy s `warmup_on_start` (ostatné až pred prvým príkazom)"""
+        names = [name for name, module_file in self.module_files.items()
+                 if module_file.get('warmup_on_start') and name in self.modules and not self.is_heavy_module(name)]
+        await asyncio.gather(*(self._ensure_plugin_warm(name, self.modules[name]) for name in names))
+    
+    def _retire_plugin(self, module_name: str):
+        """Vymenený/odstránený modul: zabudni warm-up a limity, zavolaj jeho `shutdown`"""
+        self._plugin_warmups.pop(module_name, None)
+        self._plugin_semaphores.pop(module_name, None)
+        # Plugin v cache bol použitý (zahriaty) - nepoužitý lenivý modul netreba ani načítať
+        cached = self._plugins.pop(module_name, None)
+        if cached is not None and self.event_loop.is_running():
+            self.event_loop.submit(self._shutdown_plugin(module_name, cached[1]))
+    
+    async def _shutdown_plugin(self, module_name: str, plugin, timeout: float = 5.0):
+        try:
+            await asyncio.wait_for(plugin.shutdown(), timeout)
+        except Exception as e:
+            print(f"⚠️  Ukončenie pluginu {module_name} zlyhalo: {e}")
+    
+    async def _shutdown_plugins(self):
+        """Pri vypnutí zavolá `shutdown` všetkých použitých pluginov"""
+        plugins = [(name, plugin) for name, (_, plugin) in list(self._plugins.items())]
+        await asyncio.gather(*(self._shutdown_plugin(name, plugin) for name, plugin in plugins))
+    
+    def get_plugin_health(self) -> Dict[str, Dict[str, Any]]:
+        """Stav pluginov - `health()` načítaných, ostatné len podľa manifestu"""
+        report = {}
+        for module_name in list(self.modules):
+            if self.is_heavy_module(module_name):
+                report[module_name] = {'status': 'process'}
+                continue
+            plugin = self._plugin_for(module_name)
+            if plugin is None:
+                report[module_name] = {'status': 'not_loaded'}
+                continue
+            try:
+                report[module_name] = dict(plugin.health())
+            except Exception as e:
+                report[module_name] = {'status': 'error', 'error': str(e)}
+            warmup = self._plugin_warmups.get(module_name)
+            report[module_name]['warmed'] = warmup is not None and warmup.done()
+        return report
+    
+    def get_process_pool_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky poolu procesov ťažkých modulov"""
+        stats = self.process_pool.get_stats()
+        stats['enabled'] = self.process_pool_enabled
+        stats['modules'] = sorted(name for name in self.module_files if self.is_heavy_module(name))
+        return stats
+    
+    def find_module_for_command(self, command: str):
+        """Nájde modul pre príkaz jedným prechodom cez router"""
+        module_name = self.router.match(command)
+        if module_name is None:
+            return None, None
+        return module_name, self.modules.get(module_name)
+    
+    async def process_command(self, command: str, remember: bool = True) -> str:
+        """Spracuj príkaz od používateľa s využitím kontextu
+        
+        Pri remember=False (napr. rýchle príkazy z dashboardu) sa výmena
+        neuloží do konverzačnej pamäte.
+        """
+        with self.tracer.span("command", command=command[:80], stream=False) as span:
+            try:
+                print(f"🔍 Spracovávam príkaz: {command}")
+                
+                # Spracuj hlasové hotkeys
+                if command.startswith("🔧 HOTKEY:"):
+                    span.set(intent="hotkey")
+                    self.metrics.inc("commands_total", route="hotkey")
+                    return await self.process_hotkey(command)
+                
+                # Najprv skús modul alebo rýchlu odpoveď malého modelu
+                fast = await self._resolve_fast_path(command)
+                if fast is not None:
+                    response, intent = fast
+                    response = await render_result(response)
+                    span.set(intent=intent)
+                    self.metrics.inc("commands_total", route=intent)
+                    if remember:
+                        self.update_conversation_context(command, response, intent)
+                    return response
+                
+                # Ak žiaden modul nevie spracovať, použi AI s kontextom
+                print("🤖 Používam AI model...")
+                span.set(intent="ai_general")
+                self.metrics.inc("commands_total", route="ai_general")
+                response = await self._ask_ai_with_context(command)
+                if remember:
+                    self.update_conversation_context(command, response, "ai_general")
+                return response
+                
+            except Exception as e:
+                error_msg = f"❌ Chyba pri spracovaní príkazu: {str(e)}"
+                span.set(intent="error", error=type(e).__name__)
+                self.metrics.inc("command_errors", route="error")
+                if remember:
+                    self.update_conversation_context(command, error_msg, "error")
+                return error_msg
+    
+    async def process_command_stream(self, command: str, remember: bool = True):
+        """Streamovacia verzia process_command - async generátor častí odpovede.
+        
+        Odpovede modulov a hotkeys prídu ako jedna časť, odpoveď AI modelu
+        po tokenoch hneď ako ich Ollama vygeneruje.
+        """
+        with self.tracer.span("command", command=command[:80], stream=True) as span:
+            try:
+                print(f"🔍 Spracovávam príkaz (stream): {command}")
+                
+                if command.startswith("🔧 HOTKEY:"):
+                    span.set(intent="hotkey")
+                    self.metrics.inc("commands_total", route="hotkey")
+                    yield await self.process_hotkey(command)
+                    return
+                
+                fast = await self._resolve_fast_path(command)
+                if fast is not None:
+                    response, intent = fast
+                    span.set(intent=intent)
+                    self.metrics.inc("commands_total", route=intent)
+                    if isinstance(response, StreamResult):
+                        # Plugin odpovedá po častiach - posielaj ich hneď
+                        async for chunk in response:
+                            yield chunk
+                        response = await response.collect()
+                    else:
+                        response = await render_result(response)
+                        yield response
+                    if remember:
+                        self.update_conversation_context(command, response, intent)
+                    return
+                
+                print("🤖 Používam AI model (stream)...")
+                span.set(intent="ai_general")
+                self.metrics.inc("commands_total", route="ai_general")
+                parts = []
+                async for chunk in self._stream_ai_with_context(command):
+                    parts.append(chunk)
+                    yield chunk
+                if remember:
+                    self.update_conversation_context(command, "".join(parts), "ai_general")
+                
+            except Exception as e:
+                error_msg = f"❌ Chyba pri spracovaní príkazu: {str(e)}"
+                span.set(intent="error", error=type(e).__name__)
+                self.metrics.inc("command_errors", route="error")
+                if remember:
+                    self.update_conversation_context(command, error_msg, "error")
+                yield error_msg
+    
+    async def _resolve_fast_path(self, command: str):
+        """Spracuje príkaz bez veľkého modelu, ak sa dá - vráti (odpoveď, zámer) alebo None.
+        
+        1. router fráz priradí príkaz modulu,
+        2. sémantický router priradí parafrázu podľa podobnosti embeddingov,
+        3. inak malý intent model (ak je nastavený) vyberie modul alebo sám krátko odpovie.
+        """
+        with self.tracer.span("route.phrase") as span, self.metrics.timer("route", stage="phrase"):
+            module_name, module_instance = self.find_module_for_command(command)
+            span.set(module=module_name)
+        if module_instance is None and self.semantic_router is not None:
+            with self.tracer.span("route.semantic") as span, self.metrics.timer("route", stage="semantic"):
+                cache_hits = self.semantic_router.stats['query_cache_hits']
+                match = await self.semantic_router.match(self._get_ollama_client(), command, self.modules,
+                                                         self.modules_version)
+                self._count_cache_lookup("semantic", self.semantic_router.stats['query_cache_hits'] > cache_hits)
+                if match is not None:
+                    module_name, score = match
+                    module_instance = self.modules.get(module_name)
+                    span.set(module=module_name, score=round(score, 4))
+                    print(f"🧭 Sémantická zhoda: {module_name} ({score:.2f})")
+        if module_instance is None and self.intent_router is not None:
+            with self.tracer.span("route.intent", model=self.intent_router.model) as span, \
+                    self.metrics.timer("route", stage="intent"):
+                cache_hits = self.intent_router.stats['cache_hits']
+                decision = await self.intent_router.route(self._get_ollama_client(), command, self.modules)
+                self._count_cache_lookup("intent", self.intent_router.stats['cache_hits'] > cache_hits)
+                span.set(action=decision['action'], module=decision.get('module'))
+            if decision['action'] == 'answer':
+                print(f"⚡ Odpoveď intent modelu {self.intent_router.model}")
+                return decision['answer'], "ai_intent"
+            if decision['action'] == 'module':
+                module_name = decision['module']
+                module_instance = self.modules.get(module_name)
+                print(f"🎯 Intent model vybral modul: {module_name}")
+        
+        if module_instance is not None:
+            print(f"🔧 Používam modul: {module_name}")
+            if hasattr(module_instance, 'handle') and callable(getattr(module_instance, 'handle')):
+                with self.tracer.span("module.handle", module=module_name,
+                                      lazy_load=isinstance(module_instance, LazyModule) and not module_instance.loaded,
+                                      process=self.is_heavy_module(module_name)), \
+                        self.metrics.timer("module", module=module_name):
+                    return await self._handle_module(module_name, module_instance, command), f"module_{module_name}"
+        return None
+    
+    def get_semantic_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky sémantického smerovania"""
+        if self.semantic_router is None:
+            return {'enabled': False}
+        stats = self.semantic_router.get_stats()
+        stats['enabled'] = True
+        return stats
+    
+    def get_intent_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky rýchleho smerovania malým modelom"""
+        if self.intent_router is None:
+            return {'enabled': False}
+        stats = self.intent_router.get_stats()
+        stats['enabled'] = True
+        return stats
+    
+    def _get_ollama_client(self):
+        """Vráti zdieľaný pool Ollama serverov s rozhraním AsyncClient (vytvorí ho v loope)"""
+        if self._ollama_client is None:
+            settings = self.config_manager.snapshot
+            self._ollama_client = OllamaPool.from_settings(settings, lambda host: ollama.AsyncClient(host=host))
+            hosts = ", ".join(endpoint.host for endpoint in self._ollama_client.endpoints)
+            print(f"🌐 Ollama servery: {hosts}")
+        return self._ollama_client
+    
+    def get_ollama_stats(self) -> Dict[str, Any]:
+        """Vráti stav Ollama serverov (zdravie, záťaž, latencie, hedgovanie)"""
+        if self._ollama_client is None:
+            return {'endpoints': []}
+        return self._ollama_client.get_stats()
+    
+    def start_warm_up(self, on_status: Callable[[str, str], None] = None):
+        """Na pozadí overí Ollama server a prednačíta model - neblokuje UI, vráti Future"""
+        return self.event_loop.submit(self._warm_up(on_status))
+    
+    async def _warm_up(self, on_status: Callable[[str, str], None] = None) -> bool:
+        """Overí dostupnosť Ollama a načíta model do pamäte s keep_alive"""
+        def report(state: str, message: str):
+            self.model_status = state
+            print(f"🔥 Warm-up [{state}]: {message}")
+            if on_status:
+                try:
+                    on_status(state, message)
+                except Exception as e:
+                    print(f"⚠️  Chyba v callbacku warm-up: {e}")
+        
+        report("warming", f"Načítavam model {self.model_name}...")
+        client = self._get_ollama_client()
+        keep_alive = self.config_manager.get("ai", "keep_alive", "30m")
+        
+        try:
+            await client.list()
+        except Exception as e:
+            report("offline", f"Ollama server nie je dostupný: {e}")
+            return False
+        
+        try:
+            start = time.perf_counter()
+            # Prázdny prompt len načíta model, nič negeneruje
+            await client.generate(model=self.model_name, prompt="", keep_alive=keep_alive)
+            report("ready", f"Model {self.model_name} pripravený ({time.perf_counter() - start:.1f} s)")
+        except Exception as e:
+            report("error", f"Model {self.model_name} sa nepodarilo načítať: {e}")
+            return False
+        
+        if self.semantic_router is not None:
+            self.semantic_router.ensure_index(client, self.modules, self.modules_version)
+        
+        if self.intent_router is not None:
+            try:
+                await client.generate(model=self.intent_router.model, prompt="", keep_alive=keep_alive)
+                print(f"🔥 Intent model {self.intent_router.model} pripravený")
+            except Exception as e:
+                print(f"⚠️  Intent model {self.intent_router.model} sa nepodarilo načítať: {e}")
+        return True
+    
+    async def _close_ollama_client(self):
+        """Zatvorí HTTP spojenia Ollama klienta"""
+        client, self._ollama_client = self._ollama_client, None
+        if client is not None:
+            await client.close()
+    
+    def _build_messages(self, prompt: str, recalled: str = "") -> List[Dict[str, str]]:
+        """Správy pre Ollama - stabilný prefix (systém + doterajšie výmeny) a nová otázka.
+        
+        Spomienky z dlhodobej pamäte idú až do poslednej správy, aby sa
+        nemenil prefix zdieľaný s predchádzajúcimi požiadavkami.
+        """
+        messages = self.memory.build_messages(SYSTEM_PROMPT, prompt)
+        if recalled:
+            messages[-1]['content'] = f"Relevantné z minulých rozhovorov:\n{recalled}\n\n{prompt}"
+        return messages
+    
+    async def _start_long_term_memory(self):
+        await self.long_term_memory.start(self._get_ollama_client())
+    
+    async def _recall_long_term(self, prompt: str) -> str:
+        """Vyhľadá súvisiace minulé výmeny v časovom rozpočte (inak prázdny reťazec)"""
+        if self.long_term_memory is None:
+            return ""
+        # Výmeny, ktoré sú v prompte doslovne, netreba pripomínať
+        exclude = {turn['user'] for turn in self.memory.recent_turns()}
+        results = await self.long_term_memory.retrieve(self._get_ollama_client(), prompt, exclude)
+        if results:
+            print(f"🗄️  Pripomenuté minulé výmeny: {len(results)}")
+        return self.long_term_memory.format_snippets(results)
+    
+    def get_long_term_memory_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky dlhodobej pamäte"""
+        if self.long_term_memory is None:
+            return {'enabled': False}
+        stats = self.long_term_memory.get_stats()
+        stats['enabled'] = True
+        return stats
+    
+    def set_prompt_measurement(self, enabled: bool):
+        """Zapne/vypne meranie prompt-eval tokenov a časov z odpovedí Ollama"""
+        self.measure_prompt_eval = enabled
+    
+    def get_prompt_metrics(self) -> List[Dict[str, Any]]:
+        """Vráti namerané prompt-eval metriky posledných požiadaviek"""
+        return list(self.prompt_metrics)
+    
+    def _record_prompt_metrics(self, messages: List[Dict[str, str]], response):
+        """Zaznamená prompt-eval tokeny a časy z finálnej odpovede Ollama"""
+        if not self.measure_prompt_eval:
+            return
+        
+        shared = 0
+        for previous, current in zip(self._last_messages, messages):
+            if previous != current:
+                break
+            shared += 1
+        self._last_messages = [dict(m) for m in messages]
+        
+        metrics = {
+            'timestamp': time.time(),
+            'model': self.model_name,
+            'messages': len(messages),
+            'shared_prefix_messages': shared,
+            'prompt_eval_count': response_field(response, 'prompt_eval_count', 0),
+            'prompt_eval_ms': response_field(response, 'prompt_eval_duration', 0) / 1e6,
+            'eval_count': response_field(response, 'eval_count', 0),
+            'eval_ms': response_field(response, 'eval_duration', 0) / 1e6,
+            'load_ms': response_field(response, 'load_duration', 0) / 1e6,
+            'total_ms': response_field(response, 'total_duration', 0) / 1e6
+        }
+        self.prompt_metrics.append(metrics)
+        print(f"📏 Prompt: {metrics['prompt_eval_count']} tok / {metrics['prompt_eval_ms']:.0f} ms "
+              f"(zdieľaný prefix {shared}/{len(messages)} správ) | "
+              f"generovanie: {metrics['eval_count']} tok / {metrics['eval_ms']:.0f} ms")
+    
+    def _get_model_options(self) -> Dict[str, Any]:
+        """Parametre generovania z nastavení AI"""
+        ai_settings = self.config_manager.get("ai", default={})
+        options = {}
+        if "temperature" in ai_settings:
+            options['temperature'] = ai_settings["temperature"]
+        if "max_tokens" in ai_settings:
+            options['num_predict'] = ai_settings["max_tokens"]
+        return options
+    
+    def _cache_key_for(self, messages: List[Dict[str, str]], options: Dict[str, Any]):
+        """Vráti kľúč cache, ak je požiadavka cachovateľná, inak None"""
+        if self.response_cache is None:
+            return None
+        if not ResponseCache.is_cacheable(options, self.cache_settings.get("cache_nondeterministic", False)):
+            return None
+        return ResponseCache.make_key(self.model_name, options, messages)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Vráti štatistiky cache odpovedí pre dashboard"""
+        if self.response_cache is None:
+            return {'enabled': False}
+        stats = self.response_cache.get_stats()
+        stats['enabled'] = True
+        return stats
+    
+    async def _ask_ai_with_context(self, prompt: str) -> str:
+        """Komunikácia s Ollama modelom s kontextom (história ako samostatné správy)"""
+        try:
+            messages, options, cache_key, cached = await self._prepare_chat(prompt)
+            if cached is not None:
+                print("⚡ Odpoveď z cache")
+                return cached
             
             # ✅ OPRAVENÉ: Ošetrenie Ollama volania
             try:
-                response = ollama.chat(
-                    model=self.model_name,
-                    messages=[{'role': 'user', 'content': contextual_prompt}]
-                )
-                return response['message']['content']
+                with self.tracer.span("ollama.chat", model=self.model_name, messages=len(messages)) as span, \
+                        self.metrics.timer("model", model=self.model_name):
+                    response = await self._get_ollama_client().chat(
+                        model=self.model_name,
+                        messages=messages,
+                        options=options
+                    )
+                    span.set(**self._ollama_trace_attrs(response))
+                content = response['message']['content']
+                self._record_prompt_metrics(messages, response)
+                if cache_key:
+                    self.response_cache.put(cache_key, content)
+                return content
             except Exception as ollama_error:
                 return f"❌ Ollama chyba: {str(ollama_error)}. Skontrolujte, či je model {self.model_name} nainštalovaný."
                 
         except Exception as e:
             return f"❌ Chyba pri komunikácii s AI: {str(e)}"
     
+    async def _stream_ai_with_context(self, prompt: str):
+        """Streamuje odpoveď Ollama modelu po častiach (tokenoch)"""
+        messages, options, cache_key, cached = await self._prepare_chat(prompt)
+        if cached is not None:
+            print("⚡ Odpoveď z cache")
+            yield cached
+            return
+        
+        try:
+            parts = []
+            with self.tracer.span("ollama.stream", model=self.model_name, messages=len(messages)) as span, \
+                    self.metrics.timer("model", model=self.model_name):
+                start = time.perf_counter()
+                stream = await self._get_ollama_client().chat(
+                    model=self.model_name,
+                    messages=messages,
+                    options=options,
+                    stream=True
+                )
+                first_token = None
+                async for part in stream:
+                    chunk = part['message']['content']
+                    if chunk:
+                        if first_token is None:
+                            first_token = time.perf_counter()
+                            self.tracer.record("ollama.first_token", start, first_token)
+                            self.metrics.observe("model_first_token_ms", (first_token - start) * 1000,
+                                                 model=self.model_name)
+                        parts.append(chunk)
+                        yield chunk
+                    if response_field(part, 'done', False):
+                        self._record_prompt_metrics(messages, part)
+                        span.set(**self._ollama_trace_attrs(part))
+                if first_token is not None:
+                    self.tracer.record("ollama.generation", first_token, chunks=len(parts))
+            if cache_key:
+                self.response_cache.put(cache_key, "".join(parts))
+        except Exception as ollama_error:
+            yield f"❌ Ollama chyba: {str(ollama_error)}. Skontrolujte, či je model {self.model_name} nainštalovaný."
+    
+    async def _prepare_chat(self, prompt: str):
+        """Zostaví správy a parametre pre model a pozrie do cache - vráti (správy, options, kľúč, odpoveď z cache)"""
+        with self.tracer.span("context.recall"):
+            recalled = await self._recall_long_term(prompt)
+        with self.tracer.span("context.build") as span:
+            messages = self._build_messages(prompt, recalled)
+            options = self._get_model_options()
+            span.set(messages=len(messages), recalled=bool(recalled))
+        
+        cache_key = self._cache_key_for(messages, options)
+        cached = None
+        if cache_key:
+            with self.tracer.span("cache.lookup") as span, self.metrics.timer("cache", layer="response"):
+                memory_hits = self.response_cache.stats['memory_hits']
+                cached = self.response_cache.get(cache_key)
+                span.set(hit=cached is not None)
+            if cached is None:
+                self._count_cache_lookup("response", False)
+            else:
+                memory_hit = self.response_cache.stats['memory_hits'] > memory_hits
+                self._count_cache_lookup("response_memory" if memory_hit else "response_disk", True)
+        return messages, options, cache_key, cached
+    
+    @staticmethod
+    def _ollama_trace_attrs(response) -> Dict[str, Any]:
+        """Počty tokenov a časy zo záverečnej odpovede Ollama pre trasovanie"""
+        return {
+            'prompt_eval_count': response_field(response, 'prompt_eval_count', 0),
+            'eval_count': response_field(response, 'eval_count', 0),
+            'load_ms': response_field(response, 'load_duration', 0) / 1e6,
+            'prompt_eval_ms': response_field(response, 'prompt_eval_duration', 0) / 1e6,
+            'eval_ms': response_field(response, 'eval_duration', 0) / 1e6,
+            'total_ms': response_field(response, 'total_duration', 0) / 1e6
+        }
+    
+    def _count_cache_lookup(self, layer: str, hit: bool):
+        self.metrics.inc("cache_lookups", layer=layer, result="hit" if hit else "miss")
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """Latencie (p50/p95/p99), počty a chyby po moduloch a modeloch pre dashboard"""
+        return {
+            'uptime_s': time.monotonic() - self.metrics.started_at,
+            'modules': self.metrics.summary("module"),
+            'models': self.metrics.summary("model"),
+            'routes': self.metrics.summary("route")
+        }
+    
+    def _on_settings_changed(self, settings, changed: set):
+        """Prevezme zmenený model a zapnutie trasovania bez reštartu"""
+        model_name = settings.get("ai", {}).get("model_name", self.model_name)
+        if model_name != self.model_name:
+            print(f"🔄 Model zmenený: {self.model_name} -> {model_name}")
+            self.model_name = model_name
+            self.model_status = "cold"
+        tracing_enabled = settings.get("tracing", {}).get("enabled", False)
+        if "tracing" in changed and tracing_enabled != self.tracer.enabled:
+            self.set_tracing(tracing_enabled)
+    
+    def set_tracing(self, enabled: bool):
+        """Zapne/vypne trasovanie príkazov za behu"""
+        self.tracer.set_enabled(enabled)
+        print(f"🔬 Trasovanie {'zapnuté' if enabled else 'vypnuté'}: {self.tracer.path}")
+    
     def update_conversation_context(self, user_input, ai_response, detected_intent=None):
         """Aktualizuje konverzačný kontext na základe novej výmeny"""
-        # Pridaj do histórie
-        self.conversation_context['history'].append({
-            'user': user_input,
-            'ai': ai_response,
-            'timestamp': time.time(),
-            'intent': detected_intent
-        })
+        # Pridaj do pamäte (staré výmeny nad rozpočet idú na zhrnutie)
+        self.memory.add_turn(user_input, ai_response, detected_intent)
         
-        # Obmedz veľkosť histórie (zachová posledných 20 výmen)
-        if len(self.conversation_context['history']) > 20:
-            self.conversation_context['history'] = self.conversation_context['history'][-20:]
+        # Dlhodobá pamäť - uloženie a embedding bežia na pozadí
+        if self.long_term_memory is not None and detected_intent != "error":
+            self.long_term_memory.add(self._get_ollama_client(), user_input, ai_response)
         
         # Aktualizuj posledný zámer
         if detected_intent:
@@ -175,17 +931,47 @@ Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používa
         
         # Aktualizuj aktuálnu tému
         self._update_current_topic(user_input, ai_response)
+        
+        # Zhrnutie starších výmen beží na pozadí, odpoveď nečaká
+        if self.memory.needs_summary():
+            self.event_loop.submit(self._summarize_memory())
+    
+    async def _summarize_memory(self):
+        """Zloží staršie výmeny do priebežného súhrnu pomocou modelu"""
+        turns, previous = self.memory.take_pending()
+        if not turns:
+            return
+        
+        try:
+            response = await self._get_ollama_client().chat(
+                model=self.model_name,
+                messages=[{'role': 'user', 'content': self.memory.build_summary_prompt(previous, turns)}],
+                options={'temperature': 0, 'num_predict': 300}
+            )
+            self.memory.apply_summary(response['message']['content'])
+            print(f"🧠 Súhrn konverzácie aktualizovaný ({len(turns)} výmen)")
+        except Exception as e:
+            print(f"⚠️  Zhrnutie konverzácie zlyhalo, používam skrátený súhrn: {e}")
+            self.memory.abort_summary(turns)
+        
+        # Počas zhrnutia mohli pribudnúť ďalšie výmeny
+        if self.memory.needs_summary():
+            await self._summarize_memory()
     
     def _extract_entities(self, text):
         """Jednoduchá extrakcia entít z textu"""
         words = text.split()
+        entities = []
         
         # Jednoduchá detekcia mien (veľké písmeno na začiatku slova)
         for word in words:
             clean_word = word.strip('.,!?;:()[]{}"\'')
             if (len(clean_word) > 2 and clean_word[0].isupper() and 
                 clean_word not in ['Ahoj', 'Čau', 'Dobrý', 'Deň', 'Večer', 'Ráno', 'Dobré']):
-                self.conversation_context['mentioned_entities'].add(clean_word)
+                entities.append(clean_word)
+        
+        if entities:
+            self.memory.add_entities(entities)
     
     def _update_current_topic(self, user_input, ai_response):
         """Aktualizuje aktuálnu tému konverzácie"""
@@ -208,46 +994,38 @@ Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používa
     
     def get_context_summary(self):
         """Vráti súhrn kontextu pre AI model"""
-        if not self.conversation_context['history']:
+        summary = self.memory.build_context()
+        if not summary:
             return ""
         
-        # Zostav kontextový súhrn z posledných niekoľkých výmen
-        recent_history = self.conversation_context['history'][-3:]
-        context_lines = []
-        
-        for exchange in recent_history:
-            context_lines.append(f"Používateľ: {exchange['user']}")
-            context_lines.append(f"Asistent: {exchange['ai']}")
-        
-        summary = "\n".join(context_lines)
-        
         # Pridaj informácie o aktuálnej téme
         if self.conversation_context['current_topic']:
             summary += f"\nAktuálna téma: {self.conversation_context['current_topic']}"
         
         # Pridaj dôležité entity
-        if self.conversation_context['mentioned_entities']:
-            entities = ", ".join(list(self.conversation_context['mentioned_entities'])[:3])
-            summary += f"\nSpomenuté: {entities}"
+        entities = self.memory.top_entities(3)
+        if entities:
+            summary += f"\nSpomenuté: {', '.join(entities)}"
         
         return summary
     
     def get_conversation_stats(self):
         """Vráti štatistiky konverzácie pre UI"""
+        memory_stats = self.memory.get_stats()
         return {
-            'message_count': len(self.conversation_context['history']),
+            'message_count': memory_stats['turn_count'],
             'current_topic': self.conversation_context['current_topic'],
-            'mentioned_entities': list(self.conversation_context['mentioned_entities'])[:5],
-            'has_context': len(self.conversation_context['history']) > 0,
-            'last_intent': self.conversation_context['last_intent']
+            'mentioned_entities': self.memory.top_entities(5),
+            'has_context': memory_stats['turn_count'] > 0,
+            'last_intent': self.conversation_context['last_intent'],
+            'memory': memory_stats
         }
     
     def clear_conversation_context(self):
         """Vymaže konverzačný kontext (nová konverzácia)"""
+        self.memory.clear()
         self.conversation_context = {
-            'history': [],
             'current_topic': None,
-            'mentioned_entities': set(),
             'user_preferences': {},
             'last_intent': None
         }
@@ -261,10 +1039,16 @@ Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používa
             if action == "stop":
                 if self.voice_engine:
                     self.voice_engine.stop_speaking()
+                cancelled = self.scheduler.cancel_running()
+                if cancelled:
+                    return f"🔇 Prehováranie zastavené, prerušené požiadavky: {cancelled}"
                 return "🔇 Prehováranie zastavené"
             elif action == "cancel":
                 if self.voice_engine:
                     self.voice_engine.stop_listening()
+                cancelled = self.scheduler.cancel_all()
+                if cancelled:
+                    return f"🔇 Počúvanie zrušené, zrušené požiadavky: {cancelled}"
                 return "🔇 Počúvanie zrušené"
             elif action == "help":
                 help_text = """
@@ -290,8 +1074,7 @@ Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používa
             print("❌ VoiceEngine nie je dostupný")
             return
             
-        settings = self.config_manager.load_settings()
-        wake_word = settings.get("voice", {}).get("wake_word", "asistent")
+        wake_word = self.config_manager.get("voice", "wake_word", "asistent")
         self.voice_engine.listen_continuous(callback, wake_word)
     
     def stop_voice_listening(self):
@@ -317,13 +1100,67 @@ Odpovedaj prirodzene, berúc do úvahy predchádzajúci kontext. Ak sa používa
         # Táto metóda môže byť implementovaná neskôr
         pass
 
+    def _schedule(self, command: str, source: str, factory):
+        """Hotkeys idú priamo do loopu (musia vedieť prerušiť bežiace požiadavky),
+        ostatné príkazy cez prioritnú frontu plánovača"""
+        if command.startswith("🔧 HOTKEY:"):
+            return self.event_loop.submit(factory())
+        serial_key = "conversation" if source in SERIAL_SOURCES else None
+        submitted = time.perf_counter()
+        
+        async def traced():
+            # Koreňový span požiadavky - čakanie vo fronte + celé spracovanie
+            with self.tracer.span("request", source=source,
+                                  queue_ms=round((time.perf_counter() - submitted) * 1000, 3)):
+                return await factory()
+        
+        return self.scheduler.submit(traced, source=source, serial_key=serial_key, label=command[:60])
+    
+    def submit_command(self, command: str, source: str = "chat"):
+        """Thread-safe odoslanie príkazu - vráti zrušiteľný handle (Future) s odpoveďou.
+        
+        `source` určuje prioritu (chat/voice > dashboard > background); príkazy
+        mimo konverzácie (dashboard, background) sa neukladajú do pamäte.
+        """
+        remember = source in SERIAL_SOURCES
+        return self._schedule(command, source, lambda: self.process_command(command, remember))
+    
+    def submit_command_stream(self, command: str, on_chunk: Callable[[str], None], source: str = "chat"):
+        """Thread-safe streamované spracovanie - on_chunk sa volá vo vlákne loopu, Future vráti celý text"""
+        remember = source in SERIAL_SOURCES
+        
+        async def consume():
+            parts = []
+            async for chunk in self.process_command_stream(command, remember):
+                parts.append(chunk)
+                on_chunk(chunk)
+            return "".join(parts)
+        
+        return self._schedule(command, source, consume)
+    
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Vráti stav fronty požiadaviek pre dashboard"""
+        return self.scheduler.get_stats()
+    
+    def process_command_stream_sync(self, command: str, on_chunk: Callable[[str], None]) -> str:
+        """Synchronná verzia process_command_stream - volá on_chunk pre každú časť"""
+        return self.submit_command_stream(command, on_chunk).result()
+
     # ✅ PRIDANÉ: Synchronná verzia pre prípady, keď asyncio nie je dostupné
     def process_command_sync(self, command: str) -> str:
-        """Synchronná verzia process_command"""
-        import asyncio
-        try:
-            return asyncio.run(self.process_command(command))
-        except RuntimeError:
-            # Ak už beží event loop, použijeme existujúci
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self.process_command(command))
\ No newline at end of file
+        """Synchronná verzia process_command (blokuje volajúce vlákno, nie event loop)"""
+        if self.event_loop.in_loop_thread():
+            raise RuntimeError("process_command_sync nemožno volať z event loopu asistenta")
+        return self.submit_command(command).result()
+    
+    def shutdown(self):
+        """Ukončí event loop asistenta a zatvorí spojenia"""
+        self._unsubscribe_settings()
+        self.module_watcher.stop()
+        self.stop_voice_listening()
+        self.scheduler.cancel_all()
+        self.event_loop.stop()
+        self.process_pool.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        self.tracer.close()
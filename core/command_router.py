@@ -0,0 +1,160 @@
+# core/command_router.py - Smerovanie príkazov na moduly
+import re
+import unicodedata
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+
+def fold_text(text: str) -> str:
+    """Znormalizuje text pre porovnávanie - malé písmená, bez diakritiky"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def normalize_command(command: str) -> str:
+    """Normalizovaný tvar príkazu pre cache (bez diakritiky, veľkosti a interpunkcie)"""
+    text = re.sub(r"[^\w\s]", " ", fold_text(command))
+    return " ".join(text.split())
+
+
+class CommandRouter:
+    """Aho-Corasick automat nad príkazmi všetkých modulov.
+
+    Všetky frázy zo `supported_commands` sa zložia do jedného automatu,
+    takže príkaz sa zmapuje na modul jedným prechodom textu bez ohľadu
+    na počet modulov a fráz. Pri viacerých zhodách vyhráva najdlhšia
+    fráza, pri rovnakej dĺžke modul registrovaný skôr.
+
+    Moduly bez zoznamu `supported_commands` sa skúšajú cez ich vlastné
+    `can_handle` až po automate.
+    """
+
+    def __init__(self):
+        self._modules: Dict[str, Any] = {}
+        self._order: Dict[str, int] = {}
+        self._opaque: List[str] = []
+        self._dirty = True
+
+        # Automat
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._patterns: List[Tuple[int, int, str]] = []  # (dĺžka, poradie, modul)
+
+    def add_module(self, module_name: str, module_instance: Any):
+        """Pridá (alebo nahradí) modul v indexe"""
+        if module_name not in self._order:
+            self._order[module_name] = len(self._order)
+        self._modules[module_name] = module_instance
+        self._dirty = True
+
+    def remove_module(self, module_name: str):
+        """Odstráni modul z indexu"""
+        self._modules.pop(module_name, None)
+        self._order.pop(module_name, None)
+        self._dirty = True
+
+    def clear(self):
+        """Vymaže všetky moduly"""
+        self._modules.clear()
+        self._order.clear()
+        self._dirty = True
+
+    def sync(self, modules: Dict[str, Any]):
+        """Zosúladí index so slovníkom modulov (zachová poradie registrácie)"""
+        for module_name in list(self._modules):
+            if module_name not in modules:
+                self.remove_module(module_name)
+        for module_name, module_instance in modules.items():
+            if self._modules.get(module_name) is not module_instance:
+                self.add_module(module_name, module_instance)
+
+    def rebuild(self):
+        """Zostaví automat zo všetkých registrovaných modulov"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._patterns = []
+        self._opaque = []
+
+        for module_name in sorted(self._modules, key=self._order.get):
+            module_instance = self._modules[module_name]
+            phrases = getattr(module_instance, 'supported_commands', None)
+            if not isinstance(phrases, (list, tuple, set)):
+                if callable(getattr(module_instance, 'can_handle', None)):
+                    self._opaque.append(module_name)
+                continue
+
+            for phrase in phrases:
+                folded = fold_text(str(phrase)).strip()
+                if folded:
+                    self._insert(folded, (len(folded), self._order[module_name], module_name))
+
+        self._build_fail_links()
+        self._dirty = False
+
+    def _insert(self, phrase: str, pattern: Tuple[int, int, str]):
+        state = 0
+        for ch in phrase:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._patterns.append(pattern)
+        self._output[state].append(len(self._patterns) - 1)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def match(self, command: str) -> Optional[str]:
+        """Vráti názov modulu, ktorý má spracovať príkaz, alebo None"""
+        if self._dirty:
+            self.rebuild()
+
+        best = None
+        state = 0
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        for ch in fold_text(command):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in output[state]:
+                length, order, _ = patterns[pattern_id]
+                if best is None or (length, -order) > (best[0], -best[1]):
+                    best = patterns[pattern_id]
+
+        if best is not None:
+            return best[2]
+
+        for module_name in self._opaque:
+            try:
+                if self._modules[module_name].can_handle(command):
+                    return module_name
+            except Exception as e:
+                print(f"⚠️  can_handle modulu {module_name} zlyhal: {e}")
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Vráti štatistiky indexu"""
+        if self._dirty:
+            self.rebuild()
+        return {
+            'modules': len(self._modules),
+            'phrases': len(self._patterns),
+            'states': len(self._goto),
+            'opaque_modules': len(self._opaque)
+        }
@@ -1,42 +1,426 @@
+# core/config_manager.py - Nastavenia aplikácie (snapshot v pamäti, sledovanie súboru)
+import atexit
+import copy
 import json
 import os
-from typing import Dict, Any
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Optional, Iterable
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    print("⚠️  watchdog nie je dostupný - zmeny settings.json sa budú zisťovať podľa času úpravy")
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+def freeze(value):
+    """Nemenná kópia JSON dát (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Upraviteľná kópia zmrazených dát (pre úpravy a zápis do JSON)"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def merge_settings(default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    """Rekurzívne zlúči načítané nastavenia s predvolenými (nové kľúče z predvolených ostanú)"""
+    result = copy.deepcopy(default)
+    for key, value in loaded.items():
+        if isinstance(result.get(key), dict) and isinstance(value, dict):
+            result[key] = merge_settings(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+class _SettingsFileHandler(FileSystemEventHandler):
+    """Prepošle udalosti watchdog týkajúce sa settings.json do ConfigManagera"""
+
+    def __init__(self, manager: "ConfigManager"):
+        super().__init__()
+        self.manager = manager
+
+    def on_any_event(self, event):
+        paths = (getattr(event, 'src_path', None), getattr(event, 'dest_path', None))
+        if any(path and os.path.abspath(path) == self.manager.settings_path for path in paths):
+            self.manager._schedule_reload()
+
 
 class ConfigManager:
-    def __init__(self):
-        self.config_dir = "config"
+    """Nastavenia ako nemenný snapshot v pamäti.
+
+    Súbor sa parsuje len pri štarte a pri zmene na disku (watchdog, bez neho
+    kontrola času úpravy najviac raz za `poll_interval`). Čítanie cez
+    `snapshot`/`get` je bez I/O. `save_settings` hneď vymení snapshot
+    a upovedomí odberateľov; zápis na disk je atómový (tmp + replace)
+    a odložený o `debounce` sekúnd vo vlákne na pozadí, takže rýchle
+    po sebe idúce uloženia sa zapíšu raz.
+    """
+
+    def __init__(self, config_dir: str = "config", debounce: float = 0.5, watch: bool = True,
+                 poll_interval: float = 1.0):
+        self.config_dir = config_dir
         self.settings_file = os.path.join(self.config_dir, "settings.json")
+        self.settings_path = os.path.abspath(self.settings_file)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.default_settings = self._default_settings()
+
+        self._lock = threading.RLock()
+        self._snapshot = freeze(self.default_settings)
+        self._file_stat = None
+        self._last_poll = 0.0
+        self._subscribers = []
+
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_since = 0.0
+        self._wake = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._observer = None
+        self._reload_timer: Optional[threading.Timer] = None
+
         self.ensure_config_files()
+        self.reload(notify=False)
+        if watch:
+            self._start_watching()
+        atexit.register(self.flush)
     
     def ensure_config_files(self):
         """Zabezpečí, že konfiguračné súbory existujú"""
         os.makedirs(self.config_dir, exist_ok=True)
-        
-        default_settings = {
+        if not os.path.exists(self.settings_file):
+            self._write_file(self.default_settings)
+    
+    def _default_settings(self) -> Dict[str, Any]:
+        return {
             "ai": {
                 "local_model": "qwen2:7b",
+                "model_name": "qwen3",
+                "ollama_hosts": [],
+                "health_interval": 15.0,
+                "hedge_requests": False,
+                "hedge_quantile": 0.95,
                 "temperature": 0.7,
-                "max_tokens": 1000
+                "max_tokens": 1000,
+                "keep_alive": "30m",
+                "measure_prompt_eval": False,
+                "intent_model": None,
+                "intent_timeout": 3.0,
+                "intent_max_prompt_chars": 160,
+                "intent_max_answer_chars": 300,
+                "intent_cache_entries": 512
             },
             "voice": {
                 "enabled": True,
                 "language": "sk-SK"
+            },
+            "memory": {
+                "recent_token_budget": 1500,
+                "summary_max_chars": 1200,
+                "max_entities": 50,
+                "entity_decay": 0.85,
+                "max_pending_turns": 20,
+                "trim_ratio": 0.5
+            },
+            "cache": {
+                "enabled": True,
+                "memory_entries": 256,
+                "disk_entries": 5000,
+                "ttl_seconds": 86400,
+                "path": os.path.join(self.config_dir, "response_cache.sqlite3"),
+                "cache_nondeterministic": False
+            },
+            "scheduler": {
+                "workers": 2,
+                "max_queue": 32
+            },
+            "semantic": {
+                "enabled": True,
+                "embed_model": "nomic-embed-text",
+                "threshold": 0.75,
+                "top_k": 3,
+                "timeout": 1.5,
+                "query_cache_entries": 1024,
+                "index_path": os.path.join(self.config_dir, "semantic_index.npz")
+            },
+            "tracing": {
+                "enabled": False,
+                "path": os.path.join(self.config_dir, "traces.jsonl"),
+                "max_bytes": 5 * 1024 * 1024,
+                "backups": 3
+            },
+            "hot_reload": {
+                "enabled": True,
+                "debounce_ms": 200,
+                "poll_interval": 1.0
+            },
+            "file_index": {
+                "enabled": True,
+                "roots": [],
+                "path": os.path.join(self.config_dir, "file_index.sqlite3"),
+                "watch": True,
+                "refresh_after_s": 3600,
+                "ignore": [".git", ".hg", ".svn", "$Recycle.Bin", "System Volume Information"]
+            },
+            "content_search": {
+                "workers": 8,
+                "max_results": 200,
+                "max_file_size_mb": 50,
+                "mmap_threshold_kb": 1024,
+                "pruned_dirs": [".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+                                ".mypy_cache", ".pytest_cache", ".tox"]
+            },
+            "disk_usage": {
+                "workers": 8,
+                "top_files": 20,
+                "one_file_system": True,
+                "ignore": []
+            },
+            "folder_sync": {
+                "workers": 4,
+                "chunk_size_kb": 1024,
+                "delete_orphans": False,
+                "manifest_dir": os.path.join(self.config_dir, "sync_manifests")
+            },
+            "remote_files": {
+                "channels_per_device": 4,
+                "workers": 4,
+                "window_size_mb": 16,
+                "chunk_size_kb": 256,
+                "max_requests": 64
+            },
+            "process_pool": {
+                "enabled": True,
+                "workers": 2,
+                "timeout": 60,
+                "modules": []
+            },
+            "long_term_memory": {
+                "enabled": True,
+                "embed_model": "nomic-embed-text",
+                "top_k": 3,
+                "min_score": 0.55,
+                "latency_budget_ms": 300,
+                "max_snippet_chars": 400,
+                "directory": self.config_dir
             }
         }
-        
-        if not os.path.exists(self.settings_file):
-            self.save_settings(default_settings)
+
+    # ČÍTANIE
+    @property
+    def snapshot(self):
+        """Aktuálne nastavenia (nemenné) - bez čítania súboru"""
+        if self._observer is None and time.monotonic() - self._last_poll >= self.poll_interval:
+            self._last_poll = time.monotonic()
+            self._on_file_changed()
+        return self._snapshot
+    
+    def get(self, section: str, key: Optional[str] = None, default=None):
+        """Sekcia nastavení alebo jedna hodnota zo sekcie"""
+        values = self.snapshot.get(section)
+        if key is None:
+            return default if values is None else values
+        if values is None:
+            return default
+        return values.get(key, default)
     
     def load_settings(self) -> Dict[str, Any]:
+        """Upraviteľná kópia nastavení (na úpravu a následné save_settings)"""
+        return thaw(self.snapshot)
+    
+    def reload(self, notify: bool = True) -> bool:
+        """Znovu načíta settings.json - vráti True, ak sa nastavenia zmenili"""
+        try:
+            stat = os.stat(self.settings_file)
+        except OSError as e:
+            print(f"⚠️  Nastavenia sa nepodarilo načítať: {e}")
+            return False
         try:
             with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {
-                "ai": {"local_model": "qwen2:7b"},
-                "voice": {"enabled": True}
-            }
+                loaded = json.load(f)
+            if not isinstance(loaded, dict):
+                raise ValueError("settings.json neobsahuje objekt")
+        except (OSError, ValueError) as e:
+            # Rozpísaný alebo chybný súbor - ponechaj posledný platný snapshot
+            # a skús znova až pri ďalšej zmene súboru
+            self._file_stat = (stat.st_mtime_ns, stat.st_size)
+            print(f"⚠️  Nastavenia sa nepodarilo načítať: {e}")
+            return False
+        
+        with self._lock:
+            if self._pending is not None:
+                return False  # čakajúci zápis aj tak súbor prepíše
+            self._file_stat = (stat.st_mtime_ns, stat.st_size)
+            changed = self._replace_snapshot(merge_settings(self.default_settings, loaded))
+        if changed and notify:
+            print("🔄 Nastavenia sa zmenili na disku - načítané")
+            self._publish(changed)
+        return bool(changed)
     
+    def _on_file_changed(self):
+        """Zmena súboru (watchdog alebo kontrola času) - ignoruje vlastné zápisy"""
+        try:
+            stat = os.stat(self.settings_file)
+        except OSError:
+            return
+        with self._lock:
+            if self._pending is not None or (stat.st_mtime_ns, stat.st_size) == self._file_stat:
+                return
+        self.reload()
+    
+    def _schedule_reload(self, delay: float = 0.1):
+        """Zlúči rýchly sled udalostí (editor zapisuje po častiach) do jedného načítania"""
+        with self._lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = threading.Timer(delay, self._on_file_changed)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+    
+    def _replace_snapshot(self, settings: Dict[str, Any]) -> set:
+        """Vymení snapshot - vráti množinu zmenených sekcií"""
+        old = self._snapshot
+        new = freeze(settings)
+        changed = {key for key in set(old) | set(new) if old.get(key) != new.get(key)}
+        if changed:
+            self._snapshot = new
+        return changed
+    
+    # ODBERATELIA
+    def subscribe(self, callback: Callable[[Any, set], None], sections: Optional[Iterable[str]] = None):
+        """Zaregistruje callback(snapshot, zmenené_sekcie) - vráti funkciu na odhlásenie.
+        
+        Callback beží vo vlákne, ktoré zmenu spôsobilo (watchdog alebo volajúci
+        save_settings); UI si ho musí presunúť do hlavného vlákna cez `after`.
+        """
+        entry = (callback, frozenset(sections) if sections else None)
+        with self._lock:
+            self._subscribers.append(entry)
+        
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+    
+    def _publish(self, changed: set):
+        snapshot = self._snapshot
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback, sections in subscribers:
+            if sections is not None and not sections & changed:
+                continue
+            try:
+                callback(snapshot, changed)
+            except Exception as e:
+                print(f"⚠️  Odberateľ nastavení zlyhal: {e}")
+    
+    # ZÁPIS
     def save_settings(self, settings: Dict[str, Any]):
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+        """Vymení snapshot hneď, na disk zapíše s oneskorením na pozadí"""
+        data = thaw(settings)
+        with self._lock:
+            changed = self._replace_snapshot(data)
+            self._pending = data
+            self._pending_since = time.monotonic()
+            self._ensure_writer()
+            self._wake.notify()
+        if changed:
+            self._publish(changed)
+    
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="SettingsWriter", daemon=True)
+            self._writer.start()
+    
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                while self._pending is None and not self._closed:
+                    self._wake.wait()
+                if self._pending is None:
+                    return
+                # Debounce - čakaj, kým neprídu ďalšie uloženia
+                remaining = self._pending_since + self.debounce - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._wake.wait(remaining)
+                    continue
+                data = self._pending
+            # Zápis mimo zámku - save_settings z UI nečaká na disk
+            self._write_file(data)
+            with self._lock:
+                if self._pending is data:
+                    self._pending = None
+                self._wake.notify_all()
+    
+    def _write_file(self, settings: Dict[str, Any]):
+        """Atómový zápis - dočasný súbor v tom istom priečinku a os.replace"""
+        tmp_path = self.settings_file + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_file)
+            stat = os.stat(self.settings_file)
+            self._file_stat = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            print(f"❌ Chyba pri ukladaní nastavení: {e}")
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Zapíše čakajúce nastavenia hneď (napr. pri ukončení) - vráti True, ak nič nečaká"""
+        with self._lock:
+            if self._pending is None:
+                return True
+            self._pending_since = 0.0
+            self._ensure_writer()
+            self._wake.notify_all()
+            deadline = time.monotonic() + timeout
+            while self._pending is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._wake.wait(remaining)
+        return True
+    
+    # SLEDOVANIE SÚBORU
+    def _start_watching(self):
+        if not WATCHDOG_AVAILABLE:
+            return
+        try:
+            observer = Observer()
+            observer.schedule(_SettingsFileHandler(self), os.path.dirname(self.settings_path), recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            print(f"⚠️  Sledovanie nastavení sa nepodarilo spustiť: {e}")
+    
+    def close(self):
+        """Zapíše čakajúce zmeny a zastaví sledovanie súboru aj zapisovač"""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._wake.notify_all()
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2.0)
+            self._observer = None
@@ -0,0 +1,238 @@
+# core/content_search.py - Paralelné vyhľadávanie v obsahu súborov (ako grep)
+import asyncio
+import concurrent.futures
+import mmap
+import os
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Priečinky, do ktorých sa nezostupuje (VCS, závislosti, cache)
+DEFAULT_PRUNED_DIRS = ('.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+                       '.mypy_cache', '.pytest_cache', '.tox')
+
+SNIFF_BYTES = 8192
+
+
+class ContentMatch(NamedTuple):
+    path: str
+    line_number: int
+    line: str
+
+
+def is_binary(sample: bytes) -> bool:
+    """Binárny súbor podľa začiatku obsahu - nulový bajt ako v grep"""
+    return b"\0" in sample
+
+
+def compile_matcher(pattern: str, regex: bool = False, ignore_case: bool = True) -> "re.Pattern[bytes]":
+    """Skompiluje hľadaný výraz na bajtový regex (súbory sa prehľadávajú v UTF-8 bez dekódovania).
+
+    Bajtový IGNORECASE pokrýva len ASCII, preto sa pri doslovnom hľadaní
+    znaky s diakritikou rozpíšu na obe veľkosti (č -> (?:č|Č)).
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    if regex:
+        return re.compile(pattern.encode("utf-8"), flags | re.MULTILINE)
+    parts = []
+    for ch in pattern:
+        if ignore_case and not ch.isascii() and ch.lower() != ch.upper():
+            variants = sorted({ch.lower(), ch.upper()})
+            parts.append("(?:" + "|".join(re.escape(v.encode("utf-8")).decode("latin-1") for v in variants) + ")")
+        else:
+            parts.append(re.escape(ch.encode("utf-8")).decode("latin-1"))
+    return re.compile("".join(parts).encode("latin-1"), flags)
+
+
+class ContentSearch:
+    """Hľadanie textu v súboroch stromu priečinkov.
+
+    Strom sa prechádza cez `os.scandir` (ignorované priečinky sa vôbec
+    neotvoria), súbory sa čítajú celé alebo cez mmap (veľké) a prehľadávajú
+    sa na pool vlákien skompilovaným bajtovým regexom. Binárne súbory sa
+    preskočia podľa prvých 8 KB. Zhody sa posielajú po súboroch hneď, ako
+    sa nájdu, a hľadanie skončí po `max_results` zhodách.
+    """
+
+    def __init__(self, workers: int = 8, max_results: int = 200, max_file_size: int = 50 * 1024 * 1024,
+                 mmap_threshold: int = 1024 * 1024, pruned_dirs: Iterable[str] = DEFAULT_PRUNED_DIRS,
+                 max_line_length: int = 200):
+        self.workers = max(1, workers)
+        self.max_results = max(1, max_results)
+        self.max_file_size = max_file_size
+        self.mmap_threshold = mmap_threshold
+        self.pruned_dirs = set(pruned_dirs)
+        self.max_line_length = max_line_length
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "ContentSearch":
+        """Vytvorí vyhľadávač podľa sekcie 'content_search'"""
+        search_settings = settings.get("content_search", {})
+        return cls(
+            workers=search_settings.get("workers", 8),
+            max_results=search_settings.get("max_results", 200),
+            max_file_size=int(search_settings.get("max_file_size_mb", 50) * 1024 * 1024),
+            mmap_threshold=int(search_settings.get("mmap_threshold_kb", 1024) * 1024),
+            pruned_dirs=search_settings.get("pruned_dirs", DEFAULT_PRUNED_DIRS)
+        )
+
+    # PRECHOD A PREHĽADÁVANIE
+    def iter_files(self, root: str) -> Iterator[str]:
+        """Súbory stromu bez ignorovaných priečinkov (symlinky na priečinky sa nesledujú)"""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.pruned_dirs:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+
+    def scan_file(self, path: str, matcher: "re.Pattern[bytes]", limit: int,
+                  stats: Optional[Dict[str, int]] = None) -> List[ContentMatch]:
+        """Zhody v jednom súbore (najviac `limit`) - prázdny zoznam pre binárne/nečitateľné súbory"""
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0 or size > self.max_file_size:
+                    return []
+                if is_binary(f.read(SNIFF_BYTES)):
+                    if stats is not None:
+                        stats['binary_skipped'] += 1
+                    return []
+                if size >= self.mmap_threshold:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        return self._scan_buffer(path, data, matcher, limit, stats, size)
+                f.seek(0)
+                return self._scan_buffer(path, f.read(), matcher, limit, stats, size)
+        except (OSError, ValueError):
+            return []
+
+    def _scan_buffer(self, path, data, matcher, limit, stats, size) -> List[ContentMatch]:
+        if stats is not None:
+            stats['files_scanned'] += 1
+            stats['bytes_scanned'] += size
+        matches = []
+        line_number, counted_to = 1, 0
+        last_line_start = -1
+        for found in matcher.finditer(data):
+            start = found.start()
+            line_start = data.rfind(b"\n", 0, start) + 1
+            if line_start == last_line_start:
+                continue  # viac zhôd na jednom riadku - jeden výsledok
+            line_number += data[counted_to:line_start].count(b"\n")  # mmap nemá count()
+            counted_to = line_start
+            last_line_start = line_start
+            line_end = data.find(b"\n", start)
+            if line_end < 0:
+                line_end = len(data)
+            line = bytes(data[line_start:min(line_end, line_start + self.max_line_length * 4)])
+            text = line.decode("utf-8", errors="replace").rstrip("\r")
+            if len(text) > self.max_line_length:
+                text = text[:self.max_line_length] + "…"
+            matches.append(ContentMatch(path, line_number, text))
+            if len(matches) >= limit:
+                break
+        return matches
+
+    def run(self, root: str, matcher: "re.Pattern[bytes]", on_matches: Callable[[List[ContentMatch]], None],
+            stop: Optional[threading.Event] = None, max_results: Optional[int] = None) -> Dict[str, Any]:
+        """Prehľadá strom - `on_matches` dostane zhody každého súboru hneď po jeho prehľadaní.
+
+        Blokuje do skončenia (alebo `stop`); vráti štatistiku hľadania.
+        """
+        stop = stop or threading.Event()
+        max_results = max_results or self.max_results
+        stats = {'files_scanned': 0, 'binary_skipped': 0, 'bytes_scanned': 0, 'matches': 0, 'files_matched': 0}
+        lock = threading.Lock()
+        start = time.perf_counter()
+        # Najviac 4 súbory na vlákno naraz - prechod stromu nepredbieha čítanie o milióny úloh
+        slots = threading.BoundedSemaphore(self.workers * 4)
+
+        def scan(path):
+            try:
+                if stop.is_set():
+                    return
+                file_stats = dict.fromkeys(('files_scanned', 'binary_skipped', 'bytes_scanned'), 0)
+                found = self.scan_file(path, matcher, max_results, file_stats)
+                with lock:
+                    for key, value in file_stats.items():
+                        stats[key] += value
+                    if not found:
+                        return
+                    remaining = max_results - stats['matches']
+                    if remaining <= 0 or stop.is_set():
+                        return
+                    found = found[:remaining]
+                    stats['matches'] += len(found)
+                    stats['files_matched'] += 1
+                    if stats['matches'] >= max_results:
+                        stop.set()
+                    on_matches(found)
+            finally:
+                slots.release()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                   thread_name_prefix="ContentSearch") as executor:
+            if os.path.isfile(root):
+                paths: Iterable[str] = [root]
+            else:
+                paths = self.iter_files(root)
+            for path in paths:
+                if stop.is_set():
+                    break
+                slots.acquire()
+                executor.submit(scan, path)
+
+        stats['truncated'] = stats['matches'] >= max_results
+        stats['duration_s'] = round(time.perf_counter() - start, 3)
+        return stats
+
+    # ROZHRANIA
+    def search(self, root: str, pattern: str, regex: bool = False, ignore_case: bool = True,
+               max_results: Optional[int] = None) -> List[ContentMatch]:
+        """Všetky zhody naraz (zoradené podľa cesty a riadku)"""
+        matcher = compile_matcher(pattern, regex, ignore_case)
+        results: List[ContentMatch] = []
+        self.run(root, matcher, results.extend, max_results=max_results)
+        return sorted(results)
+
+    async def stream(self, root: str, pattern: str, regex: bool = False, ignore_case: bool = True,
+                     max_results: Optional[int] = None) -> AsyncIterator[Any]:
+        """Async generátor - zoznamy zhôd po súboroch, nakoniec slovník so štatistikou.
+
+        Hľadanie beží vo vlákne; zrušenie/uzavretie generátora ho zastaví.
+        """
+        matcher = compile_matcher(pattern, regex, ignore_case)
+        loop = asyncio.get_running_loop()
+        channel: "asyncio.Queue" = asyncio.Queue()
+        stop = threading.Event()
+
+        def worker():
+            try:
+                stats = self.run(root, matcher, lambda found: loop.call_soon_threadsafe(channel.put_nowait, found),
+                                 stop=stop, max_results=max_results)
+            except Exception as e:
+                stats = {'error': str(e)}
+            loop.call_soon_threadsafe(channel.put_nowait, stats)
+
+        thread = threading.Thread(target=worker, name="ContentSearchWalk", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = await channel.get()
+                yield item
+                if isinstance(item, dict):
+                    return
+        finally:
+            stop.set()
@@ -0,0 +1,232 @@
+# core/conversation_memory.py - Konverzačná pamäť s tokenovým rozpočtom
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+
+def estimate_tokens(text: str) -> int:
+    """Hrubý odhad počtu tokenov (~4 znaky na token)"""
+    return len(text) // 4 + 1
+
+
+class ConversationMemory:
+    """Pamäť konverzácie s konštantnou veľkosťou.
+
+    Posledné výmeny sa držia doslovne, kým sa zmestia do tokenového rozpočtu.
+    Staršie výmeny sa presunú do fronty na zhrnutie, ktoré na pozadí zloží
+    model do priebežného súhrnu. Sledované entity postupne slabnú a drží
+    sa ich len obmedzený počet.
+
+    Pri prekročení rozpočtu sa odrezáva naraz až na `trim_ratio` rozpočtu,
+    takže sa začiatok histórie (a tým aj prefix promptu pre Ollama KV cache)
+    mení len občas, nie pri každej výmene.
+
+    Fronta na zhrnutie má strop `max_pending_turns` aj počas zhrnutia -
+    prebytok sa zloží bez modelu a k súhrnu sa pripojí po jeho dokončení.
+    """
+
+    def __init__(self, recent_token_budget: int = 1500, summary_max_chars: int = 1200,
+                 max_entities: int = 50, entity_decay: float = 0.85, max_pending_turns: int = 20,
+                 trim_ratio: float = 0.5):
+        self.recent_token_budget = recent_token_budget
+        self.trim_ratio = trim_ratio
+        self.summary_max_chars = summary_max_chars
+        self.max_entities = max_entities
+        self.entity_decay = entity_decay
+        self.max_pending_turns = max_pending_turns
+
+        self._lock = threading.Lock()
+        self.clear()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "ConversationMemory":
+        """Vytvorí pamäť podľa sekcie 'memory' v nastaveniach"""
+        memory_settings = settings.get("memory", {})
+        return cls(
+            recent_token_budget=memory_settings.get("recent_token_budget", 1500),
+            summary_max_chars=memory_settings.get("summary_max_chars", 1200),
+            max_entities=memory_settings.get("max_entities", 50),
+            entity_decay=memory_settings.get("entity_decay", 0.85),
+            max_pending_turns=memory_settings.get("max_pending_turns", 20),
+            trim_ratio=memory_settings.get("trim_ratio", 0.5)
+        )
+
+    def clear(self):
+        """Vymaže celú pamäť"""
+        with self._lock:
+            self.recent: deque = deque()
+            self.recent_tokens = 0
+            self.summary = ""
+            self.pending: List[Dict[str, Any]] = []
+            self.summarizing = False
+            self._folded = ""  # výmeny zložené počas prebiehajúceho zhrnutia
+            self.turn_count = 0
+            self._entities: Dict[str, Tuple[float, int]] = {}  # entita -> (skóre, ťah)
+
+    # VÝMENY
+    def add_turn(self, user_input: str, ai_response: str, intent: Optional[str] = None):
+        """Pridá výmenu a presunie najstaršie výmeny nad rozpočet na zhrnutie"""
+        turn = {
+            'user': user_input,
+            'ai': ai_response,
+            'timestamp': time.time(),
+            'intent': intent,
+            'tokens': estimate_tokens(user_input) + estimate_tokens(ai_response)
+        }
+        with self._lock:
+            self.turn_count += 1
+            self.recent.append(turn)
+            self.recent_tokens += turn['tokens']
+
+            if self.recent_tokens > self.recent_token_budget:
+                trim_to = self.recent_token_budget * self.trim_ratio
+                while self.recent_tokens > trim_to and len(self.recent) > 1:
+                    old = self.recent.popleft()
+                    self.recent_tokens -= old['tokens']
+                    self.pending.append(old)
+
+            # Ak zhrnutie na pozadí nestíha, zlož najstaršie výmeny hneď (bez modelu)
+            if len(self.pending) > self.max_pending_turns:
+                overflow = self.pending[:-self.max_pending_turns]
+                self.pending = self.pending[-self.max_pending_turns:]
+                if self.summarizing:
+                    # Súhrn práve prepisuje model - zložené výmeny sa pripoja po jeho dokončení
+                    self._folded = self.fallback_summary(self._folded, overflow, self.summary_max_chars)
+                else:
+                    self.summary = self.fallback_summary(self.summary, overflow, self.summary_max_chars)
+
+    def recent_turns(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            turns = list(self.recent)
+        return turns[-limit:] if limit else turns
+
+    # ZHRNUTIE
+    def needs_summary(self) -> bool:
+        with self._lock:
+            return bool(self.pending) and not self.summarizing
+
+    def take_pending(self) -> Tuple[List[Dict[str, Any]], str]:
+        """Vyberie výmeny na zhrnutie a aktuálny súhrn; označí zhrnutie ako prebiehajúce"""
+        with self._lock:
+            if self.summarizing or not self.pending:
+                return [], self.summary
+            self.summarizing = True
+            turns, self.pending = self.pending, []
+            return turns, self.summary
+
+    def apply_summary(self, summary: str):
+        """Nastaví nový priebežný súhrn po dokončení zhrnutia"""
+        with self._lock:
+            summary = (summary or "").strip()
+            if len(summary) > self.summary_max_chars:
+                summary = summary[-self.summary_max_chars:]
+            self.summary = self._with_folded(summary)
+            self.summarizing = False
+
+    def abort_summary(self, turns: List[Dict[str, Any]]):
+        """Zhrnutie zlyhalo - výmeny sa zložia bez modelu"""
+        with self._lock:
+            self.summary = self._with_folded(self.fallback_summary(self.summary, turns, self.summary_max_chars))
+            self.summarizing = False
+
+    def _with_folded(self, summary: str) -> str:
+        """Pripojí výmeny zložené počas zhrnutia (sú novšie než zhrnuté) - volať pod zámkom"""
+        folded, self._folded = self._folded, ""
+        if not folded:
+            return summary
+        return f"{summary} {folded}".strip()[-self.summary_max_chars:]
+
+    @staticmethod
+    def format_turns(turns: List[Dict[str, Any]]) -> str:
+        lines = []
+        for turn in turns:
+            lines.append(f"Používateľ: {turn['user']}")
+            lines.append(f"Asistent: {turn['ai']}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def fallback_summary(previous: str, turns: List[Dict[str, Any]], max_chars: int) -> str:
+        """Extraktívny súhrn bez modelu - skrátené otázky používateľa"""
+        topics = "; ".join(turn['user'][:80] for turn in turns)
+        summary = f"{previous} {topics}".strip() if previous else topics
+        return summary[-max_chars:]
+
+    def build_summary_prompt(self, previous: str, turns: List[Dict[str, Any]]) -> str:
+        """Prompt pre model, ktorý zloží staré výmeny do súhrnu"""
+        return f"""Aktualizuj stručný súhrn konverzácie (max {self.summary_max_chars} znakov).
+Zachovaj fakty, mená, rozhodnutia a otvorené otázky. Odpovedz len súhrnom.
+
+Doterajší súhrn:
+{previous or '(žiadny)'}
+
+Nové výmeny:
+{self.format_turns(turns)}"""
+
+    # ENTITY
+    def add_entities(self, entities: List[str]):
+        """Zaznamená spomenuté entity; staršie entity postupne slabnú"""
+        with self._lock:
+            now = self.turn_count
+            for entity in entities:
+                score = self._decayed(entity, now)
+                self._entities[entity] = (score + 1.0, now)
+
+            if len(self._entities) > self.max_entities:
+                ranked = sorted(self._entities, key=lambda e: self._decayed(e, now), reverse=True)
+                for entity in ranked[self.max_entities:]:
+                    del self._entities[entity]
+
+    def _decayed(self, entity: str, now: int) -> float:
+        score, turn = self._entities.get(entity, (0.0, now))
+        return score * (self.entity_decay ** (now - turn))
+
+    def top_entities(self, limit: int = 5) -> List[str]:
+        with self._lock:
+            now = self.turn_count
+            return sorted(self._entities, key=lambda e: self._decayed(e, now), reverse=True)[:limit]
+
+    # KONTEXT
+    def build_context(self) -> str:
+        """Zostaví kontext: priebežný súhrn + doslovné posledné výmeny"""
+        with self._lock:
+            summary = self.summary
+            turns = list(self.recent)
+        parts = []
+        if summary:
+            parts.append(f"Súhrn staršej konverzácie: {summary}")
+        if turns:
+            parts.append(self.format_turns(turns))
+        return "\n".join(parts)
+
+    def build_messages(self, system_prompt: str, prompt: str) -> List[Dict[str, str]]:
+        """Zostaví Ollama správy: systémový prompt (+ súhrn), doslovné výmeny a novú otázku.
+
+        Výmeny sa len pripájajú na koniec, takže po sebe idúce požiadavky
+        zdieľajú bajtovo rovnaký prefix.
+        """
+        with self._lock:
+            summary = self.summary
+            turns = list(self.recent)
+
+        system_content = system_prompt
+        if summary:
+            system_content += f"\n\nSúhrn staršej konverzácie: {summary}"
+
+        messages = [{'role': 'system', 'content': system_content}]
+        for turn in turns:
+            messages.append({'role': 'user', 'content': turn['user']})
+            messages.append({'role': 'assistant', 'content': turn['ai']})
+        messages.append({'role': 'user', 'content': prompt})
+        return messages
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'turn_count': self.turn_count,
+                'recent_turns': len(self.recent),
+                'recent_tokens': self.recent_tokens,
+                'summary_chars': len(self.summary),
+                'pending_turns': len(self.pending),
+                'entities': len(self._entities)
+            }
@@ -0,0 +1,213 @@
+# core/disk_usage.py - Využitie disku po priečinkoch (ako ncdu)
+import concurrent.futures
+import heapq
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class DirUsage:
+    """Súhrn jedného priečinka.
+
+    `own_*` a `extensions` / `largest` sa týkajú len súborov priamo v
+    priečinku (tie sa dajú znovu použiť, kým sa nezmení mtime priečinka),
+    `total_*` zahŕňajú celý podstrom a prepočítavajú sa pri každom skenovaní.
+    """
+
+    __slots__ = ('path', 'mtime_ns', 'own_size', 'own_files', 'extensions', 'largest', 'children',
+                 'total_size', 'total_files', 'total_dirs')
+
+    def __init__(self, path: str, mtime_ns: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.own_size = 0
+        self.own_files = 0
+        self.extensions: Dict[str, List[int]] = {}  # prípona -> [bajty, počet]
+        self.largest: List[Tuple[int, str]] = []  # (veľkosť, cesta) najväčších súborov
+        self.children: List[str] = []
+        self.total_size = 0
+        self.total_files = 0
+        self.total_dirs = 0
+
+
+class DiskUsage:
+    """Rekurzívne veľkosti priečinkov s cache podľa mtime priečinka.
+
+    Priečinky sa čítajú paralelne cez `os.scandir` na pool vlákien. Pri
+    opakovanom skenovaní sa priečinok s nezmeneným mtime nečíta znovu
+    (stačí jeden `stat`), použijú sa uložené údaje o jeho súboroch a
+    pokračuje sa do podpriečinkov - zmena hlboko v strome sa tak nájde bez
+    čítania celého stromu. mtime priečinka sa nemení pri prepísaní obsahu
+    existujúceho súboru; také zmeny zachytí až `invalidate` alebo `force`.
+    """
+
+    def __init__(self, workers: int = 8, top_files: int = 20, one_file_system: bool = True,
+                 ignore: Iterable[str] = ()):
+        self.workers = max(1, workers)
+        self.top_files = max(1, top_files)
+        self.one_file_system = one_file_system
+        self.ignore = set(ignore)
+        self._cache: Dict[str, DirUsage] = {}
+        self._lock = threading.Lock()
+        self.stats = {'dirs_scanned': 0, 'dirs_cached': 0, 'errors': 0, 'duration_s': None}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "DiskUsage":
+        """Vytvorí analyzátor podľa sekcie 'disk_usage'"""
+        usage_settings = settings.get("disk_usage", {})
+        return cls(
+            workers=usage_settings.get("workers", 8),
+            top_files=usage_settings.get("top_files", 20),
+            one_file_system=usage_settings.get("one_file_system", True),
+            ignore=usage_settings.get("ignore", ())
+        )
+
+    # SKENOVANIE
+    def scan(self, root: str, force: bool = False) -> DirUsage:
+        """Prepočíta podstrom `root` a vráti jeho súhrn"""
+        root = os.path.abspath(os.path.expanduser(root))
+        root_stat = os.stat(root)
+        if not os.path.isdir(root):
+            raise NotADirectoryError(root)
+
+        with self._lock:  # súbežné skenovania toho istého stromu by si prepisovali cache
+            start = time.perf_counter()
+            stats = {'dirs_scanned': 0, 'dirs_cached': 0, 'errors': 0}
+            visited: Dict[str, DirUsage] = {}
+            done: "queue.Queue" = queue.Queue()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                       thread_name_prefix="DiskUsage") as executor:
+                def submit(path):
+                    executor.submit(self._read_dir, path, root_stat.st_dev, force).add_done_callback(done.put)
+
+                submit(root)
+                outstanding = 1
+                while outstanding:
+                    node, cached = done.get().result()
+                    outstanding -= 1
+                    if node is None:
+                        stats['errors'] += 1
+                        continue
+                    stats['dirs_cached' if cached else 'dirs_scanned'] += 1
+                    visited[node.path] = node
+                    for child in node.children:
+                        submit(child)
+                    outstanding += len(node.children)
+
+            self._aggregate(visited)
+            self._forget_subtree(root, keep=visited)
+            self._cache.update(visited)
+            stats['duration_s'] = round(time.perf_counter() - start, 3)
+            self.stats = stats
+            return visited[root]
+
+    def _read_dir(self, path: str, device: int, force: bool) -> Tuple[Optional[DirUsage], bool]:
+        """Súbory jedného priečinka (z cache, ak sa nezmenil mtime) - beží vo vlákne poolu"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, False
+        cached = self._cache.get(path)
+        if cached is not None and not force and cached.mtime_ns == mtime_ns:
+            return cached, True
+
+        node = DirUsage(path, mtime_ns)
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in self.ignore:
+                                continue
+                            if self.one_file_system and entry.stat(follow_symlinks=False).st_dev != device:
+                                continue  # iný disk/mount - ako ncdu -x
+                            node.children.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            files.append((size, entry.path))
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            totals = node.extensions.setdefault(ext, [0, 0])
+                            totals[0] += size
+                            totals[1] += 1
+                    except OSError:
+                        continue
+        except OSError:
+            return None, False
+
+        node.own_files = len(files)
+        node.own_size = sum(size for size, _ in files)
+        node.largest = heapq.nlargest(self.top_files, files)
+        return node, False
+
+    @staticmethod
+    def _aggregate(nodes: Dict[str, DirUsage]):
+        """Súčty podstromov odspodu (najhlbšie priečinky prvé)"""
+        for node in sorted(nodes.values(), key=lambda item: item.path.count(os.sep), reverse=True):
+            node.total_size = node.own_size
+            node.total_files = node.own_files
+            node.total_dirs = 0
+            for child_path in node.children:
+                child = nodes.get(child_path)
+                if child is not None:
+                    node.total_size += child.total_size
+                    node.total_files += child.total_files
+                    node.total_dirs += child.total_dirs + 1
+
+    def _forget_subtree(self, root: str, keep: Dict[str, DirUsage]):
+        """Vyradí z cache zmazané priečinky pod `root`"""
+        prefix = root.rstrip(os.sep) + os.sep
+        for path in [path for path in self._cache if path.startswith(prefix) and path not in keep]:
+            del self._cache[path]
+
+    def invalidate(self, path: Optional[str] = None):
+        """Zabudne uložené údaje (celé alebo podstrom `path`)"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            path = os.path.abspath(path)
+            self._cache.pop(path, None)
+            self._forget_subtree(path, keep={})
+
+    # POHĽADY
+    def _subtree(self, root: str) -> List[DirUsage]:
+        """Uložené priečinky podstromu (po `scan`)"""
+        root = os.path.abspath(root)
+        node = self._cache.get(root)
+        if node is None:
+            return []
+        nodes, stack = [], [node]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(self._cache[child] for child in node.children if child in self._cache)
+        return nodes
+
+    def largest_dirs(self, root: str, limit: int = 10) -> List[DirUsage]:
+        """Priame podpriečinky zoradené podľa veľkosti podstromu"""
+        node = self._cache.get(os.path.abspath(root))
+        if node is None:
+            return []
+        children = [self._cache[child] for child in node.children if child in self._cache]
+        return heapq.nlargest(limit, children, key=lambda child: child.total_size)
+
+    def largest_files(self, root: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """Najväčšie súbory v celom podstrome ako (veľkosť, cesta)"""
+        return heapq.nlargest(limit, (item for node in self._subtree(root) for item in node.largest))
+
+    def by_extension(self, root: str) -> List[Tuple[str, int, int]]:
+        """(prípona, bajty, počet) za celý podstrom, od najväčšej"""
+        totals: Dict[str, List[int]] = {}
+        for node in self._subtree(root):
+            for ext, (size, count) in node.extensions.items():
+                entry = totals.setdefault(ext, [0, 0])
+                entry[0] += size
+                entry[1] += count
+        return sorted(((ext, size, count) for ext, (size, count) in totals.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'cached_dirs': len(self._cache)}
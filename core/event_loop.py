@@ -0,0 +1,72 @@
+# core/event_loop.py - Dlhožijúci asyncio loop asistenta
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Callable, Coroutine
+
+
+class AssistantEventLoop:
+    """Jeden asyncio loop bežiaci v samostatnom vlákne počas celého behu aplikácie.
+
+    UI vlákna doň posielajú korutiny cez `submit` a dostanú späť
+    `concurrent.futures.Future`, takže sa loop nevytvára pri každej správe
+    a viac príkazov môže bežať súčasne.
+    """
+
+    def __init__(self, name: str = "aura-assistant-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._shutdown_callbacks = []
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(self.loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+    def is_running(self) -> bool:
+        return self.thread.is_alive() and self.loop.is_running()
+
+    def in_loop_thread(self) -> bool:
+        """Vráti True, ak volanie prebieha priamo vo vlákne loopu"""
+        return threading.current_thread() is self.thread
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Naplánuje korutinu do loopu (thread-safe) a vráti Future"""
+        if not self.is_running():
+            coro.close()
+            raise RuntimeError("Event loop asistenta nebeží")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, callback: Callable[..., Any], *args):
+        """Zavolá funkciu vo vlákne loopu"""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def add_shutdown_callback(self, coro_factory: Callable[[], Coroutine]):
+        """Zaregistruje korutinu, ktorá sa spustí pri ukončení loopu"""
+        self._shutdown_callbacks.append(coro_factory)
+
+    def stop(self, timeout: float = 5.0):
+        """Ukončí loop a počká na vlákno"""
+        if not self.is_running():
+            return
+        for coro_factory in self._shutdown_callbacks:
+            try:
+                self.submit(coro_factory()).result(timeout)
+            except Exception as e:
+                print(f"⚠️  Chyba pri ukončovaní: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
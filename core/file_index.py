@@ -0,0 +1,476 @@
+# core/file_index.py - Perzistentný index metadát súborov (SQLite)
+import concurrent.futures
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Priečinky, ktoré sa neindexujú (metadáta VCS, systémové priečinky Windows)
+DEFAULT_IGNORED_DIRS = ('.git', '.hg', '.svn', '$Recycle.Bin', 'System Volume Information')
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+# Len jedna prípona - index ukladá poslednú (splitext), "*.tar.gz" ide cez GLOB
+_EXT_GLOB = re.compile(r"\*\.([^*?\[\]/\\.]+)")
+_MAX_CHAR = "\U0010ffff"
+
+
+def path_range(root: str):
+    """Rozsah ciest pod priečinkom pre indexované porovnanie (root/ <= cesta < root/\\U0010ffff)"""
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    return prefix, prefix + _MAX_CHAR
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """Udalosti watchdog -> fronta zápisov indexu"""
+
+    def __init__(self, index: "FileIndex"):
+        super().__init__()
+        self.index = index
+
+    def on_any_event(self, event):
+        if event.event_type in ('created', 'modified', 'deleted', 'moved'):
+            self.index._queue.put(('event', event.event_type, event.src_path,
+                                   getattr(event, 'dest_path', None), event.is_directory))
+
+
+class FileIndex:
+    """Index ciest, názvov, veľkostí a časov úpravy súborov v SQLite.
+
+    Prvé indexovanie robí vlákno na pozadí cez `os.scandir` a zapisuje po
+    dávkach, takže vyhľadávanie funguje (neúplne) už počas neho. Potom index
+    udržujú udalosti watchdog. Hľadanie podreťazca používa FTS5 trigram index
+    (ak ho SQLite má), prefix a glob rozsah nad indexom názvov, prípona
+    vlastný index - na miliónoch súborov odpoveď trvá milisekundy.
+    Všetky zápisy robí jedno vlákno; čítania idú cez samostatné spojenie (WAL).
+    """
+
+    def __init__(self, path: str, roots: Iterable[str] = (), watch: bool = True,
+                 ignore: Iterable[str] = DEFAULT_IGNORED_DIRS, batch_size: int = 5000,
+                 refresh_after: float = 3600.0):
+        self.path = path
+        self.roots = [os.path.abspath(os.path.expanduser(root)) for root in roots]
+        self.watch = watch and WATCHDOG_AVAILABLE
+        self.ignore = set(ignore)
+        self.batch_size = max(1, batch_size)
+        self.refresh_after = refresh_after
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._observers: Dict[str, Any] = {}
+        self._pending: Dict[str, concurrent.futures.Future] = {}
+        self._crawled_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.fts = False
+        self.stats = {'crawled': 0, 'events': 0, 'queries': 0, 'last_query_ms': None, 'last_crawl_s': None}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], config_dir: str = "config") -> "FileIndex":
+        """Vytvorí index podľa sekcie 'file_index' (bez koreňov indexuje domovský priečinok)"""
+        index_settings = settings.get("file_index", {})
+        return cls(
+            path=index_settings.get("path") or os.path.join(config_dir, "file_index.sqlite3"),
+            roots=index_settings.get("roots") or [os.path.expanduser("~")],
+            watch=index_settings.get("watch", True),
+            ignore=index_settings.get("ignore", DEFAULT_IGNORED_DIRS),
+            batch_size=index_settings.get("batch_size", 5000),
+            refresh_after=index_settings.get("refresh_after_s", 3600)
+        )
+
+    # ŠTART / STOP
+    def start(self):
+        """Otvorí databázu, spustí zapisovacie vlákno a indexovanie koreňov"""
+        with self._lock:
+            if self._writer is not None:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = self._connect()
+            self._create_schema(connection)
+            self._reader = self._connect()
+            self._writer = threading.Thread(target=self._write_loop, args=(connection,),
+                                            name="FileIndexWriter", daemon=True)
+            self._writer.start()
+        for root in self.roots:
+            self.index_root(root)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _create_schema(self, db: sqlite3.Connection):
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                name_lower TEXT NOT NULL,
+                ext TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                is_dir INTEGER NOT NULL,
+                generation INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_name ON files(name_lower);
+            CREATE INDEX IF NOT EXISTS idx_files_ext ON files(ext);
+            CREATE TABLE IF NOT EXISTS roots (
+                path TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                files INTEGER NOT NULL DEFAULT 0,
+                crawled_at REAL
+            );
+        """)
+        try:
+            db.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+                    name_lower, content='files', content_rowid='id', tokenize='trigram');
+                CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                    INSERT INTO files_fts(rowid, name_lower) VALUES (new.id, new.name_lower);
+                END;
+                CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                    INSERT INTO files_fts(files_fts, rowid, name_lower) VALUES ('delete', old.id, old.name_lower);
+                END;
+            """)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False  # SQLite bez FTS5/trigram - podreťazec sa hľadá prechodom názvov
+        # Nedokončené indexovanie z minulého behu sa zopakuje
+        db.execute("UPDATE roots SET status = 'stale' WHERE status = 'crawling'")
+        db.commit()
+
+    def close(self, timeout: float = 5.0):
+        """Zastaví sledovanie a zapisovacie vlákno"""
+        for observer in list(self._observers.values()):
+            observer.stop()
+        for observer in list(self._observers.values()):
+            observer.join(timeout=2.0)
+        self._observers.clear()
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join(timeout)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    # INDEXOVANIE
+    def index_root(self, root: str, force: bool = False) -> concurrent.futures.Future:
+        """Naplánuje indexovanie priečinka - Future sa splní počtom súborov po dokončení.
+
+        Čerstvo zaindexovaný koreň (alebo priečinok pod ním) sa znovu
+        neprechádza, len sa zaň zapne sledovanie zmien. Starší ako
+        `refresh_after` sekúnd (zmeny medzi behmi aplikácie) sa prejde na
+        pozadí znova; `force` vynúti nový prechod vždy.
+        """
+        root = os.path.abspath(os.path.expanduser(root))
+        with self._lock:
+            pending = self._pending.get(root)
+            if pending is not None and not pending.done():
+                return pending
+            future = concurrent.futures.Future()
+            covering = self._covering_root(root)
+            if covering is not None and not force:
+                crawled_at = self._crawled_at.get(covering) or 0
+                if covering != root or time.time() - crawled_at < self.refresh_after:
+                    future.set_result(None)
+                    self._watch(covering)
+                    return future
+            self._pending[root] = future
+        self._queue.put(('crawl', root, future))
+        return future
+
+    def _covering_root(self, path: str) -> Optional[str]:
+        """Úplne zaindexovaný koreň, pod ktorý cesta patrí"""
+        with self._read_lock:
+            if self._reader is None:
+                return None
+            rows = self._reader.execute("SELECT path, crawled_at FROM roots WHERE status = 'ready'").fetchall()
+        self._crawled_at = dict(rows)
+        for root, _ in rows:
+            if path == root or path.startswith(path_range(root)[0]):
+                return root
+        return None
+
+    def is_indexed(self, path: str) -> bool:
+        """Je priečinok úplne zaindexovaný?"""
+        return self._covering_root(os.path.abspath(path)) is not None
+
+    def is_crawling(self) -> bool:
+        with self._lock:
+            return any(not future.done() for future in self._pending.values())
+
+    def _write_loop(self, db: sqlite3.Connection):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                db.close()
+                return
+            try:
+                if item[0] == 'crawl':
+                    self._crawl(db, item[1], item[2])
+                else:
+                    self._apply_events(db, [item])
+            except Exception as e:
+                print(f"⚠️  Index súborov: chyba zápisu: {e}")
+                if item[0] == 'crawl' and not item[2].done():
+                    item[2].set_exception(e)
+
+    def _crawl(self, db: sqlite3.Connection, root: str, future: concurrent.futures.Future):
+        """Prechod priečinka cez os.scandir - zápis po dávkach, na konci zmazanie neexistujúcich"""
+        start = time.perf_counter()
+        generation = time.time_ns()
+        # Obnovovaný koreň zostáva 'ready' - vyhľadávanie medzitým používa doterajší index
+        db.execute("INSERT INTO roots(path, status) VALUES (?, 'crawling') "
+                   "ON CONFLICT(path) DO UPDATE SET status = CASE WHEN status = 'ready' THEN 'ready' "
+                   "ELSE 'crawling' END", (root,))
+        db.commit()
+        print(f"🗂️  Indexujem súbory v {root}...")
+
+        count = 0
+        batch = []
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if is_dir and entry.name in self.ignore:
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    batch.append(self._row(entry.path, entry.name, is_dir, stat.st_size, stat.st_mtime, generation))
+                    if is_dir:
+                        stack.append(entry.path)
+            if len(batch) >= self.batch_size:
+                count += self._upsert(db, batch)
+                batch = []
+                # Medzitým prišlé udalosti watchdog nech nečakajú na koniec celého prechodu
+                self._apply_events(db, [])
+        count += self._upsert(db, batch)
+
+        low, high = path_range(root)
+        db.execute("DELETE FROM files WHERE path >= ? AND path < ? AND generation < ?", (low, high, generation))
+        db.execute("UPDATE roots SET status = 'ready', files = ?, crawled_at = ? WHERE path = ?",
+                   (count, time.time(), root))
+        # Vnorené korene sú teraz súčasťou tohto
+        db.execute("DELETE FROM roots WHERE path >= ? AND path < ?", (low, high))
+        db.commit()
+
+        elapsed = time.perf_counter() - start
+        self.stats['crawled'] += count
+        self.stats['last_crawl_s'] = round(elapsed, 3)
+        print(f"✅ Index súborov: {root} - {count} položiek za {elapsed:.1f} s")
+        self._watch(root)
+        future.set_result(count)
+
+    @staticmethod
+    def _row(path: str, name: str, is_dir: bool, size: int, mtime: float, generation: int):
+        ext = "" if is_dir else os.path.splitext(name)[1].lower()
+        return (path, name.lower(), ext, 0 if is_dir else size, mtime, int(is_dir), generation)
+
+    @staticmethod
+    def _upsert(db: sqlite3.Connection, rows: List[tuple]) -> int:
+        if rows:
+            db.executemany("""
+                INSERT INTO files(path, name_lower, ext, size, mtime, is_dir, generation)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime = excluded.mtime,
+                    is_dir = excluded.is_dir, generation = excluded.generation
+            """, rows)
+            db.commit()
+        return len(rows)
+
+    # PRÍRASTKOVÉ ZMENY
+    def _watch(self, root: str):
+        if not self.watch or root in self._observers:
+            return
+        if any(root.startswith(path_range(watched)[0]) for watched in self._observers):
+            return
+        try:
+            observer = Observer()
+            observer.schedule(_IndexEventHandler(self), root, recursive=True)
+            observer.daemon = True
+            observer.start()
+            self._observers[root] = observer
+        except Exception as e:
+            print(f"⚠️  Index súborov: sledovanie {root} sa nepodarilo spustiť ({e})")
+
+    def _apply_events(self, db: sqlite3.Connection, events: List[tuple]):
+        """Zapíše čakajúce udalosti jednou transakciou (pri sérii zmien jedného súboru rozhodne posledný stav)"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None or item[0] != 'event':
+                self._queue.put(item)
+                break
+            events.append(item)
+        if not events:
+            return
+        generation = time.time_ns()
+        for _, kind, src, dest, is_dir in events:
+            self.stats['events'] += 1
+            if kind in ('deleted', 'moved'):
+                self._delete_path(db, src)
+            target = dest if kind == 'moved' else src
+            if kind == 'deleted' or not target:
+                continue
+            try:
+                stat = os.lstat(target)
+            except OSError:
+                self._delete_path(db, target)
+                continue
+            name = os.path.basename(target)
+            directory = os.path.isdir(target)
+            if directory and name in self.ignore:
+                continue
+            self._upsert(db, [self._row(target, name, directory, stat.st_size, stat.st_mtime, generation)])
+            if directory and kind in ('created', 'moved'):
+                # Priečinok presunutý zvonka príde ako jedna udalosť - zaindexuj aj jeho obsah
+                self._crawl_subtree(db, target, generation)
+        db.commit()
+
+    def _crawl_subtree(self, db: sqlite3.Connection, directory: str, generation: int):
+        batch = []
+        for current, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if d not in self.ignore]
+            for name, is_dir in [(d, True) for d in dirs] + [(f, False) for f in files]:
+                path = os.path.join(current, name)
+                try:
+                    stat = os.lstat(path)
+                except OSError:
+                    continue
+                batch.append(self._row(path, name, is_dir, stat.st_size, stat.st_mtime, generation))
+        self._upsert(db, batch)
+
+    @staticmethod
+    def _delete_path(db: sqlite3.Connection, path: str):
+        low, high = path_range(path)
+        db.execute("DELETE FROM files WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high))
+
+    def forget(self, paths: Iterable[str]):
+        """Odstráni z indexu cesty, ktoré už neexistujú (zistené pri overovaní výsledkov)"""
+        for path in paths:
+            self._queue.put(('event', 'deleted', path, None, False))
+
+    # VYHĽADÁVANIE
+    def search(self, term: str = "", root: Optional[str] = None, ext: Optional[str] = None,
+               mode: str = "auto", limit: int = 50, include_dirs: bool = False,
+               verify: bool = True) -> List[Dict[str, Any]]:
+        """Nájde súbory podľa názvu.
+
+        mode: 'substring' (časť názvu), 'prefix' (začiatok názvu), 'glob'
+        (`*.pdf`, `report_??.txt`) alebo 'auto' (glob, ak výraz obsahuje
+        zástupné znaky). `ext` filtruje príponu, `root` obmedzí hľadanie na
+        priečinok. Pri `verify` sa vrátené cesty overia na disku a zmiznuté
+        sa z indexu odstránia.
+        """
+        start = time.perf_counter()
+        clauses, params, use_fts = self._name_clauses(term.lower(), mode)
+        if ext:
+            clauses.append("files.ext = ?")
+            params.append(ext.lower() if ext.startswith(".") else "." + ext.lower())
+        if root:
+            low, high = path_range(os.path.abspath(root))
+            clauses.append("files.path >= ? AND files.path < ?")
+            params.extend([low, high])
+        if not include_dirs:
+            clauses.append("files.is_dir = 0")
+        sql = "SELECT files.path, files.size, files.mtime, files.is_dir FROM "
+        # Trigram index vracia kandidátov postupne - LIMIT ukončí hľadanie po prvých zhodách
+        # (CROSS JOIN - SQLite nesmie poradie otočiť a prechádzať napr. celý index prípon)
+        sql += "files_fts CROSS JOIN files ON files.id = files_fts.rowid" if use_fts else "files"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+        with self._read_lock:
+            if self._reader is None:
+                return []
+            rows = self._reader.execute(sql, params).fetchall()
+
+        results, missing = [], []
+        for path, size, mtime, is_dir in rows:
+            if verify:
+                try:
+                    stat = os.lstat(path)
+                    size, mtime = (0 if is_dir else stat.st_size), stat.st_mtime
+                except OSError:
+                    missing.append(path)
+                    continue
+            results.append({'path': path, 'size': size, 'modified': mtime, 'is_dir': bool(is_dir)})
+        if missing:
+            self.forget(missing)
+
+        self.stats['queries'] += 1
+        self.stats['last_query_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        return results
+
+    def _name_clauses(self, term: str, mode: str):
+        """Podmienky pre názov - (klauzuly, parametre, použiť FTS)"""
+        if not term:
+            return [], [], False
+        if mode == "auto":
+            mode = "glob" if _GLOB_CHARS.search(term) else "substring"
+        if mode == "prefix":
+            return ["files.name_lower >= ? AND files.name_lower < ?"], [term, term + _MAX_CHAR], False
+        if mode == "glob":
+            extension = _EXT_GLOB.fullmatch(term)
+            if extension:
+                return ["files.ext = ?"], ["." + extension.group(1)], False
+            # Doslovné časti vzoru (aspoň 3 znaky) spolu zúžia kandidátov cez trigram
+            # index, inak doslovný začiatok vzoru cez rozsah indexu názvov
+            literals = [part for part in re.split(r"\[[^\]]*\]|[*?]", term) if len(part) >= 3]
+            if self.fts and literals:
+                return (["files_fts MATCH ?", "files.name_lower GLOB ?"],
+                        [" AND ".join(self._fts_phrase(part) for part in literals), term], True)
+            prefix = _GLOB_CHARS.split(term, 1)[0]
+            if prefix:
+                return (["files.name_lower >= ? AND files.name_lower < ?", "files.name_lower GLOB ?"],
+                        [prefix, prefix + _MAX_CHAR, term], False)
+            return ["files.name_lower GLOB ?"], [term], False
+        if self.fts and len(term) >= 3:
+            return ["files_fts MATCH ?"], [self._fts_phrase(term)], True
+        return ["instr(files.name_lower, ?) > 0"], [term], False
+
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['path'] = self.path
+        stats['fts'] = self.fts
+        stats['watching'] = sorted(self._observers)
+        stats['crawling'] = self.is_crawling()
+        with self._read_lock:
+            if self._reader is not None:
+                stats['files'] = self._reader.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+                stats['roots'] = {path: {'status': status, 'files': files, 'crawled_at': crawled_at}
+                                  for path, status, files, crawled_at in
+                                  self._reader.execute("SELECT path, status, files, crawled_at FROM roots")}
+        return stats
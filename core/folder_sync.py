@@ -0,0 +1,304 @@
+# core/folder_sync.py - Inkrementálna synchronizácia zložiek
+import concurrent.futures
+import errno
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+PART_SUFFIX = ".aura-part"
+
+# Chyby, pri ktorých systémové kopírovanie nie je podporované - skúsi sa ďalší spôsob
+_UNSUPPORTED_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF, errno.EPERM,
+                       errno.ENOTSOCK, getattr(errno, 'EOPNOTSUPP', -1), getattr(errno, 'ENOTSUP', -1)}
+
+
+def copy_contents(fsrc, fdst, chunk_size: int = 1024 * 1024, size: Optional[int] = None) -> str:
+    """Skopíruje obsah otvoreného súboru - najprv v jadre (copy_file_range, sendfile), inak po blokoch.
+
+    `size` je očakávaná dĺžka (predvolene podľa fstat). Niektoré súborové
+    systémy namiesto chyby vrátia 0 pred koncom súboru - vtedy sa pokračuje
+    ďalším spôsobom od už skopírovaného miesta. Vráti názov použitého spôsobu.
+    """
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    if size is None:
+        size = os.fstat(src_fd).st_size
+    copied = 0
+    # Súbory s nulovou veľkosťou (napr. /proc) sa čítajú len po blokoch
+    if size and hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                sent = os.copy_file_range(src_fd, dst_fd, size - copied, copied, copied)
+                if not sent:
+                    break
+                copied += sent
+            else:
+                return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    if size and hasattr(os, "sendfile"):
+        try:
+            os.lseek(dst_fd, copied, os.SEEK_SET)
+            while copied < size:
+                sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if not sent:
+                    break
+                copied += sent
+            else:
+                return "sendfile"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst, chunk_size)
+    return "buffered"
+
+
+class FolderSync:
+    """Jednosmerná synchronizácia zdroj -> cieľ, ktorá kopíruje len zmenené súbory.
+
+    Súbor sa preskočí, ak má v cieli rovnakú veľkosť a čas úpravy (na
+    sekundy, ako rsync). Pri rovnakej veľkosti a inom čase sa porovnajú
+    hashe po blokoch - hashe zdroja sa pamätajú v manifeste synchronizácie,
+    takže nezmenený súbor sa hashuje len raz. Zmenené súbory sa kopírujú na
+    obmedzenom pool vlákien cez dočasný súbor a `os.replace` (prerušená
+    synchronizácia nenechá v cieli polovičný súbor).
+    """
+
+    def __init__(self, manifest_dir: Optional[str] = None, workers: int = 4, chunk_size: int = 1024 * 1024,
+                 delete_orphans: bool = False):
+        self.manifest_dir = manifest_dir
+        self.workers = max(1, workers)
+        self.chunk_size = max(4096, chunk_size)
+        self.delete_orphans = delete_orphans
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "FolderSync":
+        """Vytvorí synchronizáciu podľa sekcie 'folder_sync'"""
+        sync_settings = settings.get("folder_sync", {})
+        return cls(
+            manifest_dir=sync_settings.get("manifest_dir"),
+            workers=sync_settings.get("workers", 4),
+            chunk_size=int(sync_settings.get("chunk_size_kb", 1024) * 1024),
+            delete_orphans=sync_settings.get("delete_orphans", False)
+        )
+
+    # MANIFEST
+    def manifest_path(self, source: str, target: str) -> Optional[str]:
+        if not self.manifest_dir:
+            return None
+        key = hashlib.sha1(f"{source}\n{target}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.manifest_dir, f"sync_{key}.json")
+
+    def load_manifest(self, source: str, target: str) -> Dict[str, Any]:
+        """Stav súborov po poslednej synchronizácii tejto dvojice zložiek"""
+        path = self.manifest_path(source, target)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+                if manifest.get("source") == source and manifest.get("target") == target:
+                    return manifest
+            except (OSError, ValueError):
+                pass
+        return {"source": source, "target": target, "files": {}}
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        path = self.manifest_path(manifest["source"], manifest["target"])
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    # PREHĽAD ZLOŽIEK
+    @staticmethod
+    def scan_tree(root: str) -> Tuple[Dict[str, os.stat_result], List[str]]:
+        """Bežné súbory (relatívna cesta -> stat) a podzložky stromu"""
+        files: Dict[str, os.stat_result] = {}
+        directories: List[str] = []
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(root, relative) if relative else root)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    entry_relative = os.path.join(relative, entry.name) if relative else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(entry_relative)
+                            stack.append(entry_relative)
+                        elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(PART_SUFFIX):
+                            files[entry_relative] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+        return files, directories
+
+    def file_hash(self, path: str) -> str:
+        """Hash obsahu po blokoch (blake2b)"""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    # SYNCHRONIZÁCIA
+    def sync(self, source: str, target: str, delete_orphans: Optional[bool] = None,
+             dry_run: bool = False) -> Dict[str, Any]:
+        """Synchronizuje `source` do `target` a vráti správu o prenose"""
+        source = os.path.abspath(os.path.expanduser(source))
+        target = os.path.abspath(os.path.expanduser(target))
+        if not os.path.isdir(source):
+            raise NotADirectoryError(source)
+        if target == source or target.startswith(source.rstrip(os.sep) + os.sep):
+            raise ValueError("Cieľová zložka nesmie byť vo zdrojovej")
+        if source.startswith(target.rstrip(os.sep) + os.sep):
+            # Prechod cieľa by zahrnul zdroj a mazanie navyše by ho zmazalo
+            raise ValueError("Zdrojová zložka nesmie byť v cieľovej")
+        delete_orphans = self.delete_orphans if delete_orphans is None else delete_orphans
+
+        start = time.perf_counter()
+        report: Dict[str, Any] = {
+            'source': source, 'target': target, 'files': 0, 'copied': 0, 'skipped': 0, 'hashed': 0,
+            'deleted': 0, 'bytes_transferred': 0, 'bytes_skipped': 0, 'methods': {}, 'errors': [],
+            'dry_run': dry_run,
+        }
+        manifest = self.load_manifest(source, target)
+        known = manifest.get("files", {})
+        source_files, source_dirs = self.scan_tree(source)
+        target_files, target_dirs = self.scan_tree(target) if os.path.isdir(target) else ({}, [])
+        report['files'] = len(source_files)
+
+        if not dry_run:
+            os.makedirs(target, exist_ok=True)
+            for directory in sorted(source_dirs):
+                target_directory = os.path.join(target, directory)
+                if directory in target_files:
+                    os.unlink(target_directory)  # v zdroji je na tomto mieste zložka
+                os.makedirs(target_directory, exist_ok=True)
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        lock = threading.Lock()
+
+        def process(relative: str):
+            source_stat = source_files[relative]
+            entry = {'size': source_stat.st_size, 'mtime_ns': source_stat.st_mtime_ns}
+            try:
+                copy, hashed = self._needs_copy(source, target, relative, source_stat,
+                                                target_files.get(relative), known.get(relative), entry)
+                method = None
+                if copy and not dry_run:
+                    method = self._copy(os.path.join(source, relative), os.path.join(target, relative), source_stat)
+                with lock:
+                    report['hashed'] += hashed
+                    if copy:
+                        report['copied'] += 1
+                        report['bytes_transferred'] += source_stat.st_size
+                        if method:
+                            report['methods'][method] = report['methods'].get(method, 0) + 1
+                    else:
+                        report['skipped'] += 1
+                        report['bytes_skipped'] += source_stat.st_size
+                    entries[relative] = entry
+            except OSError as e:
+                with lock:
+                    report['errors'].append(f"{relative}: {e}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                   thread_name_prefix="FolderSync") as executor:
+            list(executor.map(process, source_files))
+
+        if delete_orphans:
+            self._delete_orphans(target, source_files, source_dirs, target_files, target_dirs, report, dry_run)
+
+        if not dry_run:
+            manifest['files'] = entries
+            manifest['synced_at'] = time.time()
+            try:
+                self._write_manifest(manifest)
+            except OSError as e:
+                report['errors'].append(f"manifest: {e}")
+        report['duration_s'] = round(time.perf_counter() - start, 3)
+        return report
+
+    def _needs_copy(self, source: str, target: str, relative: str, source_stat: os.stat_result,
+                    target_stat: Optional[os.stat_result], known: Optional[Dict[str, Any]],
+                    entry: Dict[str, Any]) -> Tuple[bool, int]:
+        """(treba kopírovať, počet hashovaných súborov) - do `entry` doplní hash zdroja, ak je známy"""
+        source_unchanged = bool(known) and known.get('size') == source_stat.st_size \
+            and known.get('mtime_ns') == source_stat.st_mtime_ns
+        if source_unchanged and known.get('hash'):
+            entry['hash'] = known['hash']
+        if target_stat is None or target_stat.st_size != source_stat.st_size:
+            return True, 0
+        if int(target_stat.st_mtime) == int(source_stat.st_mtime):
+            return False, 0
+
+        # Rovnaká veľkosť, iný čas - rozhodne obsah
+        hashed = 0
+        if 'hash' not in entry:
+            entry['hash'] = self.file_hash(os.path.join(source, relative))
+            hashed += 1
+        target_path = os.path.join(target, relative)
+        target_hash = self.file_hash(target_path)
+        hashed += 1
+        if target_hash != entry['hash']:
+            return True, hashed
+        # Obsah je rovnaký - zjednotí čas, nabudúce stačí porovnať stat
+        try:
+            os.utime(target_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        except OSError:
+            pass
+        return False, hashed
+
+    def _copy(self, source_path: str, target_path: str, source_stat: os.stat_result) -> str:
+        """Kopíruje cez dočasný súbor a atomicky ho premenuje na cieľ"""
+        temp_path = target_path + PART_SUFFIX
+        try:
+            with open(source_path, "rb") as fsrc, open(temp_path, "wb") as fdst:
+                method = copy_contents(fsrc, fdst, self.chunk_size, source_stat.st_size)
+            shutil.copystat(source_path, temp_path)
+            if os.path.isdir(target_path) and not os.path.islink(target_path):
+                shutil.rmtree(target_path)
+            os.replace(temp_path, target_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return method
+
+    @staticmethod
+    def _delete_orphans(target, source_files, source_dirs, target_files, target_dirs, report, dry_run):
+        """Zmaže v cieli súbory a zložky, ktoré už nie sú vo zdroji"""
+        source_dir_set = set(source_dirs)
+        for relative in target_files:
+            if relative in source_files:
+                continue
+            report['deleted'] += 1
+            if not dry_run:
+                try:
+                    os.unlink(os.path.join(target, relative))
+                except OSError as e:
+                    report['errors'].append(f"{relative}: {e}")
+        # Najhlbšie zložky prvé, aby boli prázdne
+        for relative in sorted(target_dirs, key=lambda item: item.count(os.sep), reverse=True):
+            if relative in source_dir_set or relative in source_files:
+                continue
+            report['deleted'] += 1
+            if not dry_run:
+                try:
+                    os.rmdir(os.path.join(target, relative))
+                except OSError as e:
+                    report['errors'].append(f"{relative}: {e}")
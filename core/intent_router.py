@@ -0,0 +1,166 @@
+# core/intent_router.py - Rýchle smerovanie príkazov malým modelom
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from .command_router import normalize_command
+
+INTENT_PROMPT = """Si rýchly klasifikátor príkazov osobného asistenta. Odpovedz iba JSON objektom.
+Možnosti:
+- {{"action": "module", "module": "<názov>"}} - príkaz patrí jednému z modulov nižšie
+- {{"action": "answer", "answer": "<krátka odpoveď>"}} - jednoduchá faktická otázka alebo pozdrav, ktorý vieš zodpovedať jednou-dvoma vetami
+- {{"action": "escalate"}} - všetko ostatné (dlhšie úlohy, kód, rozbor, nadväzovanie na predchádzajúcu konverzáciu, neistota)
+
+Moduly:
+{modules}"""
+
+ACTIONS = ('module', 'answer', 'escalate')
+# Pamätajú sa len smerovacie rozhodnutia - odpoveď vznikla bez kontextu konverzácie
+# (otázky na čas, "a zajtra?") a pri opakovaní by sa prehrávala stále dookola
+CACHED_ACTIONS = ('module', 'escalate')
+
+
+class IntentRouter:
+    """Dvojstupňové smerovanie: malý model rozhodne o zámere príkazu.
+
+    Príkaz, ktorý nezachytil router fráz, pošle malému modelu, ktorý ho
+    priradí modulu, sám krátko odpovie, alebo ho posunie veľkému modelu.
+    Smerovanie na modul alebo eskalácia sa pamätá podľa normalizovaného
+    príkazu, takže opakované príkazy model vôbec nevolajú; krátke odpovede
+    sa nepamätajú. Pri chybe alebo prekročení času sa vždy
+    eskaluje - rýchla cesta nesmie zhoršiť odpoveď.
+    """
+
+    def __init__(self, model: str, max_prompt_chars: int = 160, max_answer_chars: int = 300,
+                 timeout: float = 3.0, cache_entries: int = 512, keep_alive: str = "30m"):
+        self.model = model
+        self.max_prompt_chars = max_prompt_chars
+        self.max_answer_chars = max_answer_chars
+        self.timeout = timeout
+        self.cache_entries = max(0, int(cache_entries))
+        self.keep_alive = keep_alive
+
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._modules_key = None
+        self._modules_text = ""
+        self.stats = {'cache_hits': 0, 'module': 0, 'answer': 0, 'escalate': 0, 'errors': 0, 'skipped': 0}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["IntentRouter"]:
+        """Vytvorí router podľa sekcie 'ai'; bez `intent_model` vráti None (rýchla cesta vypnutá)"""
+        ai_settings = settings.get("ai", {})
+        model = ai_settings.get("intent_model")
+        if not model:
+            return None
+        return cls(
+            model,
+            max_prompt_chars=ai_settings.get("intent_max_prompt_chars", 160),
+            max_answer_chars=ai_settings.get("intent_max_answer_chars", 300),
+            timeout=ai_settings.get("intent_timeout", 3.0),
+            cache_entries=ai_settings.get("intent_cache_entries", 512),
+            keep_alive=ai_settings.get("keep_alive", "30m")
+        )
+
+    def _describe_modules(self, modules: Dict[str, Any]) -> str:
+        """Zoznam modulov pre prompt - mení sa len pri zmene modulov (stabilný prefix)"""
+        key = tuple(sorted(modules))
+        if key != self._modules_key:
+            lines = []
+            for name in key:
+                module = modules[name]
+                commands = list(getattr(module, 'supported_commands', None) or [])[:6]
+                doc = (getattr(module, '__doc__', None) or "").strip().split("\n")[0]
+                description = ", ".join(commands) or doc or "bez popisu"
+                lines.append(f"- {name}: {description}")
+            self._modules_text = "\n".join(lines) or "(žiadne)"
+            self._modules_key = key
+        return self._modules_text
+
+    # CACHE
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            decision = self._cache.get(key)
+            if decision is not None:
+                self._cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+            return decision
+
+    def _remember(self, key: str, decision: Dict[str, Any]):
+        if not self.cache_entries or decision['action'] not in CACHED_ACTIONS:
+            return
+        with self._lock:
+            self._cache[key] = decision
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    # ROZHODNUTIE
+    def _parse_decision(self, content: str, modules: Dict[str, Any]) -> Dict[str, Any]:
+        """Overí odpoveď malého modelu; čokoľvek neplatné znamená eskaláciu"""
+        try:
+            data = json.loads(content)
+        except (ValueError, TypeError):
+            return {'action': 'escalate'}
+        if not isinstance(data, dict) or data.get('action') not in ACTIONS:
+            return {'action': 'escalate'}
+
+        if data['action'] == 'module':
+            module = data.get('module')
+            if module in modules:
+                return {'action': 'module', 'module': module}
+        elif data['action'] == 'answer':
+            answer = str(data.get('answer') or "").strip()
+            if answer and len(answer) <= self.max_answer_chars:
+                return {'action': 'answer', 'answer': answer}
+        return {'action': 'escalate'}
+
+    async def route(self, client, command: str, modules: Dict[str, Any]) -> Dict[str, Any]:
+        """Vráti rozhodnutie {'action': 'module'|'answer'|'escalate', ...} pre príkaz"""
+        if len(command) > self.max_prompt_chars:
+            # Dlhé požiadavky sú takmer vždy práca pre veľký model
+            self.stats['skipped'] += 1
+            return {'action': 'escalate'}
+
+        key = normalize_command(command)
+        decision = self._cached(key)
+        if decision is not None and (decision['action'] != 'module' or decision['module'] in modules):
+            return decision
+
+        messages = [
+            {'role': 'system', 'content': INTENT_PROMPT.format(modules=self._describe_modules(modules))},
+            {'role': 'user', 'content': command}
+        ]
+        try:
+            response = await asyncio.wait_for(
+                client.chat(
+                    model=self.model,
+                    messages=messages,
+                    format='json',
+                    options={'temperature': 0, 'num_predict': 120},
+                    keep_alive=self.keep_alive
+                ),
+                timeout=self.timeout
+            )
+            decision = self._parse_decision(response['message']['content'], modules)
+        except Exception as e:
+            print(f"⚠️  Intent model zlyhal, používam veľký model: {e}")
+            self.stats['errors'] += 1
+            return {'action': 'escalate'}
+
+        self.stats[decision['action']] += 1
+        self._remember(key, decision)
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['cache_size'] = len(self._cache)
+        stats['model'] = self.model
+        return stats
@@ -0,0 +1,280 @@
+# core/long_term_memory.py - Dlhodobá pamäť naprieč reláciami
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+from .command_router import normalize_command
+from .semantic_router import embed_texts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LongTermMemory:
+    """Vyhľadávacia pamäť minulých výmen (retrieval) uložená na disku.
+
+    Výmeny sa pripisujú do append-only JSONL súboru a ich embeddingy do
+    binárneho súboru float32 v rovnakom poradí (riadok i = vektor i).
+    Pri štarte sa načítajú do NumPy matice; chýbajúce embeddingy (pád,
+    výpadok Ollama) sa dopočítajú na pozadí. Indexovanie nových výmen beží
+    v event loope na pozadí a nikdy nezdrží odpoveď; vyhľadanie má pevný
+    časový rozpočet - ak ho prekročí, prompt ide bez spomienok.
+    """
+
+    def __init__(self, directory: str, model: str = "nomic-embed-text", top_k: int = 3,
+                 min_score: float = 0.55, latency_budget: float = 0.3, max_snippet_chars: int = 400,
+                 batch_size: int = 16, query_cache_entries: int = 256):
+        self.directory = directory
+        self.records_path = os.path.join(directory, "long_term_memory.jsonl")
+        self.vectors_path = os.path.join(directory, "long_term_memory.f32")
+        self.meta_path = os.path.join(directory, "long_term_memory.json")
+        self.model = model
+        self.top_k = max(1, int(top_k))
+        self.min_score = min_score
+        self.latency_budget = latency_budget
+        self.max_snippet_chars = max_snippet_chars
+        self.batch_size = max(1, int(batch_size))
+        self.query_cache_entries = max(0, int(query_cache_entries))
+
+        self._records: List[Dict[str, Any]] = []
+        self._matrix = None   # kapacitný buffer (riadky normalizované)
+        self._count = 0       # počet riadkov s embeddingom
+        self._dim: Optional[int] = None
+        self._unsaved: List[Dict[str, Any]] = []  # výmeny čakajúce na zápis a embedding
+        self._indexer: Optional[asyncio.Task] = None
+        self._client = None
+        self._loaded = False
+        self._queries: "OrderedDict[str, Any]" = OrderedDict()
+        self.stats = {'indexed': 0, 'retrievals': 0, 'hits': 0, 'timeouts': 0, 'errors': 0}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], config_dir: str = "config") -> Optional["LongTermMemory"]:
+        """Vytvorí pamäť podľa sekcie 'long_term_memory'; bez NumPy alebo pri vypnutí vráti None"""
+        ltm_settings = settings.get("long_term_memory", {})
+        if np is None or not ltm_settings.get("enabled", True):
+            return None
+        return cls(
+            directory=ltm_settings.get("directory", config_dir),
+            model=ltm_settings.get("embed_model", settings.get("semantic", {}).get("embed_model", "nomic-embed-text")),
+            top_k=ltm_settings.get("top_k", 3),
+            min_score=ltm_settings.get("min_score", 0.55),
+            latency_budget=ltm_settings.get("latency_budget_ms", 300) / 1000.0,
+            max_snippet_chars=ltm_settings.get("max_snippet_chars", 400)
+        )
+
+    # NAČÍTANIE
+    def _load_files(self):
+        """Načíta záznamy a embeddingy z disku (volať mimo event loopu)"""
+        records = []
+        try:
+            with open(self.records_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # neúplný posledný riadok po páde
+        except OSError:
+            pass
+
+        vectors = None
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('model') == self.model and meta.get('dim'):
+                dim = int(meta['dim'])
+                raw = np.fromfile(self.vectors_path, dtype=np.float32)
+                rows = min(len(raw) // dim, len(records))
+                vectors = raw[:rows * dim].reshape(rows, dim)
+                if len(raw) != rows * dim:
+                    # Neúplný zápis po páde - zarovnaj súbor na celé riadky
+                    with open(self.vectors_path, 'r+b') as f:
+                        f.truncate(rows * dim * 4)
+        except (OSError, ValueError):
+            vectors = None
+
+        if vectors is None:
+            # Embeddingy chýbajú alebo sú z iného modelu - všetko sa dopočíta
+            try:
+                if os.path.exists(self.vectors_path):
+                    os.remove(self.vectors_path)
+            except OSError as e:
+                print(f"⚠️  Dlhodobá pamäť: nepodarilo sa zmazať staré embeddingy: {e}")
+        return records, vectors
+
+    async def start(self, client):
+        """Načíta pamäť na pozadí a dopočíta chýbajúce embeddingy (volať v event loope)"""
+        if self._loaded:
+            return
+        records, vectors = await asyncio.get_running_loop().run_in_executor(None, self._load_files)
+        self._loaded = True
+        self._records = records + self._records
+        if vectors is not None and len(vectors):
+            self._dim = vectors.shape[1]
+            self._append_vectors(vectors)
+        self._client = client
+        # Záznamy bez embeddingu (a výmeny pridané počas načítania) zaindexuj
+        self._ensure_indexer()
+        print(f"🗄️  Dlhodobá pamäť: {len(self._records)} výmen, zaindexovaných {self._count}")
+
+    # INDEXOVANIE
+    @staticmethod
+    def format_record(record: Dict[str, Any]) -> str:
+        return f"Používateľ: {record['user']}\nAsistent: {record['ai']}"
+
+    def add(self, client, user_input: str, ai_response: str):
+        """Zaradí výmenu na uloženie a zaindexovanie na pozadí (volať v event loope)"""
+        record = {'timestamp': time.time(), 'user': user_input, 'ai': ai_response[:2000]}
+        self._records.append(record)
+        self._unsaved.append(record)
+        self._client = client
+        self._ensure_indexer()
+
+    def _ensure_indexer(self):
+        if not self._loaded:
+            return
+        if self._indexer is None or self._indexer.done():
+            self._indexer = asyncio.ensure_future(self._index_pending())
+
+    async def _index_pending(self):
+        loop = asyncio.get_running_loop()
+        # Najprv zapíš nové výmeny do JSONL (aj keď embedding zlyhá, výmena sa nestratí)
+        while self._unsaved:
+            batch, self._unsaved = self._unsaved, []
+            await loop.run_in_executor(None, self._append_records, batch)
+
+        while self._count < len(self._records):
+            batch = self._records[self._count:self._count + self.batch_size]
+            try:
+                vectors = await embed_texts(self._client, self.model, [self.format_record(r) for r in batch])
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️  Dlhodobá pamäť: indexovanie zlyhalo, skúsi sa pri ďalšej výmene: {e}")
+                return
+            matrix = self._normalize_rows(vectors)
+            if self._dim is None:
+                self._dim = matrix.shape[1]
+                await loop.run_in_executor(None, self._write_meta)
+            self._append_vectors(matrix)
+            await loop.run_in_executor(None, self._append_vector_file, matrix)
+            self.stats['indexed'] += len(batch)
+
+            if self._unsaved:
+                batch, self._unsaved = self._unsaved, []
+                await loop.run_in_executor(None, self._append_records, batch)
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.records_path, 'a', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"⚠️  Dlhodobá pamäť: zápis výmeny zlyhal: {e}")
+
+    def _append_vector_file(self, matrix):
+        try:
+            with open(self.vectors_path, 'ab') as f:
+                matrix.astype(np.float32).tofile(f)
+        except OSError as e:
+            print(f"⚠️  Dlhodobá pamäť: zápis embeddingu zlyhal: {e}")
+
+    def _write_meta(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'model': self.model, 'dim': self._dim}, f)
+        except OSError as e:
+            print(f"⚠️  Dlhodobá pamäť: zápis metadát zlyhal: {e}")
+
+    @staticmethod
+    def _normalize_rows(vectors):
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _append_vectors(self, matrix):
+        """Pridá riadky do matice s rezervou (amortizovane bez kopírovania celej matice)"""
+        needed = self._count + len(matrix)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = max(needed, 2 * (0 if self._matrix is None else len(self._matrix)), 64)
+            grown = np.empty((capacity, matrix.shape[1]), dtype=np.float32)
+            if self._matrix is not None:
+                grown[:self._count] = self._matrix[:self._count]
+            self._matrix = grown
+        self._matrix[self._count:needed] = matrix
+        self._count = needed
+
+    # VYHĽADÁVANIE
+    async def _query_vector(self, client, query: str):
+        key = normalize_command(query)
+        vector = self._queries.get(key)
+        if vector is not None:
+            self._queries.move_to_end(key)
+            return vector
+        vector = self._normalize_rows(await embed_texts(client, self.model, [query]))[0]
+        if self.query_cache_entries:
+            self._queries[key] = vector
+            while len(self._queries) > self.query_cache_entries:
+                self._queries.popitem(last=False)
+        return vector
+
+    async def retrieve(self, client, query: str, exclude: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Vráti najrelevantnejšie minulé výmeny; po prekročení časového rozpočtu prázdny zoznam"""
+        if not self._count:
+            return []
+        self.stats['retrievals'] += 1
+        try:
+            vector = await asyncio.wait_for(self._query_vector(client, query), timeout=self.latency_budget)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            return []
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"⚠️  Dlhodobá pamäť: vyhľadávanie zlyhalo: {e}")
+            return []
+
+        count = self._count
+        if vector.shape[0] != self._matrix.shape[1]:
+            return []
+        scores = self._matrix[:count] @ vector
+        k = min(self.top_k + len(exclude or ()), count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for row in top:
+            score = float(scores[row])
+            if score < self.min_score:
+                break
+            record = self._records[row]
+            if exclude and record['user'] in exclude:
+                continue
+            results.append({'user': record['user'], 'ai': record['ai'],
+                            'timestamp': record['timestamp'], 'score': score})
+            if len(results) >= self.top_k:
+                break
+        if results:
+            self.stats['hits'] += 1
+        return results
+
+    def format_snippets(self, results: List[Dict[str, Any]]) -> str:
+        """Spomienky ako text do promptu"""
+        lines = []
+        for result in results:
+            when = time.strftime("%d.%m.%Y", time.localtime(result['timestamp']))
+            text = f"[{when}] Používateľ: {result['user']} | Asistent: {result['ai']}"
+            lines.append("- " + text[:self.max_snippet_chars])
+        return "\n".join(lines)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['records'] = len(self._records)
+        stats['vectors'] = self._count
+        stats['loaded'] = self._loaded
+        return stats
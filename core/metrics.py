@@ -0,0 +1,175 @@
+# core/metrics.py - Register metrík výkonu asistenta
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple
+
+# Hranice košov latencie v ms (posledný kôš je nekonečno)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Counter:
+    """Monotónne počítadlo"""
+
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Histogram s pevnými košmi - konštantná pamäť, kvantily odhadom v rámci koša"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'min', 'max', '_lock')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Odhad kvantilu lineárnou interpoláciou v koši (v ms), orezaný na pozorované min/max"""
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            low, high = self.min, self.max
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = max(self.bounds[index - 1] if index > 0 else 0.0, low)
+                upper = min(self.bounds[index] if index < len(self.bounds) else high, high)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return float(high)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class MetricsRegistry:
+    """Register počítadiel a histogramov so štítkami (modul, model, vrstva cache...).
+
+    Metriky sa vytvárajú pri prvom použití a už sa nemažú, takže UI ich môže
+    čítať priebežne bez zámkov nad celým registrom.
+    """
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._counters: Dict[str, Dict[LabelKey, Counter]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+
+    def counter(self, name: str, **labels) -> Counter:
+        key = label_key(labels)
+        series = self._counters.get(name)
+        metric = series.get(key) if series is not None else None
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(name, {}).setdefault(key, Counter())
+        return metric
+
+    def histogram(self, name: str, **labels) -> Histogram:
+        key = label_key(labels)
+        series = self._histograms.get(name)
+        metric = series.get(key) if series is not None else None
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(name, {}).setdefault(key, Histogram(self.buckets_ms))
+        return metric
+
+    def inc(self, name: str, amount: int = 1, **labels):
+        self.counter(name, **labels).inc(amount)
+
+    def observe(self, name: str, value_ms: float, **labels):
+        self.histogram(name, **labels).observe(value_ms)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Zmeria blok: histogram `<name>_ms`, počítadlá `<name>_total` a `<name>_errors`"""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            # Zrušenie (stop/cancel) nie je chyba modulu ani modelu
+            if isinstance(e, Exception):
+                self.inc(f"{name}_errors", **labels)
+            raise
+        finally:
+            self.observe(f"{name}_ms", (time.perf_counter() - start) * 1000, **labels)
+            self.inc(f"{name}_total", **labels)
+
+    # ČÍTANIE
+    def counter_value(self, name: str, **labels) -> int:
+        metric = self._counters.get(name, {}).get(label_key(labels))
+        return metric.value if metric is not None else 0
+
+    def summary(self, name: str) -> List[Dict[str, Any]]:
+        """Súhrn merania `timer(name)` pre každú sadu štítkov - počty, chyby, p50/p95/p99"""
+        with self._lock:
+            series = list(self._histograms.get(f"{name}_ms", {}).items())
+        rows = []
+        for key, histogram in series:
+            total = self._counters.get(f"{name}_total", {}).get(key)
+            errors = self._counters.get(f"{name}_errors", {}).get(key)
+            count = total.value if total is not None else histogram.count
+            rows.append({
+                'labels': dict(key),
+                'count': count,
+                'errors': errors.value if errors is not None else 0,
+                'p50': histogram.quantile(0.50),
+                'p95': histogram.quantile(0.95),
+                'p99': histogram.quantile(0.99),
+                'mean': histogram.mean
+            })
+        return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Všetky metriky ako slovník (napr. na export)"""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+        return {
+            'uptime_s': time.monotonic() - self.started_at,
+            'counters': {
+                name: [{'labels': dict(key), 'value': metric.value} for key, metric in series.items()]
+                for name, series in counters.items()
+            },
+            'histograms': {
+                name: [{'labels': dict(key), 'count': metric.count, 'sum': metric.total,
+                        'buckets': list(zip(list(metric.bounds) + ['inf'], metric.counts))}
+                       for key, metric in series.items()]
+                for name, series in histograms.items()
+            }
+        }
@@ -0,0 +1,211 @@
+# core/module_manifest.py - Manifest modulov pre lenivé načítanie
+import ast
+import asyncio
+import json
+import os
+import threading
+from typing import Dict, Any, Callable, List, Optional
+
+
+def default_class_name(module_name: str) -> str:
+    """Konvencia názvu hlavnej triedy modulu (file_manager -> FileManager)"""
+    return module_name.title().replace('_', '')
+
+
+# Atribúty triedy BasePlugin, ktoré sa čítajú staticky
+PLUGIN_ATTRIBUTES = ('max_concurrency', 'expected_cost', 'warmup_on_start')
+
+
+def _literal_commands(node) -> Optional[List[str]]:
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return None
+    if isinstance(value, (list, tuple, set)) and all(isinstance(v, str) for v in value):
+        return list(value)
+    return None
+
+
+def scan_module_file(module_path: str) -> Optional[Dict[str, Any]]:
+    """Zistí triedu, príkazy a popis modulu zo zdrojového kódu bez jeho importu.
+
+    Modul môže triedu a príkazy deklarovať explicitne cez `MODULE_CLASS`
+    a `MODULE_COMMANDS`, inak sa hľadá trieda podľa konvencie názvu a jej
+    `supported_commands` (atribút triedy alebo `self.supported_commands = [...]`
+    v `__init__`). Ak príkazy nie sú literál, vráti sa `commands: None`.
+    `MODULE_HEAVY = True` (alebo `expected_cost = 'cpu'` pluginu) označí modul,
+    ktorý sa spúšťa v samostatnom procese.
+    """
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    try:
+        with open(module_path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=module_path)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"⚠️  Manifest: nepodarilo sa analyzovať {module_path}: {e}")
+        return None
+
+    class_name = default_class_name(module_name)
+    commands = None
+    heavy = False
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            target = node.targets[0].id
+            if target == 'MODULE_CLASS' and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                class_name = node.value.value
+            elif target == 'MODULE_COMMANDS':
+                commands = _literal_commands(node.value)
+            elif target == 'MODULE_HEAVY' and isinstance(node.value, ast.Constant):
+                heavy = node.value.value is True
+
+    class_node = next(
+        (node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == class_name),
+        None
+    )
+    if class_node is None:
+        return {'class_name': class_name, 'commands': None, 'doc': None, 'heavy': heavy, 'found': False}
+
+    # Statické atribúty pluginu (BasePlugin) - limity a cena bez importu
+    plugin = {}
+    for item in class_node.body:
+        if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name) \
+                and item.targets[0].id in PLUGIN_ATTRIBUTES:
+            try:
+                plugin[item.targets[0].id] = ast.literal_eval(item.value)
+            except (ValueError, SyntaxError, TypeError):
+                pass
+    if plugin.get('expected_cost') == 'cpu':
+        heavy = True
+
+    if commands is None:
+        for item in class_node.body:
+            if isinstance(item, ast.Assign) and any(
+                    isinstance(t, ast.Name) and t.id in ('supported_commands', 'commands') for t in item.targets):
+                commands = _literal_commands(item.value)
+            elif isinstance(item, ast.FunctionDef) and item.name == '__init__':
+                for stmt in ast.walk(item):
+                    if isinstance(stmt, ast.Assign) and any(
+                            isinstance(t, ast.Attribute) and t.attr == 'supported_commands'
+                            and isinstance(t.value, ast.Name) and t.value.id == 'self'
+                            for t in stmt.targets):
+                        commands = _literal_commands(stmt.value)
+
+    return {
+        'class_name': class_name,
+        'commands': commands,
+        'doc': ast.get_docstring(class_node),
+        'heavy': heavy,
+        'max_concurrency': plugin.get('max_concurrency', 0) if isinstance(plugin.get('max_concurrency'), int) else 0,
+        'warmup_on_start': plugin.get('warmup_on_start') is True,
+        'found': True
+    }
+
+
+class ModuleManifest:
+    """Cache výsledkov skenovania modulov uložená v JSON.
+
+    Záznam je platný, kým sa nezmení veľkosť a čas úpravy súboru, takže
+    pri štarte sa zdrojáky modulov väčšinou ani neparsujú.
+    """
+
+    VERSION = 3
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data.get('modules', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, module_path: str) -> Optional[Dict[str, Any]]:
+        """Vráti manifest modulu (z cache alebo nového skenovania)"""
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            return None
+
+        key = os.path.abspath(module_path)
+        entry = self.entries.get(key)
+        if entry and entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+            return entry
+
+        entry = scan_module_file(module_path)
+        if entry is None:
+            return None
+        entry.update({'mtime': stat.st_mtime, 'size': stat.st_size})
+        self.entries[key] = entry
+        self._dirty = True
+        return entry
+
+    def save(self):
+        """Uloží manifest, ak sa zmenil"""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'modules': self.entries}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️  Manifest modulov sa nepodarilo uložiť: {e}")
+
+
+class LazyModule:
+    """Zástupca modulu, ktorý sa importuje až pri prvom príkaze, ktorý mu patrí.
+
+    Do routera poskytuje `supported_commands` z manifestu, takže pri štarte
+    sa nenačítavajú ťažké závislosti (paramiko, Google API, ...).
+    """
+
+    def __init__(self, module_name: str, module_path: str, manifest: Dict[str, Any],
+                 loader: Callable[[str, str, str], Any]):
+        self.module_name = module_name
+        self.module_path = module_path
+        self.class_name = manifest['class_name']
+        self.supported_commands = list(manifest.get('commands') or [])
+        self.__doc__ = manifest.get('doc') or None
+        self._loader = loader
+        self._instance = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def load(self):
+        """Importuje a inicializuje skutočný modul (len raz)"""
+        if self._instance is None:
+            with self._load_lock:
+                if self._instance is None:
+                    instance = self._loader(self.module_name, self.module_path, self.class_name)
+                    if instance is None:
+                        raise ImportError(f"Modul {self.module_name} sa nepodarilo načítať")
+                    self._instance = instance
+        return self._instance
+
+    def can_handle(self, command: str) -> bool:
+        return any(cmd in command.lower() for cmd in self.supported_commands)
+
+    async def handle(self, command: str) -> str:
+        if self._instance is None:
+            # Import môže trvať (ťažké závislosti) - neblokuj event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.load)
+        return await self._instance.handle(command)
+
+    def __getattr__(self, name):
+        # Volané len pre atribúty, ktoré zástupca nemá - deleguj na skutočný modul
+        if name.startswith('__') or name in ('_instance', '_loader', '_load_lock'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
@@ -0,0 +1,245 @@
+# core/module_watcher.py - Hot reload modulov bez reštartu asistenta
+import concurrent.futures
+import importlib.util
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from .module_manifest import LazyModule
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+def module_name_for(path: Optional[str]) -> Optional[str]:
+    """Názov modulu zo súboru v priečinku modulov (None pre iné súbory)"""
+    if not path:
+        return None
+    filename = os.path.basename(path)
+    if not filename.endswith(".py") or filename == "__init__.py" or filename.startswith("."):
+        return None
+    return filename[:-3]
+
+
+class _ModulesDirHandler(FileSystemEventHandler):
+    """Udalosti watchdog -> naplánované znovunačítanie dotknutých modulov"""
+
+    def __init__(self, watcher: "ModuleWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if getattr(event, 'is_directory', False):
+            return
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            module_name = module_name_for(path)
+            if module_name:
+                self.watcher.schedule(module_name)
+
+
+class ModuleWatcher:
+    """Sleduje priečinok modulov a vymieňa zmenené moduly za behu.
+
+    Vytvorený/zmenený súbor sa importuje vo vlákne na pozadí a nová inštancia
+    sa do routera vloží až po úspešnej inicializácii - dovtedy (aj pri chybe)
+    ďalej slúži stará. Výmena prebehne v event loope asistenta, kde beží aj
+    smerovanie, takže príkaz vždy vidí buď starý, alebo nový modul. Zmazaný
+    súbor modul odregistruje. Bez watchdog sa priečinok kontroluje periodicky.
+    """
+
+    def __init__(self, assistant, modules_dir: str = "modules", debounce: float = 0.2,
+                 poll_interval: float = 1.0, enabled: bool = True):
+        self.assistant = assistant
+        self.enabled = enabled
+        self.modules_dir = modules_dir
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ModuleReload")
+        self._timers: Dict[str, threading.Timer] = {}
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+        self._poller: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.stats = {'reloads': 0, 'added': 0, 'removed': 0, 'failed': 0, 'last_reload_ms': None}
+
+    @classmethod
+    def from_settings(cls, assistant, settings: Dict[str, Any]) -> "ModuleWatcher":
+        """Vytvorí watcher podľa sekcie 'hot_reload' (vypnutý nesleduje priečinok, ručný reload funguje)"""
+        reload_settings = settings.get("hot_reload", {})
+        return cls(
+            assistant,
+            modules_dir=reload_settings.get("modules_dir", "modules"),
+            debounce=reload_settings.get("debounce_ms", 200) / 1000,
+            poll_interval=reload_settings.get("poll_interval", 1.0),
+            enabled=reload_settings.get("enabled", True)
+        )
+
+    # ŠTART / STOP
+    def start(self):
+        """Zapamätá si aktuálny stav súborov a začne sledovať zmeny"""
+        self._signatures = self._scan()
+        if not self.enabled:
+            return
+        if WATCHDOG_AVAILABLE:
+            try:
+                observer = Observer()
+                # inotify nesleduje cez symlink - sleduj skutočný priečinok
+                observer.schedule(_ModulesDirHandler(self), os.path.realpath(self.modules_dir), recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+                print(f"👁️  Sledujem zmeny modulov v {self.modules_dir}")
+                return
+            except Exception as e:
+                print(f"⚠️  watchdog sa nepodarilo spustiť ({e}) - kontrolujem periodicky")
+        self._poller = threading.Thread(target=self._poll_loop, name="ModulePoller", daemon=True)
+        self._poller.start()
+        print(f"👁️  Kontrolujem zmeny modulov v {self.modules_dir} každých {self.poll_interval:.1f}s")
+
+    def stop(self):
+        self._stop.set()
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2.0)
+            self._observer = None
+        self._executor.shutdown(wait=False)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Podpis (mtime, veľkosť) každého súboru modulu"""
+        signatures = {}
+        try:
+            with os.scandir(self.modules_dir) as entries:
+                for entry in entries:
+                    module_name = module_name_for(entry.name)
+                    if module_name and entry.is_file():
+                        stat = entry.stat()
+                        signatures[module_name] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return signatures
+
+    def _poll_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            current = self._scan()
+            with self._lock:
+                known = dict(self._signatures)
+                pending = set(self._timers)
+            for module_name in set(current) | set(known):
+                # Naplánovaný reload neodkladaj ďalej - inak by ho krátky interval stále posúval
+                if current.get(module_name) != known.get(module_name) and module_name not in pending:
+                    self.schedule(module_name)
+
+    # ZNOVUNAČÍTANIE
+    def schedule(self, module_name: str):
+        """Naplánuje znovunačítanie po utíchnutí zmien (editor ukladá po častiach)"""
+        if self._stop.is_set():
+            return
+        with self._lock:
+            timer = self._timers.pop(module_name, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.debounce, self._submit, args=(module_name, False))
+            timer.daemon = True
+            self._timers[module_name] = timer
+            timer.start()
+
+    def _submit(self, module_name: str, force: bool):
+        with self._lock:
+            self._timers.pop(module_name, None)
+        try:
+            return self._executor.submit(self._reload, module_name, force)
+        except RuntimeError:
+            return None  # executor už je zastavený
+
+    def reload_module(self, module_name: str) -> concurrent.futures.Future:
+        """Okamžité znovunačítanie (napr. tlačidlo v UI) - Future s výsledkom ako pri `_reload`"""
+        return self._executor.submit(self._reload, module_name, True)
+
+    def _reload(self, module_name: str, force: bool = False) -> str:
+        """Importuje modul nanovo a vymení ho - vráti 'reloaded'/'added'/'removed'/'failed'/'unchanged'"""
+        module_path = os.path.join(self.modules_dir, f"{module_name}.py")
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            with self._lock:
+                self._signatures.pop(module_name, None)
+            if module_name not in self.assistant.modules:
+                return 'unchanged'
+            self._swap(module_name, None)
+            self.stats['removed'] += 1
+            print(f"🗑️  Modul {module_name} odstránený")
+            return 'removed'
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if not force and self._signatures.get(module_name) == signature:
+                return 'unchanged'
+            self._signatures[module_name] = signature
+
+        start = time.perf_counter()
+        old = self.assistant.modules.get(module_name)
+        # Načítaný modul sa importuje hneď, aby sa chyba prejavila pred výmenou;
+        # ešte nenačítaný lenivý modul stačí zaregistrovať podľa nového manifestu
+        eager = old is not None and not (isinstance(old, LazyModule) and not old.loaded)
+        self._invalidate_bytecode(module_path)
+        try:
+            new, module_file = self.assistant._load_module_file(module_name, module_path, eager=eager)
+            self.assistant.module_manifest.save()
+        except Exception as e:
+            print(f"❌ Chyba pri načítaní modulu {module_name}: {e}")
+            new = None
+        if new is None:
+            self.stats['failed'] += 1
+            if old is not None:
+                print(f"⚠️  Modul {module_name} sa nepodarilo znovu načítať - ponechávam predchádzajúcu verziu")
+            return 'failed'
+
+        self._swap(module_name, new, module_file)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats['last_reload_ms'] = round(elapsed_ms, 2)
+        if old is None:
+            self.stats['added'] += 1
+            print(f"➕ Modul {module_name} pridaný ({elapsed_ms:.0f} ms)")
+            return 'added'
+        self.stats['reloads'] += 1
+        print(f"♻️  Modul {module_name} znovu načítaný ({elapsed_ms:.0f} ms)")
+        return 'reloaded'
+
+    def _swap(self, module_name: str, new_instance, module_file: Optional[Dict[str, Any]] = None):
+        """Vymení modul (aj jeho vlastnosti súboru) - register/unregister prebehnú v event loope"""
+        if new_instance is None:
+            self.assistant.unregister_module(module_name)
+        else:
+            self.assistant.register_module(module_name, new_instance, module_file)
+        self.assistant._notify_module_change(module_name, "removed" if new_instance is None else "loaded")
+
+    @staticmethod
+    def _invalidate_bytecode(module_path: str):
+        """Zmaže .pyc - rýchla úprava v tej istej sekunde s rovnakou veľkosťou by inak načítala starý kód"""
+        try:
+            os.remove(importlib.util.cache_from_source(module_path))
+        except (OSError, NotImplementedError, ValueError):
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['enabled'] = self.enabled
+        stats['watching'] = self.modules_dir
+        if not self.enabled:
+            stats['mode'] = 'manual'
+        else:
+            stats['mode'] = 'watchdog' if self._observer is not None else 'polling'
+        return stats
@@ -0,0 +1,363 @@
+# core/ollama_pool.py - Pool Ollama serverov s vyvažovaním záťaže
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Chyby spojenia a servera (5xx, chýbajúci model) sa skúsia na inom serveri,
+    chybné požiadavky (4xx) nie - na inom serveri by dopadli rovnako"""
+    status = getattr(error, 'status_code', None)
+    if status is None or status == -1:
+        return True
+    return status >= 500 or status == 404
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Chyba, po ktorej sa server považuje za nedostupný (nie chyba požiadavky)"""
+    status = getattr(error, 'status_code', None)
+    return status is None or status == -1 or status >= 500
+
+
+class OllamaEndpoint:
+    """Jeden Ollama server v poole - klient, stav a počítadlá"""
+
+    def __init__(self, host: Optional[str], client):
+        self.host = host or "http://localhost:11434"
+        self.client = client
+        self.healthy = True
+        self.outstanding = 0
+        self.latency_ewma = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error: Optional[str] = None
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.healthy = True
+        self.latency_ewma = latency if not self.latency_ewma else 0.8 * self.latency_ewma + 0.2 * latency
+
+    def record_failure(self, error: BaseException):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+        self.healthy = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'host': self.host,
+            'healthy': self.healthy,
+            'outstanding': self.outstanding,
+            'latency_ms': self.latency_ewma * 1000,
+            'requests': self.requests,
+            'failures': self.failures,
+            'last_error': self.last_error
+        }
+
+
+class OllamaPool:
+    """Viac Ollama serverov za rozhraním `ollama.AsyncClient` (chat, generate, list, embed).
+
+    - požiadavka ide na zdravý server s najmenším počtom rozbehnutých požiadaviek,
+    - pri chybe spojenia sa server označí ako nedostupný a požiadavka skúsi ďalší,
+    - periodická kontrola zdravia (`list`) vracia servery späť do hry,
+    - voliteľné hedgovanie: ak prvý server nevráti prvý token do p95 doterajších
+      latencií, rovnaká požiadavka sa pošle aj na druhý a použije sa rýchlejší.
+
+    Prázdny `generate` (načítanie modelu pri warm-up) sa pošle na všetky servery.
+    """
+
+    def __init__(self, hosts: List[Optional[str]], client_factory: Callable[[Optional[str]], Any],
+                 health_interval: float = 15.0, health_timeout: float = 3.0, hedge: bool = False,
+                 hedge_quantile: float = 0.95, hedge_min_samples: int = 10, hedge_min_delay: float = 0.05,
+                 latency_window: int = 200):
+        self.endpoints = [OllamaEndpoint(host, client_factory(host)) for host in (hosts or [None])]
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self._latencies: Dict[str, deque] = {
+            'chat': deque(maxlen=latency_window),
+            'stream': deque(maxlen=latency_window)
+        }
+        self._health_task: Optional[asyncio.Task] = None
+        self.stats = {'requests': 0, 'failovers': 0, 'hedged': 0, 'hedge_wins': 0}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], client_factory: Callable[[Optional[str]], Any]) -> "OllamaPool":
+        """Vytvorí pool podľa sekcie 'ai' (`ollama_hosts`, inak jediný `ollama_host`)"""
+        ai_settings = settings.get("ai", {})
+        hosts = ai_settings.get("ollama_hosts") or [ai_settings.get("ollama_host")]
+        return cls(
+            hosts,
+            client_factory,
+            health_interval=ai_settings.get("health_interval", 15.0),
+            hedge=ai_settings.get("hedge_requests", False),
+            hedge_quantile=ai_settings.get("hedge_quantile", 0.95)
+        )
+
+    # VÝBER SERVERA
+    def _pick(self, exclude) -> Optional[OllamaEndpoint]:
+        candidates = [e for e in self.endpoints if e not in exclude]
+        if not candidates:
+            return None
+        # Ak nie je zdravý žiadny, skús aj tie označené ako nedostupné
+        healthy = [e for e in candidates if e.healthy] or candidates
+        return min(healthy, key=lambda e: (e.outstanding, e.latency_ewma))
+
+    def hedge_deadline(self, kind: str) -> Optional[float]:
+        """Čas, po ktorom sa požiadavka zopakuje na inom serveri (p95 latencie prvej odpovede)"""
+        samples = self._latencies.get(kind)
+        if not self.hedge or samples is None or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.hedge_quantile * len(ordered)))
+        return max(self.hedge_min_delay, ordered[index])
+
+    # JEDNA POŽIADAVKA NA JEDEN SERVER
+    def _launch(self, endpoint: OllamaEndpoint, start: Callable[[OllamaEndpoint], Any],
+                holds_on_success: bool = False) -> asyncio.Task:
+        """Spustí požiadavku ako task; server sa započíta do záťaže hneď (ešte pred
+        výberom servera pre ďalšie súbežné požiadavky) a uvoľní sa po skončení tasku.
+        Úspešne otvorený stream drží server až do `_close_stream`."""
+        endpoint.outstanding += 1
+        task = asyncio.ensure_future(start(endpoint))
+
+        def release(finished: asyncio.Task):
+            if finished.cancelled() or finished.exception() is not None or not holds_on_success:
+                endpoint.outstanding -= 1
+
+        task.add_done_callback(release)
+        return task
+
+    async def _run_on(self, endpoint: OllamaEndpoint, method: str, kwargs: Dict[str, Any], kind: Optional[str]):
+        start = time.monotonic()
+        try:
+            result = await getattr(endpoint.client, method)(**kwargs)
+        except Exception as e:
+            if is_endpoint_failure(e):
+                endpoint.record_failure(e)
+            raise
+        latency = time.monotonic() - start
+        endpoint.record_success(latency)
+        if kind:
+            self._latencies[kind].append(latency)
+        return result
+
+    async def _open_stream(self, endpoint: OllamaEndpoint, kwargs: Dict[str, Any]):
+        """Otvorí stream a počká na prvú časť"""
+        start = time.monotonic()
+        iterator = None
+        try:
+            stream = await endpoint.client.chat(**kwargs)
+            iterator = stream.__aiter__()
+            try:
+                first = await iterator.__anext__()
+            except StopAsyncIteration:
+                raise ConnectionError(f"{endpoint.host}: prázdny stream")
+        except BaseException as e:
+            # Aj zrušený (prehraný hedge) stream musí zatvoriť spojenie
+            if iterator is not None and hasattr(iterator, 'aclose'):
+                try:
+                    await iterator.aclose()
+                except Exception:
+                    pass
+            if isinstance(e, Exception) and is_endpoint_failure(e):
+                endpoint.record_failure(e)
+            raise
+        latency = time.monotonic() - start
+        endpoint.record_success(latency)
+        self._latencies['stream'].append(latency)
+        return endpoint, iterator, first
+
+    @staticmethod
+    async def _close_stream(opened):
+        endpoint, iterator, _ = opened
+        endpoint.outstanding -= 1
+        aclose = getattr(iterator, 'aclose', None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
+
+    # HEDGOVANIE
+    async def _race(self, kind: str, primary: OllamaEndpoint, tried: set,
+                    start: Callable[[OllamaEndpoint], Any], discard: Callable = None):
+        """Spustí požiadavku na primárnom serveri; po uplynutí p95 aj na záložnom"""
+        deadline = self.hedge_deadline(kind)
+        holds = discard is not None
+        first = self._launch(primary, start, holds)
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=deadline)
+            backup = None if done or deadline is None else self._pick(tried)
+            if backup is None:
+                result = await first
+                tasks.discard(first)
+                return result
+
+            tried.add(backup)
+            self.stats['hedged'] += 1
+            second = self._launch(backup, start, holds)
+            tasks.add(second)
+            pending = set(tasks)
+            errors = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.stats['hedge_wins'] += 1
+                        tasks.discard(task)
+                        return task.result()
+                    errors.append(task.exception())
+            raise errors[0]
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                # Počkaj na zrušenie, aby sa server hneď uvoľnil pre ďalšie požiadavky
+                await asyncio.wait(losers)
+            for task in tasks:
+                if discard is not None and not task.cancelled() and task.exception() is None:
+                    await discard(task.result())
+
+    # FAILOVER
+    async def _call(self, method: str, kwargs: Dict[str, Any], kind: Optional[str] = None):
+        self._ensure_health_checks()
+        self.stats['requests'] += 1
+        tried = set()
+        last_error: Optional[BaseException] = None
+        while True:
+            endpoint = self._pick(tried)
+            if endpoint is None:
+                raise last_error or ConnectionError("Žiadny Ollama server nie je dostupný")
+            tried.add(endpoint)
+            if last_error is not None:
+                self.stats['failovers'] += 1
+                print(f"🔀 Ollama failover na {endpoint.host}: {last_error}")
+            try:
+                if kind is None:
+                    return await self._launch(endpoint, lambda ep: self._run_on(ep, method, kwargs, None))
+                return await self._race(kind, endpoint, tried, lambda ep: self._run_on(ep, method, kwargs, kind))
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                last_error = e
+
+    async def _stream_chat(self, kwargs: Dict[str, Any]):
+        """Streamovaný chat - failover a hedgovanie len do prvej časti, potom ostáva na serveri"""
+        self._ensure_health_checks()
+        self.stats['requests'] += 1
+        tried = set()
+        last_error: Optional[BaseException] = None
+        while True:
+            endpoint = self._pick(tried)
+            if endpoint is None:
+                raise last_error or ConnectionError("Žiadny Ollama server nie je dostupný")
+            tried.add(endpoint)
+            if last_error is not None:
+                self.stats['failovers'] += 1
+                print(f"🔀 Ollama failover na {endpoint.host}: {last_error}")
+            try:
+                opened = await self._race('stream', endpoint, tried,
+                                          lambda ep: self._open_stream(ep, kwargs), self._close_stream)
+                break
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                last_error = e
+
+        _, iterator, first = opened
+        try:
+            yield first
+            async for part in iterator:
+                yield part
+        finally:
+            await self._close_stream(opened)
+
+    # ROZHRANIE AsyncClient
+    async def chat(self, **kwargs):
+        if kwargs.get('stream'):
+            return self._stream_chat(kwargs)
+        return await self._call('chat', kwargs, 'chat')
+
+    async def generate(self, **kwargs):
+        if kwargs.get('prompt') == "" and not kwargs.get('stream'):
+            return await self._broadcast('generate', kwargs)
+        return await self._call('generate', kwargs)
+
+    async def list(self):
+        return await self._call('list', {})
+
+    async def embed(self, **kwargs):
+        return await self._call('embed', kwargs)
+
+    async def embeddings(self, **kwargs):
+        return await self._call('embeddings', kwargs)
+
+    async def _broadcast(self, method: str, kwargs: Dict[str, Any]):
+        """Pošle požiadavku na všetky servery (napr. načítanie modelu) - stačí jeden úspech"""
+        self._ensure_health_checks()
+        results = await asyncio.gather(
+            *(self._launch(endpoint, lambda ep: self._run_on(ep, method, kwargs, None)) for endpoint in self.endpoints),
+            return_exceptions=True
+        )
+        for result in results:
+            if not isinstance(result, BaseException):
+                return result
+        raise results[0]
+
+    # KONTROLA ZDRAVIA
+    def _ensure_health_checks(self):
+        if len(self.endpoints) < 2 or not self.health_interval:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.ensure_future(self._health_loop())
+
+    async def check_health(self):
+        """Overí všetky servery naraz (`list` s časovým limitom)"""
+        async def check(endpoint: OllamaEndpoint):
+            try:
+                await asyncio.wait_for(endpoint.client.list(), timeout=self.health_timeout)
+                if not endpoint.healthy:
+                    print(f"✅ Ollama server {endpoint.host} je opäť dostupný")
+                endpoint.healthy = True
+                endpoint.consecutive_failures = 0
+            except Exception as e:
+                if endpoint.healthy:
+                    print(f"⚠️  Ollama server {endpoint.host} nie je dostupný: {e}")
+                endpoint.record_failure(e)
+
+        await asyncio.gather(*(check(endpoint) for endpoint in self.endpoints))
+
+    async def _health_loop(self):
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self.health_interval)
+
+    async def close(self):
+        """Zastaví kontrolu zdravia a zatvorí HTTP spojenia všetkých klientov"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for endpoint in self.endpoints:
+            http_client = getattr(endpoint.client, '_client', None)
+            if http_client is not None:
+                await http_client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['endpoints'] = [endpoint.as_dict() for endpoint in self.endpoints]
+        stats['hedge_deadline_ms'] = {
+            kind: (deadline * 1000 if deadline is not None else None)
+            for kind, deadline in ((k, self.hedge_deadline(k)) for k in self._latencies)
+        }
+        return stats
@@ -0,0 +1,279 @@
+# core/process_pool.py - Spúšťanie ťažkých modulov v samostatných procesoch
+import asyncio
+import concurrent.futures
+import importlib.util
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+from typing import Dict, Any, Optional, Tuple
+
+from plugins.base_plugins import as_plugin, render_result
+
+
+class ModuleTimeoutError(TimeoutError):
+    """Modul v procese neodpovedal včas - proces bol ukončený a nahradený"""
+
+
+class ModuleCrashError(RuntimeError):
+    """Proces s modulom spadol počas spracovania príkazu"""
+
+
+class ModuleExecutionError(RuntimeError):
+    """Výnimka v `handle` modulu vo worker procese"""
+
+
+# PROCES WORKERA
+_worker_instances: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_worker_config = None
+
+
+def _run_hook(hook):
+    asyncio.get_event_loop().run_until_complete(hook())
+
+
+def _worker_instance(module_name: str, module_path: str, class_name: str, config_dir: str):
+    """Inštancia modulu vo workeri - znovu sa vytvorí, keď sa súbor zmení (hot reload)"""
+    global _worker_config
+    stat = os.stat(module_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _worker_instances.get(module_name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module_class = getattr(module, class_name)
+    if cached is not None:
+        _run_hook(as_plugin(cached[1], module_name).shutdown)
+    try:
+        if _worker_config is None:
+            from core.config_manager import ConfigManager
+            _worker_config = ConfigManager(config_dir, watch=False)
+        instance = module_class(_worker_config)
+    except TypeError:
+        instance = module_class()
+    # Plugin sa zahreje hneď pri vytvorení inštancie vo workeri
+    plugin = as_plugin(instance, module_name)
+    if plugin.has_warmup:
+        _run_hook(plugin.warmup)
+    _worker_instances[module_name] = (signature, instance)
+    return instance
+
+
+async def _handle_as_text(instance, command: str) -> str:
+    return await render_result(await instance.handle(command))
+
+
+def _worker_main(conn, config_dir: str):
+    """Slučka worker procesu: ('load'|'call', modul, cesta, trieda, príkaz) -> ('ok'|'error', hodnota)"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError, KeyboardInterrupt):
+            return
+        if message is None:
+            return
+        kind, module_name, module_path, class_name, command = message
+        try:
+            instance = _worker_instance(module_name, module_path, class_name, config_dir)
+            if kind == 'load':
+                result = None
+            else:
+                # Štruktúrované výsledky (tabuľky, streamy) sa vracajú ako text
+                result = loop.run_until_complete(_handle_as_text(instance, command))
+            reply = ('ok', result)
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                return
+            reply = ('error', f"{type(e).__name__}: {e}", traceback.format_exc(limit=5))
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            return
+
+
+# RODIČOVSKÁ STRANA
+class _Worker:
+    """Jeden worker proces s obojsmernou rúrou"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, context, config_dir: str):
+        self.id = next(self._ids)
+        self.conn, child_conn = context.Pipe(duplex=True)
+        self.process = context.Process(target=_worker_main, args=(child_conn, config_dir),
+                                       name=f"AuraModuleWorker-{self.id}", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.calls = 0
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(1.0)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(1.0)
+        self.kill()
+
+
+class ModuleProcessPool:
+    """Teplý pool worker procesov pre moduly označené ako ťažké.
+
+    Každý worker má vlastné inštancie modulov (načítajú sa pri prvom volaní
+    a znovu pri zmene súboru), takže `handle` nesúperí o GIL s Tk. Volanie
+    má časový limit - zaseknutý worker sa ukončí a nahradí novým, rovnako
+    ako worker, ktorý spadol. Výsledok je obyčajný reťazec.
+    Procesy sa spúšťajú metódou 'spawn' (fork s bežiacimi vláknami GUI nie je bezpečný).
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 60.0, config_dir: str = "config"):
+        self.size = max(1, workers)
+        self.timeout = timeout
+        self.config_dir = os.path.abspath(config_dir)
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._busy: Dict[int, _Worker] = {}
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.size,
+                                                               thread_name_prefix="ModuleProcessCall")
+        self._started = False
+        self._closed = False
+        self.stats = {'calls': 0, 'timeouts': 0, 'crashes': 0, 'errors': 0, 'restarts': 0}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], config_dir: str = "config") -> "ModuleProcessPool":
+        """Vytvorí pool podľa sekcie 'process_pool' (procesy sa spustia až pri prvom použití)"""
+        pool_settings = settings.get("process_pool", {})
+        return cls(
+            workers=pool_settings.get("workers", 2),
+            timeout=pool_settings.get("timeout", 60.0),
+            config_dir=config_dir
+        )
+
+    def start(self):
+        """Spustí worker procesy (ak ešte nebežia)"""
+        with self._lock:
+            if self._started or self._closed:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._idle.put(_Worker(self._context, self.config_dir))
+        print(f"🧵 Pool procesov modulov: {self.size} workerov")
+
+    def _replace(self, worker: _Worker):
+        """Ukončí workera a na jeho miesto spustí nového"""
+        worker.kill()
+        if self._closed:
+            return
+        self.stats['restarts'] += 1
+        self._idle.put(_Worker(self._context, self.config_dir))
+
+    # VOLANIA
+    async def call(self, module_name: str, module_path: str, class_name: str, command: str,
+                   timeout: Optional[float] = None) -> str:
+        """Spracuje príkaz modulom vo worker procese a vráti jeho odpoveď"""
+        if self._closed:
+            raise RuntimeError("Pool procesov modulov je zatvorený")
+        self.start()
+        token = {'worker': None, 'cancelled': False}
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor, self._call_blocking,
+            ('call', module_name, os.path.abspath(module_path), class_name, command),
+            timeout or self.timeout, token
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Zrušená požiadavka (stop) - zastav aj prácu vo workeri
+            token['cancelled'] = True
+            worker = token['worker']
+            if worker is not None:
+                worker.process.terminate()  # vlákno volania zistí koniec a spustí náhradu
+            raise
+
+    def preload(self, module_name: str, module_path: str, class_name: str):
+        """Na pozadí načíta modul vo všetkých workeroch (prvé volanie bez čakania na import)"""
+        self.start()
+        message = ('load', module_name, os.path.abspath(module_path), class_name, None)
+        for _ in range(self.size):
+            self._executor.submit(self._call_blocking, message, self.timeout, {'worker': None, 'cancelled': False})
+
+    def _call_blocking(self, message, timeout: float, token: Dict[str, Any]):
+        worker = self._idle.get()
+        if token['cancelled'] or self._closed:
+            self._idle.put(worker)
+            raise asyncio.CancelledError()
+        token['worker'] = worker
+        self.stats['calls'] += 1
+        worker.calls += 1
+        with self._lock:
+            self._busy[worker.id] = worker
+        try:
+            return self._exchange(worker, message, timeout, token)
+        finally:
+            with self._lock:
+                self._busy.pop(worker.id, None)
+
+    def _exchange(self, worker: _Worker, message, timeout: float, token: Dict[str, Any]):
+        module_name = message[1]
+        try:
+            worker.conn.send(message)
+            reply = worker.conn.recv() if worker.conn.poll(timeout) else None
+        except (EOFError, OSError):
+            self._replace(worker)
+            if token['cancelled']:
+                raise asyncio.CancelledError()
+            self.stats['crashes'] += 1
+            raise ModuleCrashError(f"Proces modulu {module_name} spadol - worker bol reštartovaný")
+        if reply is None:
+            self.stats['timeouts'] += 1
+            self._replace(worker)
+            raise ModuleTimeoutError(
+                f"Modul {module_name} neodpovedal do {timeout:g} s - proces bol reštartovaný")
+
+        self._idle.put(worker)
+        if reply[0] == 'error':
+            self.stats['errors'] += 1
+            raise ModuleExecutionError(f"{module_name}: {reply[1]}")
+        return reply[1]
+
+    def close(self):
+        """Ukončí všetky worker procesy"""
+        with self._lock:
+            self._closed = True
+            busy = list(self._busy.values())
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for worker in busy:
+            worker.process.terminate()
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['workers'] = self.size if self._started else 0
+        stats['idle'] = self._idle.qsize()
+        stats['timeout'] = self.timeout
+        return stats
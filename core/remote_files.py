@@ -0,0 +1,486 @@
+# core/remote_files.py - Prenos súborov na pripojené zariadenia (SFTP)
+import concurrent.futures
+import contextlib
+import os
+import posixpath
+import queue
+import stat
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import paramiko
+    PARAMIKO_AVAILABLE = True
+except ImportError:
+    paramiko = None
+    PARAMIKO_AVAILABLE = False
+
+PART_SUFFIX = ".aura-part"
+# Vedľa rozpracovaného súboru - veľkosť a čas úpravy zdroja, z ktorého vznikol
+RESUME_SUFFIX = ".aura-resume"
+# Menšie súbory sa po prerušení prenášajú celé (značka by stála viac ako pokračovanie)
+RESUME_MIN_BYTES = 1024 * 1024
+# Koľko bajtov z konca rozpracovaného súboru sa porovná pred pokračovaním prenosu
+RESUME_CHECK_BYTES = 64 * 1024
+
+
+def _is_transfer_file(name: str) -> bool:
+    """Pomocné súbory prenosu sa nesynchronizujú"""
+    return name.endswith(PART_SUFFIX) or name.endswith(RESUME_SUFFIX)
+
+
+class SFTPChannelPool:
+    """Niekoľko SFTP kanálov nad jedným SSH spojením zariadenia.
+
+    Kanály sa otvárajú až pri potrebe (najviac `size`) a po prenose sa
+    vracajú do poolu - ďalšie príkazy nečakajú na nové SFTP sedenie.
+    Pokazený kanál (zatvorený socket) sa zahodí a nahradí novým.
+    """
+
+    def __init__(self, transport, size: int = 4, window_size: int = 16 * 1024 * 1024,
+                 max_packet_size: int = 32768, acquire_timeout: float = 300.0):
+        self.transport = transport
+        self.size = max(1, size)
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
+        self.acquire_timeout = acquire_timeout
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'opened': 0, 'reused': 0, 'discarded': 0}
+
+    @contextlib.contextmanager
+    def channel(self) -> Iterator[Any]:
+        """Požičia SFTP kanál z poolu"""
+        sftp = self._acquire()
+        try:
+            yield sftp
+        finally:
+            self._release(sftp)
+
+    def _acquire(self):
+        if self._closed:
+            raise ConnectionError("Spojenie so zariadením je zatvorené")
+        try:
+            sftp = self._idle.get_nowait()
+            self.stats['reused'] += 1
+            return sftp
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._created < self.size
+            if can_open:
+                self._created += 1
+        if can_open:
+            try:
+                sftp = paramiko.SFTPClient.from_transport(self.transport, window_size=self.window_size,
+                                                          max_packet_size=self.max_packet_size)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self.stats['opened'] += 1
+            return sftp
+        try:
+            sftp = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError("Žiadny voľný SFTP kanál") from None
+        self.stats['reused'] += 1
+        return sftp
+
+    def _release(self, sftp):
+        if self._closed or sftp.sock.closed:
+            with self._lock:
+                self._created -= 1
+            self.stats['discarded'] += 1
+            with contextlib.suppress(Exception):
+                sftp.close()
+            return
+        self._idle.put(sftp)
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                sftp = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with contextlib.suppress(Exception):
+                sftp.close()
+
+
+class RemoteFiles:
+    """Súborové operácie na zariadeniach pripojených cez SSH (`FileManager.connected_devices`).
+
+    Každé zariadenie má pool SFTP kanálov s veľkým oknom. Nahrávanie posiela
+    zápisy bez čakania na potvrdenie (pipelining), sťahovanie číta dopredu
+    (`prefetch`), a viac súborov sa prenáša naraz na pool vlákien. Prenos ide
+    do súboru s príponou `.aura-part`, ktorý sa po dokončení premenuje. Pri
+    veľkých súboroch značka `.aura-resume` zaznamená veľkosť a čas úpravy
+    zdroja - po prerušení ďalší pokus pokračuje od uloženej dĺžky, len ak sa
+    zdroj odvtedy nezmenil a koniec rozpracovaného súboru s ním sedí.
+    Synchronizácia prenáša len súbory s inou veľkosťou alebo časom úpravy.
+    """
+
+    def __init__(self, channels: int = 4, workers: int = 4, window_size: int = 16 * 1024 * 1024,
+                 max_packet_size: int = 32768, chunk_size: int = 256 * 1024, max_requests: int = 64):
+        if not PARAMIKO_AVAILABLE:
+            raise ImportError("paramiko nie je nainštalovaný - pip install paramiko")
+        self.channels = max(1, channels)
+        self.workers = max(1, workers)
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
+        self.chunk_size = chunk_size
+        self.max_requests = max_requests
+        self._pools: Dict[str, SFTPChannelPool] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "RemoteFiles":
+        """Vytvorí prenos podľa sekcie 'remote_files'"""
+        remote_settings = settings.get("remote_files", {})
+        return cls(
+            channels=remote_settings.get("channels_per_device", 4),
+            workers=remote_settings.get("workers", 4),
+            window_size=int(remote_settings.get("window_size_mb", 16) * 1024 * 1024),
+            chunk_size=int(remote_settings.get("chunk_size_kb", 256) * 1024),
+            max_requests=remote_settings.get("max_requests", 64)
+        )
+
+    # ZARIADENIA
+    def attach(self, device: str, client) -> SFTPChannelPool:
+        """Zaregistruje zariadenie (paramiko SSHClient alebo Transport)"""
+        transport = client.get_transport() if hasattr(client, 'get_transport') else client
+        if transport is None or not transport.is_active():
+            raise ConnectionError(f"Zariadenie '{device}' nemá aktívne SSH spojenie")
+        pool = SFTPChannelPool(transport, self.channels, self.window_size, self.max_packet_size)
+        with self._lock:
+            previous = self._pools.pop(device, None)
+            self._pools[device] = pool
+        if previous is not None:
+            previous.close()
+        return pool
+
+    def detach(self, device: str):
+        with self._lock:
+            pool = self._pools.pop(device, None)
+        if pool is not None:
+            pool.close()
+
+    def close(self):
+        for device in list(self._pools):
+            self.detach(device)
+
+    def has_device(self, device: str) -> bool:
+        """Je zariadenie pripojené (zaregistrované cez `attach`)?"""
+        with self._lock:
+            return device in self._pools
+
+    def _pool(self, device: str) -> SFTPChannelPool:
+        pool = self._pools.get(device)
+        if pool is None:
+            raise KeyError(f"Zariadenie '{device}' nie je pripojené")
+        return pool
+
+    # OPERÁCIE
+    def listdir(self, device: str, path: str = ".") -> List[Dict[str, Any]]:
+        """Obsah vzdialenej zložky (zložky prvé)"""
+        with self._pool(device).channel() as sftp:
+            entries = sftp.listdir_attr(path)
+        items = [{
+            'name': entry.filename,
+            'path': posixpath.join(path, entry.filename),
+            'size': entry.st_size or 0,
+            'mtime': entry.st_mtime or 0,
+            'is_dir': stat.S_ISDIR(entry.st_mode or 0),
+        } for entry in entries]
+        return sorted(items, key=lambda item: (not item['is_dir'], item['name'].lower()))
+
+    def upload(self, device: str, local_path: str, remote_path: str) -> Dict[str, Any]:
+        """Nahrá súbor alebo zložku (zložka sa synchronizuje inkrementálne)"""
+        if os.path.isdir(local_path):
+            return self.sync(device, local_path, remote_path, direction="upload")
+        report = self._new_report(local_path, remote_path, "upload")
+        with self._pool(device).channel() as sftp:
+            # Cieľ končiaci '/' alebo existujúca zložka - súbor sa uloží do nej pod pôvodným názvom
+            if remote_path.endswith("/") or self._remote_is_dir(sftp, remote_path):
+                remote_path = posixpath.join(remote_path, os.path.basename(local_path))
+            self._remote_makedirs(sftp, posixpath.dirname(remote_path))
+        local_stat = os.stat(local_path)
+        self._run_jobs(device, [(local_stat.st_size, self._bind(self._put_file, local_path, remote_path, local_stat))],
+                       report)
+        return self._finish_report(report)
+
+    def download(self, device: str, remote_path: str, local_path: str) -> Dict[str, Any]:
+        """Stiahne súbor alebo zložku (zložka sa synchronizuje inkrementálne)"""
+        with self._pool(device).channel() as sftp:
+            attributes = sftp.stat(remote_path)
+        if stat.S_ISDIR(attributes.st_mode or 0):
+            return self.sync(device, local_path, remote_path, direction="download")
+        report = self._new_report(local_path, remote_path, "download")
+        if os.path.isdir(local_path):
+            local_path = os.path.join(local_path, posixpath.basename(remote_path))
+        self._run_jobs(device, [(attributes.st_size, self._bind(self._get_file, remote_path, local_path, attributes))],
+                       report)
+        return self._finish_report(report)
+
+    def sync(self, device: str, local_dir: str, remote_dir: str, direction: str = "upload") -> Dict[str, Any]:
+        """Synchronizuje zložku na zariadenie ('upload') alebo zo zariadenia ('download')"""
+        if direction not in ("upload", "download"):
+            raise ValueError(f"Neznámy smer synchronizácie: {direction}")
+        report = self._new_report(local_dir, remote_dir, direction)
+        with self._pool(device).channel() as sftp:
+            if direction == "upload":
+                if not os.path.isdir(local_dir):
+                    raise NotADirectoryError(local_dir)
+                self._remote_makedirs(sftp, remote_dir)
+                remote_files, _ = self._walk_remote(sftp, remote_dir)
+            else:
+                remote_files, remote_dirs = self._walk_remote(sftp, remote_dir)
+        local_files, local_dirs = self._walk_local(local_dir) if os.path.isdir(local_dir) else ({}, [])
+
+        jobs = []
+        if direction == "upload":
+            with self._pool(device).channel() as sftp:
+                for directory in sorted(local_dirs):
+                    self._remote_makedirs(sftp, posixpath.join(remote_dir, directory))
+            for relative, local_stat in local_files.items():
+                remote_attr = remote_files.get(relative)
+                if remote_attr is not None and self._same(local_stat.st_size, local_stat.st_mtime,
+                                                          remote_attr.st_size, remote_attr.st_mtime):
+                    self._count_skip(report, local_stat.st_size)
+                    continue
+                local_path = os.path.join(local_dir, *relative.split("/"))
+                remote_path = posixpath.join(remote_dir, relative)
+                jobs.append((local_stat.st_size, self._bind(self._put_file, local_path, remote_path, local_stat)))
+        else:
+            os.makedirs(local_dir, exist_ok=True)
+            for directory in remote_dirs:
+                os.makedirs(os.path.join(local_dir, *directory.split("/")), exist_ok=True)
+            for relative, remote_attr in remote_files.items():
+                local_stat = local_files.get(relative)
+                if local_stat is not None and self._same(local_stat.st_size, local_stat.st_mtime,
+                                                         remote_attr.st_size, remote_attr.st_mtime):
+                    self._count_skip(report, remote_attr.st_size)
+                    continue
+                local_path = os.path.join(local_dir, *relative.split("/"))
+                remote_path = posixpath.join(remote_dir, relative)
+                jobs.append((remote_attr.st_size, self._bind(self._get_file, remote_path, local_path, remote_attr)))
+
+        report['files'] = len(local_files if direction == "upload" else remote_files)
+        self._run_jobs(device, jobs, report)
+        return self._finish_report(report)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {device: dict(pool.stats, channels=pool._created) for device, pool in self._pools.items()}
+
+    # PRENOS SÚBOROV
+    def _put_file(self, sftp, local_path: str, remote_path: str, local_stat: os.stat_result) -> Tuple[int, bool]:
+        """Nahrá jeden súbor cez .aura-part - vráti (prenesené bajty, pokračovalo sa)"""
+        part_path = remote_path + PART_SUFFIX
+        marker_path = remote_path + RESUME_SUFFIX
+        size = local_stat.st_size
+        source_key = f"{size}:{local_stat.st_mtime_ns}"
+        resumable = size >= RESUME_MIN_BYTES
+        with open(local_path, "rb") as local_file:
+            offset = 0
+            if resumable:
+                try:
+                    part_size = sftp.stat(part_path).st_size
+                except IOError:
+                    part_size = None
+                if part_size and part_size <= size and self._read_remote_marker(sftp, marker_path) == source_key:
+                    with sftp.open(part_path, "rb") as remote_file:
+                        if self._tails_match(remote_file, local_file, part_size):
+                            offset = part_size
+                if not offset:
+                    with sftp.open(marker_path, "w") as marker:
+                        marker.write(source_key)
+            with sftp.open(part_path, "r+b" if offset else "wb") as remote_file:
+                remote_file.set_pipelined(True)
+                remote_file.seek(offset)
+                local_file.seek(offset)
+                for chunk in iter(lambda: local_file.read(self.chunk_size), b""):
+                    remote_file.write(chunk)
+        if sftp.stat(part_path).st_size != size:
+            raise IOError(f"Neúplný prenos: {remote_path}")
+        sftp.utime(part_path, (local_stat.st_atime, local_stat.st_mtime))
+        try:
+            sftp.posix_rename(part_path, remote_path)
+        except IOError:
+            # Server bez rozšírenia posix-rename - klasický rename neprepíše existujúci súbor
+            with contextlib.suppress(IOError):
+                sftp.remove(remote_path)
+            sftp.rename(part_path, remote_path)
+        if resumable:
+            with contextlib.suppress(IOError):
+                sftp.remove(marker_path)
+        return size - offset, offset > 0
+
+    def _get_file(self, sftp, remote_path: str, local_path: str, remote_attr) -> Tuple[int, bool]:
+        """Stiahne jeden súbor cez .aura-part - vráti (prenesené bajty, pokračovalo sa)"""
+        part_path = local_path + PART_SUFFIX
+        marker_path = local_path + RESUME_SUFFIX
+        size = remote_attr.st_size
+        source_key = f"{size}:{remote_attr.st_mtime}"
+        resumable = size >= RESUME_MIN_BYTES
+        os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
+        with sftp.open(remote_path, "rb") as remote_file:
+            offset = 0
+            if resumable:
+                part_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                if 0 < part_size <= size and self._read_local_marker(marker_path) == source_key:
+                    with open(part_path, "rb") as local_file:
+                        if self._tails_match(remote_file, local_file, part_size):
+                            offset = part_size
+                if not offset:
+                    with open(marker_path, "w", encoding="utf-8") as marker:
+                        marker.write(source_key)
+            remote_file.seek(offset)
+            remote_file.prefetch(size, max_concurrent_requests=self.max_requests)
+            with open(part_path, "r+b" if offset else "wb") as local_file:
+                local_file.seek(offset)
+                received = offset
+                while received < size:
+                    chunk = remote_file.read(min(self.chunk_size, size - received))
+                    if not chunk:
+                        break
+                    local_file.write(chunk)
+                    received += len(chunk)
+        if os.path.getsize(part_path) != size:
+            raise IOError(f"Neúplný prenos: {remote_path}")
+        os.utime(part_path, (remote_attr.st_atime or remote_attr.st_mtime, remote_attr.st_mtime))
+        os.replace(part_path, local_path)
+        if resumable:
+            with contextlib.suppress(OSError):
+                os.remove(marker_path)
+        return size - offset, offset > 0
+
+    @staticmethod
+    def _read_remote_marker(sftp, path: str) -> Optional[str]:
+        try:
+            with sftp.open(path, "r") as marker:
+                return marker.read(256).decode("utf-8", errors="replace").strip()
+        except IOError:
+            return None
+
+    @staticmethod
+    def _read_local_marker(path: str) -> Optional[str]:
+        try:
+            with open(path, "r", encoding="utf-8") as marker:
+                return marker.read(256).strip()
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _tails_match(remote_file, local_file, length: int) -> bool:
+        """Koniec rozpracovaného súboru sa zhoduje so zdrojom na rovnakom mieste"""
+        check = min(RESUME_CHECK_BYTES, length)
+        remote_file.seek(length - check)
+        local_file.seek(length - check)
+        return remote_file.read(check) == local_file.read(check)
+
+    def _run_jobs(self, device: str, jobs: List[Tuple[int, Callable]], report: Dict[str, Any]):
+        """Prenesie súbory paralelne - každý prenos si požičia kanál z poolu zariadenia"""
+        pool = self._pool(device)
+        lock = threading.Lock()
+
+        def run(job):
+            size, transfer = job
+            try:
+                with pool.channel() as sftp:
+                    sent, resumed = transfer(sftp)
+            except (IOError, OSError, EOFError, paramiko.SSHException) as e:
+                with lock:
+                    report['errors'].append(str(e))
+                return
+            with lock:
+                report['copied'] += 1
+                report['bytes_transferred'] += sent
+                report['resumed'] += resumed
+                report['bytes_skipped'] += size - sent
+
+        # Najväčšie súbory prvé - dlhé prenosy nezostanú na konci samé
+        jobs = sorted(jobs, key=lambda job: job[0], reverse=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.workers, pool.size),
+                                                   thread_name_prefix="RemoteFiles") as executor:
+            list(executor.map(run, jobs))
+
+    # POMOCNÉ
+    @staticmethod
+    def _bind(method, *args):
+        return lambda sftp: method(sftp, *args)
+
+    @staticmethod
+    def _same(local_size, local_mtime, remote_size, remote_mtime) -> bool:
+        return local_size == remote_size and int(local_mtime) == int(remote_mtime or 0)
+
+    @staticmethod
+    def _new_report(local: str, remote: str, direction: str) -> Dict[str, Any]:
+        return {'local': local, 'remote': remote, 'direction': direction, 'files': 1, 'copied': 0, 'skipped': 0,
+                'resumed': 0, 'bytes_transferred': 0, 'bytes_skipped': 0, 'errors': [], 'started': time.perf_counter()}
+
+    @staticmethod
+    def _count_skip(report: Dict[str, Any], size: int):
+        report['skipped'] += 1
+        report['bytes_skipped'] += size
+
+    @staticmethod
+    def _finish_report(report: Dict[str, Any]) -> Dict[str, Any]:
+        report['duration_s'] = round(time.perf_counter() - report.pop('started'), 3)
+        return report
+
+    @staticmethod
+    def _remote_is_dir(sftp, path: str) -> bool:
+        try:
+            return stat.S_ISDIR(sftp.stat(path).st_mode or 0)
+        except IOError:
+            return False
+
+    def _remote_makedirs(self, sftp, path: str):
+        """mkdir -p na zariadení"""
+        if not path or path in ("/", ".") or self._remote_is_dir(sftp, path):
+            return
+        self._remote_makedirs(sftp, posixpath.dirname(path.rstrip("/")))
+        with contextlib.suppress(IOError):
+            sftp.mkdir(path)
+
+    @staticmethod
+    def _walk_remote(sftp, root: str) -> Tuple[Dict[str, Any], List[str]]:
+        """Súbory (relatívna cesta s '/' -> atribúty) a podzložky vzdialeného stromu"""
+        files: Dict[str, Any] = {}
+        directories: List[str] = []
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            try:
+                entries = sftp.listdir_attr(posixpath.join(root, relative) if relative else root)
+            except IOError:
+                continue
+            for entry in entries:
+                entry_relative = f"{relative}/{entry.filename}" if relative else entry.filename
+                mode = entry.st_mode or 0
+                if stat.S_ISDIR(mode):
+                    directories.append(entry_relative)
+                    stack.append(entry_relative)
+                elif stat.S_ISREG(mode) and not _is_transfer_file(entry.filename):
+                    files[entry_relative] = entry
+        return files, directories
+
+    @staticmethod
+    def _walk_local(root: str) -> Tuple[Dict[str, os.stat_result], List[str]]:
+        """Ako `_walk_remote`, pre lokálnu zložku (relatívne cesty s '/')"""
+        files: Dict[str, os.stat_result] = {}
+        directories: List[str] = []
+        for directory, dirnames, filenames in os.walk(root):
+            relative = os.path.relpath(directory, root).replace(os.sep, "/")
+            prefix = "" if relative == "." else relative + "/"
+            directories.extend(prefix + name for name in dirnames)
+            for name in filenames:
+                if _is_transfer_file(name):
+                    continue
+                with contextlib.suppress(OSError):
+                    files[prefix + name] = os.stat(os.path.join(directory, name))
+        return files, directories
@@ -0,0 +1,186 @@
+# core/response_cache.py - Cache odpovedí AI modelu
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+
+class ResponseCache:
+    """Dvojúrovňová cache odpovedí LLM - LRU v pamäti a SQLite na disku.
+
+    Kľúčom je hash modelu, parametrov generovania a správ, takže rovnaká
+    otázka s rovnakým kontextom sa nepýta modelu znova. Diskovú úroveň
+    zdieľajú všetky spustenia aplikácie.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_entries: int = 256,
+                 disk_entries: int = 5000, ttl_seconds: float = 86400):
+        self.path = path
+        self.memory_entries = max(0, int(memory_entries))
+        self.disk_entries = max(0, int(disk_entries))
+        self.ttl_seconds = float(ttl_seconds)
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._writes_since_prune = 0
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0
+        }
+
+        if path and self.disk_entries:
+            self._open_db(path)
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "ResponseCache":
+        """Vytvorí cache podľa sekcie 'cache' v nastaveniach"""
+        cache_settings = settings.get("cache", {})
+        return cls(
+            path=cache_settings.get("path", os.path.join("config", "response_cache.sqlite3")),
+            memory_entries=cache_settings.get("memory_entries", 256),
+            disk_entries=cache_settings.get("disk_entries", 5000),
+            ttl_seconds=cache_settings.get("ttl_seconds", 86400)
+        )
+
+    def _open_db(self, path: str):
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+            self._db.commit()
+        except Exception as e:
+            print(f"⚠️  Diskovú cache odpovedí nie je možné otvoriť: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(model: str, options: Dict[str, Any], messages: List[Dict[str, str]]) -> str:
+        """Vytvorí stabilný kľúč z modelu, parametrov a správ"""
+        payload = json.dumps(
+            {'model': model, 'options': options or {}, 'messages': messages},
+            sort_keys=True, ensure_ascii=False, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def is_cacheable(options: Dict[str, Any], allow_nondeterministic: bool = False) -> bool:
+        """Deterministické požiadavky (temperature 0) sa cachujú vždy, ostatné len na požiadanie"""
+        if allow_nondeterministic:
+            return True
+        return float((options or {}).get('temperature', 1.0)) == 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        """Vráti odpoveď z cache alebo None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return value
+                del self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                        (key, now)
+                    ).fetchone()
+                    if row is not None:
+                        self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                        self._db.commit()
+                        self._remember(key, row[0], row[1])
+                        self.stats['disk_hits'] += 1
+                        return row[0]
+                except sqlite3.Error as e:
+                    print(f"⚠️  Chyba čítania cache: {e}")
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key: str, value: str):
+        """Uloží odpoveď do oboch úrovní cache"""
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self.stats['stores'] += 1
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                        (key, value, expires_at, now)
+                    )
+                    self._writes_since_prune += 1
+                    if self._writes_since_prune >= 50:
+                        self._prune_disk(now)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"⚠️  Chyba zápisu do cache: {e}")
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        if not self.memory_entries:
+            return
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def _prune_disk(self, now: float):
+        """Odstráni expirované záznamy a najdlhšie nepoužité nad limit"""
+        self._writes_since_prune = 0
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        overflow = count - self.disk_entries
+        if overflow > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                (overflow,)
+            )
+            self.stats['evictions'] += overflow
+
+    def clear(self):
+        """Vymaže celú cache"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Vráti počítadlá zásahov a veľkosť cache"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['memory_size'] = len(self._memory)
+            return stats
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,199 @@
+# core/scheduler.py - Plánovač požiadaviek asistenta
+import asyncio
+import concurrent.futures
+import itertools
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+# Nižšie číslo = vyššia priorita
+SOURCE_PRIORITIES = {
+    'hotkey': 0,
+    'voice': 1,
+    'chat': 1,
+    'dashboard': 5,
+    'background': 9
+}
+
+# Zdroje, ktorých požiadavky menia konverzáciu - spracujú sa postupne v poradí
+SERIAL_SOURCES = {'chat', 'voice'}
+
+
+class QueueFullError(RuntimeError):
+    """Fronta požiadaviek je plná - požiadavka bola odmietnutá"""
+
+
+class RequestHandle(concurrent.futures.Future):
+    """Future požiadavky v plánovači - `cancel()` zruší aj práve bežiacu požiadavku"""
+
+    def __init__(self, source: str, priority: int, label: str = ""):
+        super().__init__()
+        self.source = source
+        self.priority = priority
+        self.label = label
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self.done()
+
+
+class RequestScheduler:
+    """Prioritná fronta s obmedzeným počtom pracovníkov nad event loopom asistenta.
+
+    - interaktívne zdroje (chat, hlas) majú prednosť pred dashboardom,
+    - požiadavky s rovnakým `serial_key` bežia postupne v poradí odoslania,
+    - pri plnej fronte sa nová požiadavka hneď odmietne (QueueFullError),
+    - `RequestHandle.cancel()` zruší čakajúcu aj bežiacu požiadavku.
+    """
+
+    def __init__(self, event_loop, workers: int = 2, max_queue: int = 32):
+        self.event_loop = event_loop
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+
+        self._lock = threading.Lock()
+        self._queue: List[tuple] = []  # (priorita, poradie, handle, factory, serial_key)
+        self._running: List[RequestHandle] = []
+        self._busy_keys = set()
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'rejected': 0}
+
+        self.event_loop.submit(self._start_workers()).result()
+
+    @classmethod
+    def from_settings(cls, event_loop, settings: Dict[str, Any]) -> "RequestScheduler":
+        scheduler_settings = settings.get("scheduler", {})
+        return cls(
+            event_loop,
+            workers=scheduler_settings.get("workers", 2),
+            max_queue=scheduler_settings.get("max_queue", 32)
+        )
+
+    async def _start_workers(self):
+        self._wakeup = asyncio.Event()
+        self._worker_tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    # ODOSLANIE
+    def submit(self, factory: Callable[[], Coroutine], source: str = 'chat',
+               priority: Optional[int] = None, serial_key: Optional[str] = None,
+               label: str = "") -> RequestHandle:
+        """Zaradí požiadavku do fronty (thread-safe) a vráti jej handle"""
+        if priority is None:
+            priority = SOURCE_PRIORITIES.get(source, SOURCE_PRIORITIES['background'])
+        handle = RequestHandle(source, priority, label)
+
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.stats['rejected'] += 1
+                handle.set_exception(QueueFullError(
+                    f"Fronta požiadaviek je plná ({self.max_queue}), skúste to o chvíľu"
+                ))
+                return handle
+            self._queue.append((priority, next(self._sequence), handle, factory, serial_key))
+            self.stats['submitted'] += 1
+
+        handle.add_done_callback(self._on_handle_done)
+        self.event_loop.call_soon(self._wakeup.set)
+        return handle
+
+    def _on_handle_done(self, handle: RequestHandle):
+        if not handle.cancelled():
+            return
+        with self._lock:
+            queued = len(self._queue)
+            self._queue = [item for item in self._queue if item[2] is not handle]
+            if len(self._queue) < queued:
+                self.stats['cancelled'] += 1
+        task = handle._task
+        if task is not None and not task.done():
+            self.event_loop.call_soon(task.cancel)
+
+    # ZRUŠENIE
+    def cancel_running(self, source: Optional[str] = None) -> int:
+        """Zruší bežiace požiadavky (voliteľne len z daného zdroja)"""
+        with self._lock:
+            handles = [h for h in self._running if source is None or h.source == source]
+        return sum(1 for handle in handles if handle.cancel())
+
+    def cancel_all(self) -> int:
+        """Zruší všetky čakajúce aj bežiace požiadavky"""
+        with self._lock:
+            handles = [item[2] for item in self._queue] + list(self._running)
+        return sum(1 for handle in handles if handle.cancel())
+
+    # PRACOVNÍCI
+    def _pop_ready(self):
+        """Vyberie najprioritnejšiu požiadavku, ktorej sériový kľúč je voľný"""
+        with self._lock:
+            for item in sorted(self._queue, key=lambda i: (i[0], i[1])):
+                serial_key = item[4]
+                if serial_key is None or serial_key not in self._busy_keys:
+                    self._queue.remove(item)
+                    if serial_key is not None:
+                        self._busy_keys.add(serial_key)
+                    return item
+        return None
+
+    async def _worker(self):
+        while True:
+            item = self._pop_ready()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._run(item)
+            # Uvoľnený sériový kľúč môže odblokovať ďalšiu požiadavku
+            self._wakeup.set()
+
+    async def _run(self, item):
+        _, _, handle, factory, serial_key = item
+        try:
+            if handle.done():
+                return
+
+            task = asyncio.ensure_future(factory())
+            handle._task = task
+            handle.started_at = time.monotonic()
+            with self._lock:
+                self._running.append(handle)
+
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                # Ukončuje sa samotný pracovník (vypínanie loopu)
+                task.cancel()
+                handle.cancel()
+                raise
+
+            # Počítadlá pod zámkom (čítajú ich get_stats a submit z iných vlákien),
+            # handle sa dokončí až mimo neho - jeho callbacky zámok berú tiež
+            outcome = 'cancelled' if task.cancelled() else 'failed' if task.exception() is not None else 'completed'
+            with self._lock:
+                self.stats[outcome] += 1
+            if outcome == 'cancelled':
+                handle.cancel()
+            elif outcome == 'failed':
+                if not handle.done():
+                    handle.set_exception(task.exception())
+            elif not handle.done():
+                handle.set_result(task.result())
+        finally:
+            with self._lock:
+                if handle in self._running:
+                    self._running.remove(handle)
+                if serial_key is not None:
+                    self._busy_keys.discard(serial_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['queued'] = len(self._queue)
+            stats['running'] = len(self._running)
+            stats['workers'] = self.workers
+            stats['max_queue'] = self.max_queue
+        return stats
@@ -0,0 +1,280 @@
+# core/semantic_router.py - Sémantické smerovanie príkazov cez embeddingy
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from .command_router import normalize_command
+
+try:
+    import numpy as np
+except ImportError:
+    print("⚠️  NumPy nie je dostupný - sémantické smerovanie je vypnuté")
+    np = None
+
+
+async def embed_texts(client, model: str, texts: List[str]) -> List[List[float]]:
+    """Embeddingy textov z Ollama (nové `embed` API, inak staré `embeddings` po jednom)"""
+    if hasattr(client, 'embed'):
+        response = await client.embed(model=model, input=texts)
+        try:
+            return list(response['embeddings'])
+        except (KeyError, TypeError):
+            return list(response.embeddings)
+
+    vectors = []
+    for text in texts:
+        response = await client.embeddings(model=model, prompt=text)
+        try:
+            vectors.append(response['embedding'])
+        except (KeyError, TypeError):
+            vectors.append(response.embedding)
+    return vectors
+
+
+def module_phrases(module) -> List[str]:
+    """Frázy modulu na embedding - príkazy a prvý riadok popisu"""
+    phrases = [str(p) for p in (getattr(module, 'supported_commands', None) or [])]
+    doc = (getattr(module, '__doc__', None) or "").strip().split("\n")[0]
+    if doc:
+        phrases.append(doc)
+    return phrases
+
+
+def phrases_fingerprint(phrases: List[str]) -> str:
+    return hashlib.sha1("\n".join(phrases).encode('utf-8')).hexdigest()
+
+
+class SemanticRouter:
+    """Priradí parafrázovaný príkaz modulu podľa kosínovej podobnosti embeddingov.
+
+    Frázy všetkých modulov sa embedujú raz a uložia ako normalizovaná NumPy
+    matica do `.npz` súboru. Pri zmene modulu sa prepočítajú len jeho frázy
+    (odtlačok fráz v metadátach). Dopyt je jeden maticový súčin, top-k cez
+    argpartition a prah istoty; embeddingy dopytov sa pamätajú podľa
+    normalizovaného textu. Kým index nie je hotový, router nič nevracia.
+
+    Volajúci môže odovzdať `version` - počítadlo zmien modulov (asistent ho
+    zvyšuje pri registrácii a odregistrovaní). Pri nezmenenej verzii sa
+    zoznam fráz modulov neprechádza; bez verzie sa porovnáva celý podpis.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_path: str, model: str = "nomic-embed-text", threshold: float = 0.75,
+                 top_k: int = 3, timeout: float = 1.5, query_cache_entries: int = 1024,
+                 retry_seconds: float = 60.0):
+        self.index_path = index_path
+        self.model = model
+        self.threshold = threshold
+        self.top_k = max(1, int(top_k))
+        self.timeout = timeout
+        self.query_cache_entries = max(0, int(query_cache_entries))
+        self.retry_seconds = retry_seconds
+
+        self._matrix = None          # (N, d) float32, riadky normalizované
+        self._owners: List[str] = []  # modul pre každý riadok
+        self._phrases: List[str] = []
+        self._fingerprints: Dict[str, str] = {}
+        self._signature = None
+        self._version = None         # verzia modulov, ku ktorej patrí `_signature`
+        self._build_task: Optional[asyncio.Task] = None
+        self._failed_at = 0.0
+
+        self._queries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'matches': 0, 'misses': 0, 'query_cache_hits': 0, 'builds': 0, 'embedded_phrases': 0, 'errors': 0}
+
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], config_dir: str = "config") -> Optional["SemanticRouter"]:
+        """Vytvorí router podľa sekcie 'semantic'; bez NumPy alebo pri vypnutí vráti None"""
+        semantic_settings = settings.get("semantic", {})
+        if np is None or not semantic_settings.get("enabled", True):
+            return None
+        return cls(
+            index_path=semantic_settings.get("index_path", os.path.join(config_dir, "semantic_index.npz")),
+            model=semantic_settings.get("embed_model", "nomic-embed-text"),
+            threshold=semantic_settings.get("threshold", 0.75),
+            top_k=semantic_settings.get("top_k", 3),
+            timeout=semantic_settings.get("timeout", 1.5),
+            query_cache_entries=semantic_settings.get("query_cache_entries", 1024)
+        )
+
+    @property
+    def ready(self) -> bool:
+        return self._matrix is not None and len(self._owners) > 0
+
+    # PERZISTENCIA
+    def _load(self):
+        try:
+            with np.load(self.index_path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('version') != self.VERSION or meta.get('model') != self.model:
+                    return
+                self._matrix = data['vectors'].astype(np.float32)
+                self._owners = [str(o) for o in data['owners']]
+                self._phrases = [str(p) for p in data['phrases']]
+                self._fingerprints = meta.get('fingerprints', {})
+        except (OSError, KeyError, ValueError):
+            self._matrix = None
+
+    def _save(self):
+        try:
+            directory = os.path.dirname(self.index_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            meta = {'version': self.VERSION, 'model': self.model, 'fingerprints': self._fingerprints}
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    vectors=self._matrix,
+                    owners=np.array(self._owners, dtype=str),
+                    phrases=np.array(self._phrases, dtype=str),
+                    meta=np.array(json.dumps(meta))
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️  Sémantický index sa nepodarilo uložiť: {e}")
+
+    # INDEX
+    @staticmethod
+    def _normalize_rows(vectors):
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    @staticmethod
+    def signature(modules: Dict[str, Any]) -> Tuple:
+        return tuple((name, tuple(module_phrases(modules[name]))) for name in sorted(modules))
+
+    async def build(self, client, modules: Dict[str, Any]):
+        """Aktualizuje index - embeduje len frázy modulov, ktoré sa zmenili"""
+        signature = self.signature(modules)
+        rows_by_module: Dict[str, List[int]] = {}
+        for row, owner in enumerate(self._owners):
+            rows_by_module.setdefault(owner, []).append(row)
+
+        vectors, owners, phrases, fingerprints = [], [], [], {}
+        embedded = 0
+        for name, module_phrase_list in signature:
+            if not module_phrase_list:
+                continue
+            fingerprint = phrases_fingerprint(list(module_phrase_list))
+            fingerprints[name] = fingerprint
+            if self._fingerprints.get(name) == fingerprint and name in rows_by_module:
+                rows = rows_by_module[name]
+                vectors.append(self._matrix[rows])
+                owners.extend(self._owners[r] for r in rows)
+                phrases.extend(self._phrases[r] for r in rows)
+                continue
+
+            module_vectors = await embed_texts(client, self.model, list(module_phrase_list))
+            vectors.append(self._normalize_rows(module_vectors))
+            owners.extend([name] * len(module_phrase_list))
+            phrases.extend(module_phrase_list)
+            embedded += len(module_phrase_list)
+
+        self._matrix = np.vstack(vectors) if vectors else None
+        self._owners, self._phrases, self._fingerprints = owners, phrases, fingerprints
+        self._signature = signature
+        self.stats['builds'] += 1
+        self.stats['embedded_phrases'] += embedded
+        if embedded or not os.path.exists(self.index_path):
+            self._save()
+        print(f"🧭 Sémantický index: {len(owners)} fráz, nových embeddingov: {embedded}")
+
+    def ensure_index(self, client, modules: Dict[str, Any], version: Optional[int] = None):
+        """Spustí prestavbu indexu na pozadí, ak sa moduly zmenili (volať v event loope)"""
+        if self._build_task is not None and not self._build_task.done():
+            return
+        if version is not None and version == self._version:
+            return
+        if self._signature == self.signature(modules):
+            self._version = version
+            return
+        if self._failed_at and time.monotonic() - self._failed_at < self.retry_seconds:
+            return
+
+        async def run():
+            try:
+                await self.build(client, modules)
+                self._version = version
+                self._failed_at = 0.0
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                self.stats['errors'] += 1
+                print(f"⚠️  Sémantický index sa nepodarilo zostaviť ({self.model}): {e}")
+
+        self._build_task = asyncio.ensure_future(run())
+
+    # DOPYT
+    async def _query_vector(self, client, command: str):
+        key = normalize_command(command)
+        with self._lock:
+            vector = self._queries.get(key)
+            if vector is not None:
+                self._queries.move_to_end(key)
+                self.stats['query_cache_hits'] += 1
+                return vector
+
+        vectors = await asyncio.wait_for(embed_texts(client, self.model, [command.strip()]), timeout=self.timeout)
+        vector = self._normalize_rows(vectors)[0]
+        if self.query_cache_entries:
+            with self._lock:
+                self._queries[key] = vector
+                while len(self._queries) > self.query_cache_entries:
+                    self._queries.popitem(last=False)
+        return vector
+
+    async def match(self, client, command: str, modules: Dict[str, Any],
+                    version: Optional[int] = None) -> Optional[Tuple[str, float]]:
+        """Vráti (modul, skóre) pre najpodobnejšiu frázu nad prahom, inak None"""
+        self.ensure_index(client, modules, version)
+        if not self.ready:
+            return None
+
+        try:
+            query = await self._query_vector(client, command)
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"⚠️  Embedding príkazu zlyhal: {e}")
+            return None
+
+        matrix, owners = self._matrix, self._owners
+        if query.shape[0] != matrix.shape[1]:
+            return None
+        scores = matrix @ query
+        k = min(self.top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        for row in top:
+            score = float(scores[row])
+            if score < self.threshold:
+                break
+            # Starý index počas prestavby môže obsahovať už odstránené moduly
+            if owners[row] in modules:
+                self.stats['matches'] += 1
+                return owners[row], score
+
+        self.stats['misses'] += 1
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['query_cache_size'] = len(self._queries)
+        stats['phrases'] = len(self._owners)
+        stats['model'] = self.model
+        stats['ready'] = self.ready
+        return stats
@@ -0,0 +1,53 @@
+# core/startup.py - Meranie fáz štartu aplikácie
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+class StartupTimer:
+    """Zaznamenáva trvanie jednotlivých fáz štartu a vypíše súhrnný report"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: List[Tuple[str, float, float]] = []  # (názov, začiatok, trvanie)
+        self._lock = threading.Lock()
+        self._reported = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """Zmeria blok kódu ako jednu fázu štartu"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def record(self, name: str, start: float, end: float = None):
+        """Zaznamená fázu s daným začiatkom (perf_counter)"""
+        end = time.perf_counter() if end is None else end
+        with self._lock:
+            self.stages.append((name, start - self.started_at, end - start))
+
+    def mark(self, name: str):
+        """Zaznamená okamih od začiatku štartu (napr. pripravenosť modelu)"""
+        self.record(name, self.started_at)
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {name: duration for name, _, duration in self.stages}
+
+    def report(self, force: bool = False) -> str:
+        """Vypíše report štartu (raz za beh, ak nie je force)"""
+        with self._lock:
+            if self._reported and not force:
+                return ""
+            self._reported = True
+            stages = list(self.stages)
+
+        lines = ["⏱️  Štart aplikácie:"]
+        for name, offset, duration in stages:
+            lines.append(f"   • {name:<14} {duration * 1000:8.0f} ms  (od štartu {offset + duration:6.2f} s)")
+        report = "\n".join(lines)
+        print(report)
+        return report
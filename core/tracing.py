@@ -0,0 +1,216 @@
+# core/tracing.py - Trasovanie spracovania príkazov (spany do JSONL)
+import contextvars
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Dict, Any, Optional
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("aura_trace_span", default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """Jeden meraný úsek; vnorené spany sa cez contextvars napoja na rodiča aj naprieč await"""
+
+    __slots__ = ('tracer', 'name', 'attrs', 'trace_id', 'span_id', 'parent_id', 'start', 'wall_start',
+                 'duration', '_token')
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        parent = _current_span.get()
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.trace_id = parent.trace_id if parent is not None else uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent is not None else None
+        self.span_id = next(_span_ids)
+        self.start = 0.0
+        self.wall_start = 0.0
+        self.duration = 0.0
+        self._token = None
+
+    def set(self, **attrs):
+        """Doplní metadáta spanu (modul, model, počty tokenov, ...)"""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            pass  # async generátor uzavretý v inom kontexte
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer._emit(self)
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'trace': self.trace_id,
+            'span': self.span_id,
+            'parent': self.parent_id,
+            'name': self.name,
+            'ts': round(self.wall_start, 6),
+            'ms': round(self.duration * 1000, 3),
+            'attrs': self.attrs
+        }
+
+
+class _NoopSpan:
+    """Span pri vypnutom trasovaní - nič nemeria ani nezapisuje"""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Ľahké trasovanie s JSONL exportom.
+
+    Spany sa merajú monotónnymi hodinami (perf_counter) a po skončení sa
+    vložia do fronty; zápis do súboru a rotáciu robí vlákno na pozadí.
+    Vypnutý tracer vracia zdieľaný prázdny span, takže réžia je len jedna
+    podmienka. Zapnúť/vypnúť sa dá počas behu cez `set_enabled`.
+    """
+
+    def __init__(self, path: str, enabled: bool = False, max_bytes: int = 5 * 1024 * 1024,
+                 backups: int = 3, max_queue: int = 10000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.enabled = False
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {'spans': 0, 'dropped': 0, 'rotations': 0}
+
+        self.set_enabled(enabled)
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], config_dir: str = "config") -> "Tracer":
+        """Vytvorí tracer podľa sekcie 'tracing'"""
+        tracing_settings = settings.get("tracing", {})
+        return cls(
+            path=tracing_settings.get("path", os.path.join(config_dir, "traces.jsonl")),
+            enabled=tracing_settings.get("enabled", False),
+            max_bytes=tracing_settings.get("max_bytes", 5 * 1024 * 1024),
+            backups=tracing_settings.get("backups", 3)
+        )
+
+    def set_enabled(self, enabled: bool):
+        """Zapne/vypne trasovanie za behu"""
+        self.enabled = bool(enabled)
+        if self.enabled:
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._writer, name="TraceWriter", daemon=True)
+                    self._thread.start()
+
+    # SPANY
+    def span(self, name: str, **attrs):
+        """Context manager pre meraný úsek (funguje v sync aj async kóde)"""
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, attrs)
+
+    def record(self, name: str, start: float, end: Optional[float] = None, **attrs):
+        """Zaznamená už zmeraný úsek (perf_counter) ako potomka aktuálneho spanu"""
+        if not self.enabled:
+            return
+        end = time.perf_counter() if end is None else end
+        span = Span(self, name, attrs)
+        span.start = start
+        span.wall_start = time.time() - (time.perf_counter() - start)
+        span.duration = end - start
+        self._emit(span)
+
+    @staticmethod
+    def current():
+        """Aktuálny span (alebo prázdny span mimo trasovania)"""
+        return _current_span.get() or NOOP_SPAN
+
+    def _emit(self, span: Span):
+        try:
+            self._queue.put_nowait(span.as_dict())
+            self.stats['spans'] += 1
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    # ZÁPIS NA POZADÍ
+    def _writer(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            lines = [record]
+            # Zober aj ostatné čakajúce záznamy - jeden zápis namiesto mnohých
+            while len(lines) < 500:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    self._write(lines)
+                    return
+                lines.append(record)
+            self._write(lines)
+
+    def _write(self, records):
+        data = "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records)
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if self.max_bytes and os.path.exists(self.path) and \
+                    os.path.getsize(self.path) + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(data)
+        except OSError as e:
+            print(f"⚠️  Zápis trasovania zlyhal: {e}")
+
+    def _rotate(self):
+        """traces.jsonl -> traces.jsonl.1 -> ... -> traces.jsonl.N (najstarší sa zahodí)"""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.stats['rotations'] += 1
+
+    def close(self, timeout: float = 2.0):
+        """Zapíše zvyšné spany a ukončí vlákno zapisovača"""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['enabled'] = self.enabled
+        stats['queued'] = self._queue.qsize()
+        stats['path'] = self.path
+        return stats
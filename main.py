@@ -11,34 +11,46 @@ def main():
         current_dir = os.path.dirname(os.path.abspath(__file__))
         sys.path.insert(0, current_dir)
         
-        # Nastav Ultimate theme PRVÉ
-        from ui.themes import theme_manager
-        theme_manager.setup_ultimate_theme()
+        from core.startup import StartupTimer
+        timer = StartupTimer()
         
-        # Import komponentov AŽ POTOM
-        from core.config_manager import ConfigManager
-        from core.assistant import AIAssistant
+        with timer.stage("importy"):
+            # Nastav Ultimate theme PRVÉ
+            from ui.themes import theme_manager
+            theme_manager.setup_ultimate_theme()
+            
+            # Import komponentov AŽ POTOM
+            from core.config_manager import ConfigManager
+            from core.assistant import AIAssistant
         
         print("🔮 Inicializujem Quantum komponenty...")
-        config_manager = ConfigManager()
-        assistant = AIAssistant(config_manager)
+        with timer.stage("konfigurácia"):
+            config_manager = ConfigManager()
         
-        # Skontroluj či AI funguje
-        try:
-            test_response = assistant.process_command_sync("test")
-            print(f"✅ AI test: {test_response[:50]}...")
-        except Exception as e:
-            print(f"⚠️ AI test failed: {e}")
+        with timer.stage("moduly"):
+            assistant = AIAssistant(config_manager)
         
         print("🎨 Vytváram Quantum rozhranie...")
-        from ui.main_window import QuantumMainWindow
-        app = QuantumMainWindow(assistant, config_manager)
+        with timer.stage("UI"):
+            from ui.main_window import QuantumMainWindow
+            app = QuantumMainWindow(assistant, config_manager)
+        
+        # Model sa načíta na pozadí - UI je medzitým plne použiteľné
+        def on_model_status(state, message):
+            if state != "warming":
+                timer.mark("model pripravený" if state == "ready" else f"model ({state})")
+                timer.report()
+            app.after(0, lambda: app.set_ai_status(state, message))
+        
+        assistant.start_warm_up(on_model_status)
         
         print("✅ Quantum aplikácia úspešne inicializovaná!")
         print("🚀 Spúšťam hlavnú slučku...")
         
         # Spustenie aplikácie
         app.mainloop()
+        timer.report()
+        assistant.shutdown()
         
     except ImportError as e:
         print(f"💥 Chyba importu: {e}")
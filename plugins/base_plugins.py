@@ -0,0 +1,205 @@
+# plugins/base_plugins.py - Základná trieda pluginov a štruktúrované výsledky
+"""API pre moduly asistenta.
+
+Nový modul dedí od `BasePlugin`, príkazy deklaruje staticky v `commands`
+(manifest ich prečíta bez importu) a voliteľne prepíše háky `warmup`,
+`shutdown` a `health`. `max_concurrency` a `expected_cost` asistent
+použije pri plánovaní. `handle` môže vrátiť reťazec alebo štruktúrovaný
+výsledok (`TableResult`, `ListResult`, `StreamResult`).
+
+Staršie moduly (napr. SystemTools, Weather) s metódami `can_handle`/`handle`
+fungujú ďalej - asistent ich obalí do `PluginAdapter`.
+"""
+import asyncio
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Sequence, Union
+
+# Očakávaná cena spracovania príkazu:
+#   light - rýchla práca v event loope
+#   io    - čakanie na sieť/disk (await, vlákno)
+#   cpu   - výpočtovo náročné, beží v pooli procesov
+EXPECTED_COSTS = ('light', 'io', 'cpu')
+
+
+# ŠTRUKTÚROVANÉ VÝSLEDKY
+class PluginResult:
+    """Výsledok pluginu, ktorý UI môže zobraziť bohatšie; `to_text()` je textová podoba pre chat"""
+
+    def to_text(self) -> str:
+        raise NotImplementedError
+
+    def __str__(self):
+        return self.to_text()
+
+
+class ListResult(PluginResult):
+    """Zoznam položiek s voliteľným nadpisom"""
+
+    def __init__(self, items: Iterable[Any], title: Optional[str] = None):
+        self.items = list(items)
+        self.title = title
+
+    def to_text(self) -> str:
+        lines = [f"**{self.title}:**"] if self.title else []
+        lines.extend(f"- {item}" for item in self.items)
+        return "\n".join(lines)
+
+
+class TableResult(PluginResult):
+    """Tabuľka (stĺpce + riadky) - textovo ako zarovnané stĺpce"""
+
+    def __init__(self, columns: Sequence[str], rows: Iterable[Sequence[Any]], title: Optional[str] = None):
+        self.columns = [str(column) for column in columns]
+        self.rows = [[str(value) for value in row] for row in rows]
+        self.title = title
+
+    def to_text(self) -> str:
+        widths = [len(column) for column in self.columns]
+        for row in self.rows:
+            for index, value in enumerate(row[:len(widths)]):
+                widths[index] = max(widths[index], len(value))
+
+        def line(values):
+            return "  ".join(value.ljust(width) for value, width in zip(values, widths)).rstrip()
+
+        lines = [f"**{self.title}:**"] if self.title else []
+        lines.append(line(self.columns))
+        lines.append("  ".join("-" * width for width in widths))
+        lines.extend(line(row) for row in self.rows)
+        return "\n".join(lines)
+
+
+class StreamResult(PluginResult):
+    """Odpoveď po častiach (async iterátor reťazcov) - streamovací chat ich zobrazí priebežne"""
+
+    def __init__(self, chunks: AsyncIterable[str]):
+        self.chunks = chunks
+        self._text: Optional[str] = None
+
+    async def __aiter__(self):
+        parts = []
+        async for chunk in self.chunks:
+            parts.append(str(chunk))
+            yield parts[-1]
+        self._text = "".join(parts)
+
+    async def collect(self) -> str:
+        """Prečíta celý stream a vráti ho ako jeden reťazec"""
+        if self._text is None:
+            async for _ in self:
+                pass
+        return self._text
+
+    def to_text(self) -> str:
+        if self._text is None:
+            raise RuntimeError("StreamResult ešte nebol prečítaný - použite `await collect()`")
+        return self._text
+
+
+async def render_result(result: Any) -> str:
+    """Prevedie výsledok `handle` na reťazec (stream sa dočíta)"""
+    if isinstance(result, StreamResult):
+        return await result.collect()
+    if isinstance(result, PluginResult):
+        return result.to_text()
+    return result if isinstance(result, str) else str(result)
+
+
+# PLUGINY
+class BasePlugin:
+    """Základ pluginu asistenta.
+
+    Podtrieda nastaví `commands` a implementuje `handle`. Háky `warmup`
+    (príprava spojení/modelov), `shutdown` (uvoľnenie) a `health` sú
+    voliteľné. `max_concurrency` obmedzí počet súbežných `handle`
+    (0 = bez obmedzenia), `expected_cost` je jedna z EXPECTED_COSTS.
+    Pri `warmup_on_start = True` sa plugin zahreje hneď po štarte asistenta,
+    inak až pred prvým príkazom.
+    """
+
+    name: Optional[str] = None
+    description: str = ""
+    commands: Sequence[str] = ()
+    max_concurrency: int = 0
+    expected_cost: str = 'light'
+    warmup_on_start: bool = False
+
+    def __init__(self, config_manager=None):
+        self.config_manager = config_manager
+        if self.name is None:
+            self.name = type(self).__name__
+
+    @property
+    def supported_commands(self) -> List[str]:
+        return list(self.commands)
+
+    def can_handle(self, command: str) -> bool:
+        command = command.lower()
+        return any(phrase in command for phrase in self.commands)
+
+    async def handle(self, command: str) -> Union[str, PluginResult]:
+        raise NotImplementedError
+
+    async def warmup(self):
+        """Príprava pred prvým príkazom"""
+
+    async def shutdown(self):
+        """Uvoľnenie prostriedkov pri vypnutí alebo výmene modulu"""
+
+    def health(self) -> Dict[str, Any]:
+        """Stav pluginu pre diagnostiku - aspoň {'status': 'ok'|'degraded'|'error'}"""
+        return {'status': 'ok'}
+
+    @property
+    def has_warmup(self) -> bool:
+        return type(self).warmup is not BasePlugin.warmup
+
+
+class PluginAdapter(BasePlugin):
+    """Obal pre starší modul s `can_handle`/`handle` - háky a limity berie z modulu, ak ich má"""
+
+    def __init__(self, module: Any, name: Optional[str] = None):
+        self.module = module
+        self.name = name or type(module).__name__
+        self.description = (type(module).__doc__ or "").strip()
+        self.config_manager = getattr(module, 'config_manager', None)
+        commands = getattr(module, 'supported_commands', None)
+        self.commands = tuple(commands) if isinstance(commands, (list, tuple, set)) else ()
+        self.max_concurrency = getattr(module, 'max_concurrency', 0) or 0
+        self.expected_cost = getattr(module, 'expected_cost', 'light')
+        self.warmup_on_start = bool(getattr(module, 'warmup_on_start', False))
+
+    def can_handle(self, command: str) -> bool:
+        can_handle = getattr(self.module, 'can_handle', None)
+        return can_handle(command) if callable(can_handle) else super().can_handle(command)
+
+    async def handle(self, command: str) -> Union[str, PluginResult]:
+        return await self.module.handle(command)
+
+    async def warmup(self):
+        await self._call_hook('warmup')
+
+    async def shutdown(self):
+        await self._call_hook('shutdown')
+
+    def health(self) -> Dict[str, Any]:
+        health = getattr(self.module, 'health', None)
+        return health() if callable(health) else {'status': 'ok'}
+
+    @property
+    def has_warmup(self) -> bool:
+        return callable(getattr(self.module, 'warmup', None))
+
+    async def _call_hook(self, name: str):
+        hook = getattr(self.module, name, None)
+        if not callable(hook):
+            return
+        result = hook()
+        if asyncio.iscoroutine(result):
+            await result
+
+
+def as_plugin(module: Any, name: Optional[str] = None) -> BasePlugin:
+    """Vráti modul ako BasePlugin (starší modul obalí adaptérom)"""
+    if isinstance(module, BasePlugin):
+        return module
+    return PluginAdapter(module, name)
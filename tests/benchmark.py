@@ -0,0 +1,265 @@
+# tests/benchmark.py - Benchmark spracovania príkazov proti falošnému Ollama serveru
+"""Meria priepustnosť a latencie `AIAssistant.process_command` cez router,
+moduly aj cestu k LLM. Výsledok sa uloží ako JSON a porovná so základnou
+líniou (baseline), takže regresie medzi verziami sú viditeľné.
+
+    python -m tests.benchmark                      # beh + porovnanie s baseline
+    python -m tests.benchmark --update-baseline    # uloží nový baseline
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from tests.fake_ollama import FakeOllamaServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, "tests", "benchmarks", "baseline.json")
+REPORT_VERSION = 1
+
+MODULE_COMMANDS = ["pomoc", "zoznam príkazov", "moduly", "what can you do"]
+
+
+def deep_update(target: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_update(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+@contextlib.contextmanager
+def assistant_workspace(directory: str, host: str, settings: Optional[Dict[str, Any]] = None,
+                        modules_dir: Optional[str] = None):
+    """Pripraví pracovný priečinok (config + modules) a vráti AIAssistant napojený na `host`.
+
+    ConfigManager aj načítanie modulov používajú relatívne cesty, preto sa
+    počas behu mení pracovný priečinok. Po skončení sa asistent vypne
+    a priečinok vráti späť.
+    """
+    from core.config_manager import ConfigManager
+    from core.assistant import AIAssistant
+
+    previous = os.getcwd()
+    os.chdir(directory)
+    assistant = config_manager = None
+    try:
+        modules_source = modules_dir or os.path.join(REPO_ROOT, "Modules")
+        if not os.path.exists("modules"):
+            try:
+                os.symlink(modules_source, "modules", target_is_directory=True)
+            except (OSError, NotImplementedError):
+                shutil.copytree(modules_source, "modules")
+
+        config_manager = ConfigManager()
+        current = config_manager.load_settings()
+        deep_update(current, {'ai': {'ollama_host': host, 'ollama_hosts': [], 'health_interval': 0}})
+        deep_update(current, settings or {})
+        config_manager.save_settings(current)
+
+        assistant = AIAssistant(config_manager)
+        yield assistant
+    finally:
+        if assistant is not None:
+            assistant.shutdown()
+        if config_manager is not None:
+            config_manager.close()
+        os.chdir(previous)
+
+
+def percentile(samples: List[float], q: float) -> Optional[float]:
+    """Percentil metódou najbližšieho poradia"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(q * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], errors: int, duration: float, first_tokens=None) -> Dict[str, Any]:
+    """Súhrn scenára - latencie v ms, priepustnosť v požiadavkách za sekundu"""
+    result = {
+        'count': len(latencies),
+        'errors': errors,
+        'duration_s': round(duration, 4),
+        'throughput_rps': round(len(latencies) / duration, 2) if duration > 0 else None,
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None
+    }
+    for name, q in (('p50_ms', 0.50), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+        value = percentile(latencies, q)
+        result[name] = round(value * 1000, 3) if value is not None else None
+    if first_tokens:
+        result['first_token_p50_ms'] = round(percentile(first_tokens, 0.50) * 1000, 3)
+        result['first_token_p95_ms'] = round(percentile(first_tokens, 0.95) * 1000, 3)
+    return result
+
+
+async def _run_scenario(make_call, commands: List[str], concurrency: int):
+    """Spustí príkazy s najviac `concurrency` naraz - vráti (latencie, chyby, trvanie, prvé tokeny)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, first_tokens = [], []
+    errors = 0
+
+    async def one(command):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response, first_token = await make_call(command, start)
+            latencies.append(time.perf_counter() - start)
+            if first_token is not None:
+                first_tokens.append(first_token)
+            if response.startswith("❌"):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(command) for command in commands))
+    return latencies, errors, time.perf_counter() - start, first_tokens
+
+
+def run_scenarios(assistant, iterations: int = 50, concurrency: int = 4) -> Dict[str, Dict[str, Any]]:
+    """Scenáre: modul cez router fráz, LLM bez streamu, LLM so streamom"""
+
+    async def call(command, start):
+        return await assistant.process_command(command, remember=False), None
+
+    async def call_stream(command, start):
+        parts, first_token = [], None
+        async for chunk in assistant.process_command_stream(command, remember=False):
+            if first_token is None:
+                first_token = time.perf_counter() - start
+            parts.append(chunk)
+        return "".join(parts), first_token
+
+    scenarios = {
+        'module': (call, [MODULE_COMMANDS[i % len(MODULE_COMMANDS)] for i in range(iterations)]),
+        'llm': (call, [f"otázka číslo {i} o počasí vo vesmíre" for i in range(iterations)]),
+        'llm_stream': (call_stream, [f"vysvetli prosím tému {i}" for i in range(iterations)])
+    }
+
+    results = {}
+    for name, (make_call, commands) in scenarios.items():
+        # Zahrievacie kolo - lenivé načítanie modulov, pripojenia, indexy
+        assistant.event_loop.submit(_run_scenario(make_call, commands[:2], 1)).result()
+        latencies, errors, duration, first_tokens = assistant.event_loop.submit(
+            _run_scenario(make_call, commands, concurrency)).result()
+        results[name] = summarize(latencies, errors, duration, first_tokens)
+    return results
+
+
+def run_benchmark(iterations: int = 50, concurrency: int = 4, latency: float = 0.02,
+                  token_rate: float = 500.0, tokens: int = 20, error_rate: float = 0.0,
+                  settings: Optional[Dict[str, Any]] = None, quiet: bool = True) -> Dict[str, Any]:
+    """Spustí celý benchmark v dočasnom priečinku a vráti report"""
+    token_list = ["slovo "] * tokens
+    output = io.StringIO() if quiet else sys.stdout
+    with FakeOllamaServer(latency=latency, tokens=token_list, token_rate=token_rate,
+                          error_rate=error_rate, name="bench") as server, \
+            tempfile.TemporaryDirectory(prefix="aura-bench-") as directory, \
+            contextlib.redirect_stdout(output):
+        with assistant_workspace(directory, server.host, settings) as assistant:
+            scenarios = run_scenarios(assistant, iterations, concurrency)
+            metrics = assistant.get_performance_stats()
+
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'iterations': iterations,
+            'concurrency': concurrency,
+            'latency_s': latency,
+            'token_rate': token_rate,
+            'tokens': tokens,
+            'error_rate': error_rate
+        },
+        'scenarios': scenarios,
+        'routes': {row['labels']['stage']: {'count': row['count'], 'p50_ms': row['p50'], 'p95_ms': row['p95']}
+                   for row in metrics['routes']}
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.25,
+            min_delta_ms: float = 2.0) -> List[str]:
+    """Porovná report s baseline - vráti zoznam regresií (prázdny, ak je všetko v tolerancii)"""
+    regressions = []
+    for name, current in report.get('scenarios', {}).items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        for key in ('p50_ms', 'p95_ms'):
+            old, new = previous.get(key), current.get(key)
+            if old and new and new > old * (1 + threshold) and new - old > min_delta_ms:
+                regressions.append(f"{name}.{key}: {old:.1f} -> {new:.1f} ms (+{(new / old - 1) * 100:.0f}%)")
+        old, new = previous.get('throughput_rps'), current.get('throughput_rps')
+        if old and new and new < old * (1 - threshold):
+            regressions.append(f"{name}.throughput_rps: {old:.1f} -> {new:.1f} (-{(1 - new / old) * 100:.0f}%)")
+        if current.get('errors', 0) > previous.get('errors', 0):
+            regressions.append(f"{name}.errors: {previous.get('errors', 0)} -> {current['errors']}")
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'scenár':<12} {'počet':>6} {'chyby':>6} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9}"]
+    for name, result in report['scenarios'].items():
+        lines.append(
+            f"{name:<12} {result['count']:>6} {result['errors']:>6} {result['throughput_rps'] or 0:>8.1f} "
+            f"{result['p50_ms'] or 0:>7.1f}ms {result['p95_ms'] or 0:>7.1f}ms {result['p99_ms'] or 0:>7.1f}ms"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark AIAssistant proti falošnému Ollama serveru")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.02, help="oneskorenie servera v sekundách")
+    parser.add_argument("--token-rate", type=float, default=500.0, help="tokeny za sekundu")
+    parser.add_argument("--tokens", type=int, default=20, help="počet tokenov odpovede")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", help="kam uložiť report (JSON)")
+    parser.add_argument("--update-baseline", action="store_true", help="uloží report ako nový baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerancia regresie (0.25 = 25 %%)")
+    parser.add_argument("--verbose", action="store_true", help="nepotláčať výpisy asistenta")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.iterations, args.concurrency, args.latency, args.token_rate,
+                           args.tokens, args.error_rate, quiet=not args.verbose)
+    print(format_report(report))
+
+    targets = [args.output] if args.output else []
+    if args.update_baseline:
+        targets.append(args.baseline)
+    for path in targets:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Report uložený: {path}")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('config') != report['config']:
+        print("⚠️  Baseline bol nameraný s inou konfiguráciou - porovnanie je len orientačné")
+    regressions = compare(report, baseline, args.threshold)
+    for regression in regressions:
+        print(f"📉 Regresia: {regression}")
+    if not regressions:
+        print("✅ Bez regresií oproti baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# tests/conftest.py - Spoločné fixtures (falošný Ollama server, asistent a FileManager v dočasnom priečinku)
+import asyncio
+import contextlib
+
+import pytest
+
+from tests.fake_ollama import FakeOllamaServer
+
+# Testy nepotrebujú sémantický index ani dlhodobú pamäť - deterministické smerovanie
+TEST_SETTINGS = {
+    'semantic': {'enabled': False},
+    'long_term_memory': {'enabled': False},
+    'voice': {'enabled': False}
+}
+
+
+@pytest.fixture
+def fake_ollama():
+    with FakeOllamaServer(name="test") as server:
+        yield server
+
+
+@pytest.fixture
+def make_assistant(fake_ollama, tmp_path):
+    """Továreň na AIAssistant napojený na falošný server; vypne sa po teste"""
+    from tests.benchmark import assistant_workspace, deep_update
+
+    created = []
+    with contextlib.ExitStack() as stack:
+        def factory(modules_dir=None, **settings):
+            merged = deep_update(deep_update({}, TEST_SETTINGS), settings)
+            directory = tmp_path / f"workspace{len(created)}"
+            directory.mkdir()
+            created.append(directory)
+            return stack.enter_context(assistant_workspace(str(directory), fake_ollama.host, merged,
+                                                           modules_dir=modules_dir))
+
+        yield factory
+
+
+@pytest.fixture
+def make_file_manager(tmp_path):
+    """Továreň na FileManager s konfiguráciou v tmp_path/config (bez indexu súborov); vypne sa po teste"""
+    pytest.importorskip("paramiko")
+    from core.config_manager import ConfigManager
+    from Modules.file_manager import FileManager
+
+    created = []
+
+    def factory():
+        config_manager = ConfigManager(str(tmp_path / "config"), watch=False)
+        settings = config_manager.load_settings()
+        settings['file_index']['enabled'] = False
+        config_manager.save_settings(settings)
+        manager = FileManager(config_manager)
+        created.append((manager, config_manager))
+        return manager
+
+    yield factory
+    for manager, config_manager in created:
+        asyncio.run(manager.shutdown())
+        config_manager.close()
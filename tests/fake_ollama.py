@@ -0,0 +1,187 @@
+# tests/fake_ollama.py - Lokálny falošný Ollama server pre testy
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+EMBED_DIM = 64
+
+
+def fake_embedding(text: str, dim: int = EMBED_DIM):
+    """Deterministický embedding - hashované slová, normalizovaný vektor.
+
+    Texty so spoločnými slovami majú vysokú kosínusovú podobnosť, takže sa
+    dá testovať sémantické smerovanie aj dlhodobá pamäť bez skutočného modelu.
+    """
+    vector = [0.0] * dim
+    for word in re.findall(r"\w+", text.lower()):
+        digest = hashlib.md5(word.encode('utf-8')).digest()
+        vector[digest[0] % dim] += 1.0 if digest[1] % 2 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+class FakeOllamaServer:
+    """HTTP server napodobňujúci Ollama API (/api/chat, /api/generate, /api/embed, /api/tags).
+
+    - `latency` - oneskorenie pred prvou odpoveďou /api/chat a /api/generate (sekundy),
+    - `tokens` - časti odpovede, ktoré sa pri streamovaní posielajú po jednej,
+    - `token_interval` - pauza medzi časťami streamu,
+    - `token_rate` - alternatíva k `token_interval` v tokenoch za sekundu,
+    - `fail_status` - ak je nastavený, každá požiadavka skončí týmto HTTP stavom,
+    - `error_rate` - podiel náhodne zlyhaných požiadaviek (stav `fail_status` alebo 500),
+    - `seed` - semienko náhodných chýb pre opakovateľné behy.
+    """
+
+    def __init__(self, latency: float = 0.0, tokens=None, token_interval: float = 0.0,
+                 fail_status: int = None, name: str = "fake", token_rate: float = None,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.tokens = list(tokens or ["Ahoj", " z ", name])
+        self.token_interval = 1.0 / token_rate if token_rate else token_interval
+        self.fail_status = fail_status
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.name = name
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def request_count(self, path: str = None) -> int:
+        with self._lock:
+            return len([r for r in self.requests if path is None or r['path'] == path])
+
+    def _should_fail(self):
+        """HTTP stav, ktorým má požiadavka zlyhať, alebo None"""
+        if not self.error_rate:
+            return self.fail_status
+        with self._lock:
+            failed = self._random.random() < self.error_rate
+        return (self.fail_status or 500) if failed else None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # malé časti streamu bez oneskorenia
+
+            def log_message(self, *args):
+                pass
+
+            def _read_body(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b""
+                return json.loads(raw) if raw else {}
+
+            def _send_json(self, status: int, payload):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append({'path': self.path, 'body': None})
+                status = server._should_fail()
+                if status:
+                    self._send_json(status, {'error': 'fake failure'})
+                elif self.path == '/api/tags':
+                    self._send_json(200, {'models': [{'name': 'qwen3', 'model': 'qwen3'}]})
+                else:
+                    self._send_json(404, {'error': 'not found'})
+
+            def do_POST(self):
+                body = self._read_body()
+                with server._lock:
+                    server.requests.append({'path': self.path, 'body': body})
+                status = server._should_fail()
+                if status:
+                    self._send_json(status, {'error': 'fake failure'})
+                    return
+
+                if self.path == '/api/chat':
+                    time.sleep(server.latency)
+                    if body.get('stream', True):
+                        self._stream_chat(body)
+                    else:
+                        self._send_json(200, self._chat_part(body, "".join(server.tokens), True))
+                elif self.path == '/api/generate':
+                    time.sleep(server.latency)
+                    self._send_json(200, {'model': body.get('model'), 'response': '', 'done': True})
+                elif self.path == '/api/embed':
+                    texts = body.get('input', [])
+                    texts = [texts] if isinstance(texts, str) else texts
+                    self._send_json(200, {'model': body.get('model'),
+                                          'embeddings': [fake_embedding(text) for text in texts]})
+                elif self.path == '/api/embeddings':
+                    self._send_json(200, {'embedding': fake_embedding(body.get('prompt', ''))})
+                else:
+                    self._send_json(404, {'error': 'not found'})
+
+            def _chat_part(self, body, content, done):
+                part = {
+                    'model': body.get('model', 'qwen3'),
+                    'created_at': '2024-01-01T00:00:00Z',
+                    'message': {'role': 'assistant', 'content': content},
+                    'done': done
+                }
+                if done:
+                    part.update({
+                        'done_reason': 'stop',
+                        'prompt_eval_count': 10,
+                        'eval_count': len(server.tokens),
+                        'eval_duration': int(server.token_interval * len(server.tokens) * 1e9),
+                        'total_duration': int((server.latency + server.token_interval * len(server.tokens)) * 1e9)
+                    })
+                return part
+
+            def _stream_chat(self, body):
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                try:
+                    for index, token in enumerate(server.tokens):
+                        if index:
+                            time.sleep(server.token_interval)
+                        self._write_chunk(self._chat_part(body, token, False))
+                    self._write_chunk(self._chat_part(body, "", True))
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # klient stream zrušil (napr. prehraný hedge)
+
+            def _write_chunk(self, payload):
+                data = (json.dumps(payload) + "\n").encode('utf-8')
+                self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                self.wfile.flush()
+
+        return Handler
@@ -0,0 +1,92 @@
+# tests/test_assistent.py - AIAssistant od príkazu po odpoveď proti falošnému Ollama serveru
+import pytest
+
+pytest.importorskip("ollama")
+
+from tests.benchmark import compare, run_benchmark
+
+
+def test_module_command_does_not_call_model(make_assistant, fake_ollama):
+    assistant = make_assistant()
+
+    response = assistant.process_command_sync("pomoc")
+
+    assert "NÁPOVEDA" in response
+    assert fake_ollama.request_count('/api/chat') == 0
+    assert assistant.metrics.counter_value("module_total", module="help_module") == 1
+
+
+def test_general_question_goes_to_model(make_assistant, fake_ollama):
+    assistant = make_assistant()
+
+    response = assistant.process_command_sync("ako sa máš?")
+
+    assert response == "Ahoj z test"
+    chat_requests = [r for r in fake_ollama.requests if r['path'] == '/api/chat']
+    assert len(chat_requests) == 1
+    assert chat_requests[0]['body']['messages'][-1]['content'] == "ako sa máš?"
+    assert assistant.metrics.counter_value("model_total", model=assistant.model_name) == 1
+
+
+def test_history_is_sent_with_next_question(make_assistant, fake_ollama):
+    assistant = make_assistant()
+
+    assistant.process_command_sync("volám sa Peter")
+    assistant.process_command_sync("ako sa volám?")
+
+    messages = fake_ollama.requests[-1]['body']['messages']
+    contents = [message['content'] for message in messages]
+    assert "volám sa Peter" in contents
+    assert contents[-1] == "ako sa volám?"
+
+
+def test_stream_yields_tokens_in_order(make_assistant, fake_ollama):
+    fake_ollama.tokens = ["Raz", " dva", " tri"]
+    assistant = make_assistant()
+    chunks = []
+
+    response = assistant.process_command_stream_sync("počítaj", chunks.append)
+
+    assert chunks == ["Raz", " dva", " tri"]
+    assert response == "Raz dva tri"
+
+
+def test_server_error_is_reported_and_counted(make_assistant, fake_ollama):
+    fake_ollama.fail_status = 500
+    assistant = make_assistant()
+
+    response = assistant.process_command_sync("ako sa máš?")
+
+    assert response.startswith("❌ Ollama chyba")
+    assert assistant.metrics.counter_value("model_errors", model=assistant.model_name) == 1
+
+
+def test_response_cache_skips_repeated_request(make_assistant, fake_ollama):
+    assistant = make_assistant(cache={'cache_nondeterministic': True})
+
+    async def ask():
+        return await assistant.process_command("koľko je hodín na Marse?", remember=False)
+
+    first = assistant.event_loop.submit(ask()).result()
+    second = assistant.event_loop.submit(ask()).result()
+
+    assert first == second == "Ahoj z test"
+    assert fake_ollama.request_count('/api/chat') == 1
+    assert assistant.get_cache_stats()['hits'] == 1
+
+
+def test_benchmark_report_and_regression_check():
+    report = run_benchmark(iterations=6, concurrency=2, latency=0.0, token_rate=None, tokens=3,
+                           settings={'long_term_memory': {'enabled': False}})
+
+    assert set(report['scenarios']) == {'module', 'llm', 'llm_stream'}
+    for result in report['scenarios'].values():
+        assert result['count'] == 6
+        assert result['errors'] == 0
+        assert result['p50_ms'] <= result['p95_ms'] <= result['p99_ms']
+    assert 'first_token_p50_ms' in report['scenarios']['llm_stream']
+
+    slower = {'scenarios': {'llm': dict(report['scenarios']['llm'])}}
+    slower['scenarios']['llm']['p95_ms'] += 100.0
+    assert compare(slower, report)
+    assert compare(report, report) == []
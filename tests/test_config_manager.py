@@ -0,0 +1,82 @@
+# tests/test_config_manager.py - Snapshot nastavení, odberatelia a odložený zápis
+import json
+import os
+
+import pytest
+
+from core.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    return str(tmp_path / "config")
+
+
+def read_file(config_dir):
+    with open(os.path.join(config_dir, "settings.json"), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_file(config_dir, data):
+    with open(os.path.join(config_dir, "settings.json"), 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_snapshot_is_immutable_and_merged_with_defaults(config_dir):
+    os.makedirs(config_dir)
+    write_file(config_dir, {'ai': {'model_name': 'llama3'}})
+    manager = ConfigManager(config_dir, watch=False)
+    try:
+        assert manager.get("ai", "model_name") == "llama3"
+        assert manager.get("ai", "keep_alive") == "30m"  # doplnené z predvolených
+        with pytest.raises(TypeError):
+            manager.snapshot['ai']['model_name'] = "x"
+
+        editable = manager.load_settings()
+        editable['ai']['model_name'] = "x"
+        assert manager.get("ai", "model_name") == "llama3"
+    finally:
+        manager.close()
+
+
+def test_save_is_immediate_in_memory_and_debounced_on_disk(config_dir):
+    manager = ConfigManager(config_dir, debounce=60, watch=False)
+    events = []
+    manager.subscribe(lambda settings, changed: events.append(changed), sections=["voice"])
+    try:
+        settings = manager.load_settings()
+        settings['voice']['wake_word'] = "aura"
+        manager.save_settings(settings)
+        settings['voice']['wake_word'] = "nova"
+        manager.save_settings(settings)
+
+        assert manager.get("voice", "wake_word") == "nova"
+        assert events == [{'voice'}, {'voice'}]
+        assert read_file(config_dir)['voice'].get('wake_word') is None  # ešte nezapísané
+
+        assert manager.flush()
+        assert read_file(config_dir)['voice']['wake_word'] == "nova"
+        assert not os.path.exists(os.path.join(config_dir, "settings.json.tmp"))
+    finally:
+        manager.close()
+
+
+def test_external_change_is_published_and_broken_file_ignored(config_dir):
+    manager = ConfigManager(config_dir, watch=False, poll_interval=0)
+    events = []
+    manager.subscribe(lambda settings, changed: events.append((changed, settings['ai']['model_name'])))
+    try:
+        data = read_file(config_dir)
+        data['ai']['model_name'] = "mistral"
+        write_file(config_dir, data)
+        os.utime(os.path.join(config_dir, "settings.json"), ns=(1, 1))
+
+        assert manager.get("ai", "model_name") == "mistral"
+        assert events == [({'ai'}, "mistral")]
+
+        with open(os.path.join(config_dir, "settings.json"), 'w', encoding='utf-8') as f:
+            f.write("{rozbité")
+        assert manager.get("ai", "model_name") == "mistral"
+        assert len(events) == 1
+    finally:
+        manager.close()
@@ -0,0 +1,70 @@
+# tests/test_content_search.py - Paralelné vyhľadávanie v obsahu súborov
+import asyncio
+
+from core.content_search import ContentSearch, compile_matcher
+
+
+def make_tree(root):
+    for directory in ("src/pkg", "node_modules/lib", ".git", "data"):
+        (root / directory).mkdir(parents=True)
+    (root / "src" / "main.py").write_text("import os\n# TODO: upratať\nprint('ok')  # todo\n", encoding="utf-8")
+    (root / "src" / "pkg" / "util.py").write_text("def f():\n    return 1\n\n# Čaká na TODO\n", encoding="utf-8")
+    (root / "node_modules" / "lib" / "index.js").write_text("// TODO in dependency\n")
+    (root / ".git" / "HEAD").write_text("TODO\n")
+    (root / "data" / "blob.bin").write_bytes(b"\x00\x01TODO\x02")
+    # Veľký súbor (cez mmap) so zhodou ďaleko od začiatku
+    (root / "data" / "big.log").write_bytes(b"riadok\n" * 20000 + b"koniec TODO\n")
+
+
+def test_search_skips_pruned_and_binary_and_reports_line_numbers(tmp_path):
+    make_tree(tmp_path)
+    search = ContentSearch(workers=4, mmap_threshold=64 * 1024)
+    results = search.search(str(tmp_path), "todo")
+    assert [(r.path.replace(str(tmp_path), ""), r.line_number) for r in results] == [
+        ("/data/big.log", 20001),
+        ("/src/main.py", 2),
+        ("/src/main.py", 3),
+        ("/src/pkg/util.py", 4),
+    ]
+    assert results[1].line == "# TODO: upratať"
+
+    assert [r.line_number for r in search.search(str(tmp_path), "TODO", ignore_case=False)] == [20001, 2, 4]
+    assert [r.line for r in search.search(str(tmp_path), "čaká")] == ["# Čaká na TODO"]
+    assert [r.line_number for r in search.search(str(tmp_path / "src"), r"^def \w+", regex=True)] == [1]
+    assert search.search(str(tmp_path / "src" / "main.py"), "print")[0].line_number == 3
+    assert compile_matcher("a.b").search(b"axb") is None
+
+
+def test_search_stops_at_limit_and_streams_per_file(tmp_path):
+    for index in range(30):
+        (tmp_path / f"f{index:02}.txt").write_text("zhoda\n" * 5)
+    search = ContentSearch(workers=4, max_results=12)
+
+    async def collect():
+        items = []
+        async for item in search.stream(str(tmp_path), "ZHODA"):
+            items.append(item)
+        return items
+
+    items = asyncio.run(collect())
+    stats = items[-1]
+    batches = items[:-1]
+    assert stats['matches'] == 12 and stats['truncated']
+    assert sum(len(batch) for batch in batches) == 12
+    assert all(len({match.path for match in batch}) == 1 for batch in batches)
+    assert stats['files_scanned'] < 30
+
+
+def test_file_manager_streams_content_search(tmp_path, make_file_manager):
+    from plugins.base_plugins import StreamResult, render_result
+
+    make_tree(tmp_path / "repo")
+    manager = make_file_manager()
+    result = asyncio.run(manager.handle(f'vyhľadaj v súboroch "upratať" {tmp_path / "repo"}'))
+    assert isinstance(result, StreamResult)
+    text = asyncio.run(render_result(result))
+    assert "📄 " in text and "   2: # TODO: upratať" in text
+    assert "✅ 1 zhôd v 1 súboroch" in text
+
+    invalid = asyncio.run(manager.handle(f'vyhľadaj v súboroch "(" regex {tmp_path}'))
+    assert invalid.startswith("❌ Neplatný regulárny výraz")
@@ -0,0 +1,68 @@
+# tests/test_conversation_memory.py - Konverzačná pamäť s tokenovým rozpočtom
+from core.conversation_memory import ConversationMemory
+
+
+def fill(memory, start, count):
+    for index in range(start, start + count):
+        memory.add_turn(f"otázka {index}", "odpoveď " * 20)
+
+
+def number(turn):
+    return int(turn['user'].split()[1])
+
+
+def test_pending_stays_bounded_while_summarizing():
+    memory = ConversationMemory(recent_token_budget=100, max_pending_turns=5, summary_max_chars=10_000)
+    fill(memory, 0, 10)
+    assert memory.get_stats()['pending_turns'] <= 5
+    turns, _ = memory.take_pending()
+    assert turns and memory.summarizing
+
+    # Zhrnutie beží dlho - fronta aj tak neprekročí strop
+    fill(memory, 10, 200)
+    assert memory.get_stats()['pending_turns'] == 5
+    assert "otázka 10" not in memory.summary  # súhrn počas zhrnutia prepisuje len model
+
+    memory.apply_summary("Používateľ sa pýtal na prvé otázky.")
+    assert memory.summary.startswith("Používateľ sa pýtal na prvé otázky. otázka ")
+    assert "otázka 10" in memory.summary and "otázka 150" in memory.summary
+    # Vo fronte ostali najnovšie výmeny tesne pred doslovnou históriou
+    assert [number(turn) for turn in memory.pending] == list(range(number(memory.recent[0]) - 5,
+                                                                   number(memory.recent[0])))
+    assert f"otázka {number(memory.pending[0]) - 1}" in memory.summary
+
+
+def test_folded_summary_respects_max_chars():
+    memory = ConversationMemory(recent_token_budget=100, max_pending_turns=2, summary_max_chars=200)
+    fill(memory, 0, 6)
+    memory.take_pending()
+    fill(memory, 6, 100)
+    memory.apply_summary("Model")
+    newest_folded = number(memory.pending[0]) - 1
+    assert len(memory.summary) == 200 and memory.summary.endswith(f"otázka {newest_folded}")
+
+
+def test_folded_turns_survive_failed_summary():
+    memory = ConversationMemory(recent_token_budget=100, max_pending_turns=2, summary_max_chars=10_000)
+    fill(memory, 0, 6)
+    turns, _ = memory.take_pending()
+    fill(memory, 6, 10)
+    memory.abort_summary(turns)
+    assert not memory.summarizing
+    summary = memory.summary
+    # Zhrnuté výmeny sú v súhrne pred tými, ktoré sa zložili počas zhrnutia
+    assert summary.index(turns[0]['user']) < summary.index("otázka 6;")
+    assert memory._folded == ""
+
+
+def test_from_settings_reads_pending_bound(tmp_path):
+    from core.config_manager import ConfigManager
+
+    config_manager = ConfigManager(str(tmp_path / "config"), watch=False)
+    try:
+        settings = config_manager.load_settings()
+        assert ConversationMemory.from_settings(settings).max_pending_turns == 20
+        settings['memory']['max_pending_turns'] = 3
+        assert ConversationMemory.from_settings(settings).max_pending_turns == 3
+    finally:
+        config_manager.close()
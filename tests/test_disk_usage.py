@@ -0,0 +1,77 @@
+# tests/test_disk_usage.py - Využitie disku po priečinkoch
+import asyncio
+import os
+import threading
+
+from core.disk_usage import DiskUsage
+
+
+def make_tree(root):
+    for directory in ("videos/2024", "docs", "empty"):
+        (root / directory).mkdir(parents=True)
+    (root / "videos" / "2024" / "trip.mp4").write_bytes(b"v" * 5000)
+    (root / "videos" / "clip.mp4").write_bytes(b"v" * 1000)
+    (root / "docs" / "a.txt").write_bytes(b"t" * 300)
+    (root / "docs" / "b.TXT").write_bytes(b"t" * 200)
+    (root / "readme").write_bytes(b"r" * 10)
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_scan_sizes_views_and_incremental_rescan(tmp_path):
+    make_tree(tmp_path)
+    usage = DiskUsage(workers=4, top_files=2)
+    root = usage.scan(str(tmp_path))
+    assert (root.total_size, root.total_files, root.total_dirs) == (6510, 5, 4)
+    assert usage.stats['dirs_scanned'] == 5 and usage.stats['dirs_cached'] == 0
+
+    assert [(os.path.basename(d.path), d.total_size) for d in usage.largest_dirs(str(tmp_path))] == [
+        ("videos", 6000), ("docs", 500), ("empty", 0)]
+    assert [os.path.basename(path) for _, path in usage.largest_files(str(tmp_path), 3)] == \
+        ["trip.mp4", "clip.mp4", "a.txt"]
+    assert usage.by_extension(str(tmp_path)) == [(".mp4", 6000, 2), (".txt", 500, 2), ("", 10, 1)]
+
+    # Nová zložka hlboko v strome: prečíta sa len zmenený priečinok a nový podpriečinok
+    (tmp_path / "videos" / "2024" / "raw").mkdir()
+    (tmp_path / "videos" / "2024" / "raw" / "x.mov").write_bytes(b"m" * 90)
+    root = usage.scan(str(tmp_path))
+    assert root.total_size == 6600 and root.total_dirs == 5
+    assert usage.stats['dirs_scanned'] == 2 and usage.stats['dirs_cached'] == 4
+
+    # Zmazaná zložka zmizne aj z cache
+    (tmp_path / "docs" / "a.txt").unlink()
+    (tmp_path / "docs" / "b.TXT").unlink()
+    (tmp_path / "docs").rmdir()
+    root = usage.scan(str(tmp_path))
+    assert root.total_size == 6100 and usage.get_stats()['cached_dirs'] == 5
+
+    # Prepísaný súbor mení len mtime súboru - zachytí ho zmena mtime priečinka alebo force
+    (tmp_path / "readme").write_bytes(b"r" * 110)
+    assert usage.scan(str(tmp_path)).total_size == 6100
+    assert usage.scan(str(tmp_path), force=True).total_size == 6200
+    bump_mtime(tmp_path / "empty")
+    usage.scan(str(tmp_path))
+    assert usage.stats['dirs_scanned'] == 1
+
+
+def test_file_manager_folder_size_and_manifest(tmp_path, make_file_manager):
+    make_tree(tmp_path / "data")
+    manager = make_file_manager()
+    scan_threads = []
+    scan = manager.disk_usage.scan
+    manager.disk_usage.scan = lambda *args, **kwargs: scan_threads.append(threading.current_thread()) or \
+        scan(*args, **kwargs)
+
+    report = asyncio.run(manager.handle(f"veľkosť zložky {tmp_path / 'data'}"))
+    assert "📦 Celkom 6.4 KB - 5 súborov, 4 zložiek" in report
+    assert "videos/" in report and "videos/2024/trip.mp4" in report and ".mp4 (2 súborov)" in report
+
+    manifest = asyncio.run(manager.handle(f"manifest zložky {tmp_path / 'data'}"))
+    assert "Celkový počet súborov: 5" in manifest and ".txt: 2 súborov (500.0 B)" in manifest
+    assert manager.disk_usage.stats['dirs_cached'] == 5  # manifest použil cache
+    # Skenovanie beží mimo event loopu (vlákno executora)
+    assert len(scan_threads) == 2 and threading.main_thread() not in scan_threads
+    assert asyncio.run(manager.handle("veľkosť zložky /neexistuje/xyz")).startswith("❌")
@@ -0,0 +1,144 @@
+# tests/test_file_index.py - Index metadát súborov pre FileManager
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from core.file_index import FileIndex, WATCHDOG_AVAILABLE
+
+
+def make_tree(root):
+    for directory in ("docs", "src/app", "src/.git", "photos"):
+        (root / directory).mkdir(parents=True)
+    (root / "docs" / "Report_2024.pdf").write_bytes(b"x" * 10)
+    (root / "docs" / "report_draft.txt").write_text("draft")
+    (root / "src" / "app" / "main.py").write_text("print()")
+    (root / "src" / "app" / "report.py").write_text("")
+    (root / "src" / ".git" / "report.pack").write_text("")
+    (root / "photos" / "IMG_0001.jpg").write_text("")
+    (root / "photos" / "backup.tar.gz").write_text("")
+
+
+def names(results):
+    return sorted(os.path.basename(result['path']) for result in results)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_index_crawls_and_answers_substring_prefix_glob_and_extension(tmp_path):
+    root = tmp_path / "data"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.sqlite3"), roots=[str(root)], watch=False)
+    try:
+        index.start()
+        assert index.index_root(str(root)).result(5) == 10  # rovnaký koreň - ten istý prechod
+        assert index.index_root(str(root)).result(5) is None  # už zaindexovaný
+        assert index.is_indexed(str(root / "docs")) and not index.is_indexed(str(tmp_path))
+
+        assert names(index.search("report")) == ["Report_2024.pdf", "report.py", "report_draft.txt"]
+        assert names(index.search("rep", mode="prefix")) == names(index.search("report"))
+        assert names(index.search("*.PDF")) == ["Report_2024.pdf"]
+        assert names(index.search("*.tar.gz")) == ["backup.tar.gz"]
+        assert names(index.search("*.gz")) == ["backup.tar.gz"]
+        assert names(index.search("report_*.txt")) == ["report_draft.txt"]
+        assert names(index.search("img_????.jpg")) == ["IMG_0001.jpg"]
+        assert names(index.search("report", ext="py")) == ["report.py"]
+        assert names(index.search("report", root=str(root / "docs"))) == ["Report_2024.pdf", "report_draft.txt"]
+        assert names(index.search("ap", include_dirs=True)) == ["app"]
+        assert index.search("report")[0]['size'] >= 0
+
+        # Zmazaný súbor sa pri overení výsledkov vyradí z indexu
+        (root / "docs" / "report_draft.txt").unlink()
+        assert "report_draft.txt" not in names(index.search("report"))
+    finally:
+        index.close()
+
+    # Po reštarte je index hneď k dispozícii bez nového prechodu
+    reopened = FileIndex(str(tmp_path / "index.sqlite3"), roots=[str(root)], watch=False)
+    try:
+        reopened.start()
+        assert not reopened.is_crawling()
+        assert names(reopened.search("main")) == ["main.py"]
+        assert reopened.get_stats()['roots'][str(root)]['status'] == 'ready'
+    finally:
+        reopened.close()
+
+
+@pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog nie je nainštalovaný")
+def test_index_follows_filesystem_changes(tmp_path):
+    root = tmp_path / "live"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.sqlite3"), roots=[str(root)])
+    try:
+        index.start()
+        index.index_root(str(root)).result(5)
+
+        (root / "docs" / "novy_subor.md").write_text("ahoj")
+        assert wait_for(lambda: names(index.search("novy_subor", verify=False)) == ["novy_subor.md"])
+
+        (root / "docs" / "novy_subor.md").rename(root / "docs" / "premenovany.md")
+        assert wait_for(lambda: names(index.search(".md", verify=False)) == ["premenovany.md"])
+
+        outside = tmp_path / "outside"
+        (outside / "inner").mkdir(parents=True)
+        (outside / "inner" / "vnoreny.csv").write_text("a,b")
+        outside.rename(root / "moved_in")
+        assert wait_for(lambda: names(index.search("*.csv", verify=False)) == ["vnoreny.csv"])
+
+        (root / "photos" / "IMG_0001.jpg").unlink()
+        assert wait_for(lambda: index.search("img_", verify=False) == [])
+    finally:
+        index.close()
+
+
+def test_file_manager_search_uses_index(tmp_path):
+    pytest.importorskip("paramiko")
+    from core.config_manager import ConfigManager
+    from Modules.file_manager import FileManager
+
+    root = tmp_path / "data"
+    make_tree(root)
+    config_manager = ConfigManager(str(tmp_path / "config"), watch=False)
+    settings = config_manager.load_settings()
+    settings['file_index'].update(roots=[str(root)], watch=False)
+    config_manager.save_settings(settings)
+
+    manager = FileManager(config_manager)
+    try:
+        manager.file_index.index_root(str(root)).result(5)
+        search_threads = []
+        search = manager.file_index.search
+        manager.file_index.search = lambda *args, **kwargs: search_threads.append(threading.current_thread()) or \
+            search(*args, **kwargs)
+
+        response = asyncio.run(manager.handle(f'nájdi súbor "*.pdf" {root}'))
+        assert response.startswith("🔍 Nájdených 1 súborov") and "Report_2024.pdf" in response
+        assert "Nenašiel" in asyncio.run(manager.advanced_file_search('nájdi súbor "neexistuje"'))
+        # Vyhľadanie (s overením cez lstat) beží mimo event loopu
+        assert len(search_threads) == 2 and threading.main_thread() not in search_threads
+    finally:
+        asyncio.run(manager.shutdown())
+        config_manager.close()
+
+
+def test_file_manager_search_without_index_walks_off_event_loop(tmp_path, make_file_manager):
+    root = tmp_path / "data"
+    make_tree(root)
+    manager = make_file_manager()
+    assert manager.file_index is None
+    walk_threads = []
+    walk = manager._walk_file_search
+    manager._walk_file_search = lambda *args: walk_threads.append(threading.current_thread()) or walk(*args)
+
+    response = asyncio.run(manager.handle(f'nájdi súbor "report_2024" {root}'))
+    assert response.startswith("🔍 Nájdených 1 súborov") and "Report_2024.pdf" in response
+    assert len(walk_threads) == 1 and walk_threads[0] is not threading.main_thread()
@@ -0,0 +1,155 @@
+# tests/test_folder_sync.py - Inkrementálna synchronizácia zložiek
+import asyncio
+import errno
+import os
+
+import pytest
+
+from core.folder_sync import FolderSync, copy_contents
+
+
+def make_tree(root):
+    (root / "docs" / "old").mkdir(parents=True)
+    (root / "docs" / "a.txt").write_bytes(b"a" * 1000)
+    (root / "docs" / "old" / "b.txt").write_bytes(b"b" * 500)
+    (root / "big.bin").write_bytes(os.urandom(3 * 1024 * 1024))
+    (root / "empty_dir").mkdir()
+
+
+def shift_mtime(path, seconds):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_sync_copies_only_changes_and_uses_manifest(tmp_path):
+    source, target = tmp_path / "src", tmp_path / "dst"
+    make_tree(source)
+    sync = FolderSync(manifest_dir=str(tmp_path / "manifests"), workers=3, chunk_size=64 * 1024)
+
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['skipped'], report['errors']) == (3, 0, [])
+    assert report['bytes_transferred'] == 3 * 1024 * 1024 + 1500
+    assert (target / "big.bin").read_bytes() == (source / "big.bin").read_bytes()
+    assert (target / "empty_dir").is_dir()
+    assert os.stat(target / "docs" / "a.txt").st_mtime_ns == os.stat(source / "docs" / "a.txt").st_mtime_ns
+
+    # Bez zmien - nič sa neprenáša
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['skipped'], report['hashed']) == (0, 3, 0)
+    assert report['bytes_skipped'] == report['bytes_transferred'] + 3 * 1024 * 1024 + 1500
+
+    # Zmenený obsah (iná veľkosť) aj zmena s rovnakou veľkosťou a iným časom
+    (source / "docs" / "a.txt").write_bytes(b"A" * 1001)
+    (source / "docs" / "old" / "b.txt").write_bytes(b"c" * 500)
+    shift_mtime(source / "docs" / "old" / "b.txt", 10)
+    # Rovnaký obsah s iným časom - overí sa hashom a čas sa zjednotí
+    shift_mtime(target / "big.bin", -10)
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['skipped'], report['hashed']) == (2, 1, 4)
+    assert (target / "docs" / "old" / "b.txt").read_bytes() == b"c" * 500
+    assert int(os.stat(target / "big.bin").st_mtime) == int(os.stat(source / "big.bin").st_mtime)
+
+    # Hash zdroja je v manifeste - pri ďalšom rozdiele času sa hashuje len cieľ
+    shift_mtime(target / "big.bin", -10)
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['hashed']) == (0, 1)
+    assert not list(target.rglob("*.aura-part"))
+
+
+def test_sync_decides_same_size_different_mtime_by_hash(tmp_path):
+    source, target = tmp_path / "src", tmp_path / "dst"
+    make_tree(source)
+    sync = FolderSync(workers=2)
+    sync.sync(str(source), str(target))
+
+    # Rovnaký obsah, iný čas - preskočí sa po porovnaní hashov a čas sa zjednotí
+    shift_mtime(target / "docs" / "a.txt", 100)
+    # Iný obsah s rovnakou veľkosťou a iným časom - skopíruje sa
+    (target / "docs" / "old" / "b.txt").write_bytes(b"z" * 500)
+    shift_mtime(target / "docs" / "old" / "b.txt", 100)
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['skipped'], report['hashed']) == (1, 2, 4)
+    assert (target / "docs" / "old" / "b.txt").read_bytes() == b"b" * 500
+    assert int(os.stat(target / "docs" / "a.txt").st_mtime) == int(os.stat(source / "docs" / "a.txt").st_mtime)
+
+    report = sync.sync(str(source), str(target))
+    assert (report['copied'], report['hashed']) == (0, 0)
+
+
+def test_sync_deletes_orphans_and_supports_dry_run(tmp_path):
+    source, target = tmp_path / "src", tmp_path / "dst"
+    make_tree(source)
+    sync = FolderSync(workers=2)
+    sync.sync(str(source), str(target))
+    (target / "extra" / "deep").mkdir(parents=True)
+    (target / "extra" / "deep" / "x.tmp").write_text("x")
+    (target / "orphan.txt").write_text("o")
+    (source / "docs" / "new.txt").write_text("nový")
+
+    preview = sync.sync(str(source), str(target), delete_orphans=True, dry_run=True)
+    assert (preview['copied'], preview['deleted']) == (1, 4)
+    assert (target / "orphan.txt").exists() and not (target / "docs" / "new.txt").exists()
+
+    report = sync.sync(str(source), str(target), delete_orphans=True)
+    assert (report['copied'], report['deleted'], report['errors']) == (1, 4, [])
+    assert not (target / "extra").exists() and not (target / "orphan.txt").exists()
+    assert (target / "docs" / "new.txt").read_text() == "nový"
+
+    with pytest.raises(ValueError):
+        sync.sync(str(source), str(source / "docs"))
+
+
+def test_sync_rejects_source_inside_target(tmp_path):
+    source = tmp_path / "src"
+    make_tree(source)
+    (tmp_path / "other.txt").write_text("nesúvisiaci súbor")
+
+    with pytest.raises(ValueError):
+        FolderSync().sync(str(source), str(tmp_path), delete_orphans=True)
+    assert (tmp_path / "other.txt").exists() and (source / "docs" / "a.txt").exists()
+
+
+def copy_with(tmp_path, data):
+    with open(tmp_path / "a", "rb") as fsrc, open(tmp_path / "b", "wb") as fdst:
+        method = copy_contents(fsrc, fdst)
+    assert (tmp_path / "b").read_bytes() == data
+    return method
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile nie je k dispozícii")
+def test_copy_contents_falls_back_when_kernel_copy_is_unsupported(tmp_path, monkeypatch):
+    data = os.urandom(200_000)
+    (tmp_path / "a").write_bytes(data)
+
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, "copy_file_range")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    assert copy_with(tmp_path, data) == "sendfile"
+
+    # 0 pred koncom súboru nie je koniec - pokračuje sa ďalším spôsobom od skopírovaného miesta
+    calls = []
+
+    def stops_early(src_fd, dst_fd, count, offset_src, offset_dst):
+        calls.append(offset_src)
+        if calls[1:]:
+            return 0
+        os.pwrite(dst_fd, os.pread(src_fd, 1000, offset_src), offset_dst)
+        return 1000
+
+    monkeypatch.setattr(os, "copy_file_range", stops_early, raising=False)
+    assert copy_with(tmp_path, data) == "sendfile" and calls == [0, 1000]
+
+    monkeypatch.delattr(os, "sendfile")
+    assert copy_with(tmp_path, data) == "buffered"
+
+
+def test_file_manager_sync_folders_reports_transfer(tmp_path, make_file_manager):
+    make_tree(tmp_path / "src")
+    manager = make_file_manager()
+    command = f"synchronizuj zložky {tmp_path / 'src'} {tmp_path / 'dst'}"
+    first = asyncio.run(manager.handle(command))
+    assert first.startswith("✅ Synchronizované") and "Prenesené: 3 súborov (3.0 MB)" in first
+    second = asyncio.run(manager.handle(command))
+    assert "Prenesené: 0 súborov" in second and "Preskočené: 3 súborov" in second
+    assert os.listdir(tmp_path / "config" / "sync_manifests")
@@ -0,0 +1,103 @@
+# tests/test_intent_router.py - Smerovanie príkazov malým modelom
+import asyncio
+import json
+
+from core.intent_router import IntentRouter
+
+
+class StubClient:
+    """Namiesto Ollama klienta - vracia pripravené odpovede a počíta volania"""
+
+    def __init__(self, *contents, delay=0.0, error=None):
+        self.contents = list(contents)
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    async def chat(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {'message': {'content': self.contents.pop(0)}}
+
+
+class Weather:
+    """Počasie"""
+    supported_commands = ["aké je počasie"]
+
+
+MODULES = {'weather': Weather()}
+
+
+def decision(**data):
+    return json.dumps(data, ensure_ascii=False)
+
+
+def test_parse_decision_validates_model_output():
+    router = IntentRouter("malý", max_answer_chars=20)
+    assert router._parse_decision(decision(action="module", module="weather"), MODULES) == \
+        {'action': 'module', 'module': 'weather'}
+    assert router._parse_decision(decision(action="answer", answer=" Ahoj! "), MODULES) == \
+        {'action': 'answer', 'answer': 'Ahoj!'}
+
+    escalate = {'action': 'escalate'}
+    assert router._parse_decision(decision(action="module", module="neexistuje"), MODULES) == escalate
+    assert router._parse_decision(decision(action="answer", answer="x" * 21), MODULES) == escalate
+    assert router._parse_decision(decision(action="answer", answer=""), MODULES) == escalate
+    assert router._parse_decision(decision(action="spusti"), MODULES) == escalate
+    assert router._parse_decision("[1, 2]", MODULES) == escalate
+    assert router._parse_decision("nie je json", MODULES) == escalate
+    assert router._parse_decision(None, MODULES) == escalate
+
+
+def test_route_caches_routing_but_not_answers():
+    router = IntentRouter("malý")
+    client = StubClient(decision(action="module", module="weather"),
+                        decision(action="escalate"),
+                        decision(action="answer", answer="Je 10:00."),
+                        decision(action="answer", answer="Je 10:05."))
+
+    async def scenario():
+        assert await router.route(client, "Počasie v Bratislave?", MODULES) == {'action': 'module', 'module': 'weather'}
+        # Normalizovaný rovnaký príkaz - z cache, bez volania modelu
+        assert await router.route(client, "počasie v bratislave", MODULES) == {'action': 'module', 'module': 'weather'}
+        assert await router.route(client, "napíš esej", MODULES) == {'action': 'escalate'}
+        assert await router.route(client, "napíš esej", MODULES) == {'action': 'escalate'}
+        # Odpovede závisia od času a kontextu - model sa pýta vždy znovu
+        assert (await router.route(client, "koľko je hodín", MODULES))['answer'] == "Je 10:00."
+        assert (await router.route(client, "koľko je hodín", MODULES))['answer'] == "Je 10:05."
+
+    asyncio.run(scenario())
+    assert len(client.calls) == 4
+    assert client.calls[0]['model'] == "malý" and client.calls[0]['format'] == 'json'
+    assert "- weather: aké je počasie" in client.calls[0]['messages'][0]['content']
+    stats = router.get_stats()
+    assert (stats['cache_hits'], stats['module'], stats['escalate'], stats['answer'], stats['cache_size']) == \
+        (2, 1, 1, 2, 2)
+
+
+def test_route_escalates_on_error_timeout_and_long_commands():
+    router = IntentRouter("malý", timeout=0.05, max_prompt_chars=30)
+
+    async def scenario():
+        assert await router.route(StubClient(error=ConnectionError("nedostupný")), "ahoj", MODULES) == \
+            {'action': 'escalate'}
+        slow = StubClient(decision(action="module", module="weather"), delay=1.0)
+        assert await router.route(slow, "počasie", MODULES) == {'action': 'escalate'}
+        unused = StubClient()
+        assert await router.route(unused, "x" * 31, MODULES) == {'action': 'escalate'}
+        assert unused.calls == []
+
+        # Modul z cache, ktorý medzitým zmizol, sa znovu overí modelom
+        client = StubClient(decision(action="module", module="weather"), decision(action="escalate"))
+        await router.route(client, "počasie zajtra", MODULES)
+        assert await router.route(client, "počasie zajtra", {}) == {'action': 'escalate'}
+        assert len(client.calls) == 2
+
+    asyncio.run(scenario())
+    stats = router.get_stats()
+    assert (stats['errors'], stats['skipped']) == (2, 1)
+    # Chyby sa nepamätajú; nové rozhodnutie prepíše neplatné z cache
+    assert stats['cache_size'] == 1
@@ -0,0 +1,126 @@
+# tests/test_long_term_memory.py - Dlhodobá pamäť (JSONL + .f32 embeddingy) bez Ollama
+import asyncio
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core import long_term_memory  # noqa: E402
+from core.long_term_memory import LongTermMemory  # noqa: E402
+from tests.fake_ollama import EMBED_DIM, fake_embedding  # noqa: E402
+
+EXCHANGES = [
+    ("ako sa volá môj pes", "Tvoj pes sa volá Rex."),
+    ("kde bývam", "Bývaš v Košiciach."),
+    ("aké je moje obľúbené jedlo", "Tvoje obľúbené jedlo sú halušky."),
+]
+
+
+class StubEmbedder:
+    """Namiesto embed_texts - deterministické embeddingy, pamätá si embedované texty"""
+
+    def __init__(self):
+        self.texts = []
+        self.delay = 0.0
+
+    async def __call__(self, client, model, texts):
+        self.texts.extend(texts)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return [fake_embedding(text) for text in texts]
+
+
+@pytest.fixture
+def embedder(monkeypatch):
+    stub = StubEmbedder()
+    monkeypatch.setattr(long_term_memory, "embed_texts", stub)
+    return stub
+
+
+def remember(memory, exchanges):
+    async def scenario():
+        await memory.start(client=None)
+        for user_input, ai_response in exchanges:
+            memory.add(None, user_input, ai_response)
+        await memory._indexer
+
+    asyncio.run(scenario())
+
+
+def test_exchanges_persist_to_jsonl_and_f32_and_reload_without_embedding(tmp_path, embedder):
+    memory = LongTermMemory(str(tmp_path))
+    remember(memory, EXCHANGES)
+    assert memory.get_stats()['records'] == memory.get_stats()['vectors'] == 3
+
+    lines = (tmp_path / "long_term_memory.jsonl").read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['user'] for line in lines] == [user for user, _ in EXCHANGES]
+    assert os.path.getsize(tmp_path / "long_term_memory.f32") == 3 * EMBED_DIM * 4
+    assert json.loads((tmp_path / "long_term_memory.json").read_text()) == \
+        {'model': memory.model, 'dim': EMBED_DIM}
+
+    embedder.texts.clear()
+    reloaded = LongTermMemory(str(tmp_path))
+    asyncio.run(reloaded.start(client=None))
+    assert reloaded.get_stats()['vectors'] == 3 and embedder.texts == []
+    assert np.allclose(reloaded._matrix[:3], memory._matrix[:3])
+
+    # Embeddingy iného modelu sa zahodia a dopočítajú
+    other = LongTermMemory(str(tmp_path), model="iný-model")
+    assert other._load_files()[1] is None
+    assert not (tmp_path / "long_term_memory.f32").exists()
+
+
+def test_load_files_recovers_from_crash_mid_write(tmp_path, embedder):
+    remember(LongTermMemory(str(tmp_path)), EXCHANGES)
+    # Pád: výmena zapísaná bez embeddingu, neúplný riadok JSONL a neúplný vektor
+    with open(tmp_path / "long_term_memory.jsonl", 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'timestamp': 1.0, 'user': "koľko mám rokov", 'ai': "35"}) + "\n")
+        f.write('{"timestamp": 2.0, "user": "neúpl')
+    with open(tmp_path / "long_term_memory.f32", 'ab') as f:
+        f.write(b"\x00" * 10)
+
+    memory = LongTermMemory(str(tmp_path))
+    records, vectors = memory._load_files()
+    assert [record['user'] for record in records][-1] == "koľko mám rokov" and len(records) == 4
+    assert vectors.shape == (3, EMBED_DIM)
+    assert os.path.getsize(tmp_path / "long_term_memory.f32") == 3 * EMBED_DIM * 4  # zarovnané na riadky
+
+    # Výmena bez embeddingu sa pri štarte dopočíta
+    embedder.texts.clear()
+
+    async def scenario():
+        await memory.start(client=None)
+        await memory._indexer
+
+    asyncio.run(scenario())
+    assert embedder.texts == ["Používateľ: koľko mám rokov\nAsistent: 35"]
+    assert memory.get_stats()['vectors'] == 4
+    assert os.path.getsize(tmp_path / "long_term_memory.f32") == 4 * EMBED_DIM * 4
+
+
+def test_retrieve_ranks_excludes_and_respects_latency_budget(tmp_path, embedder):
+    memory = LongTermMemory(str(tmp_path), top_k=1, min_score=0.3, latency_budget=0.05)
+    remember(memory, EXCHANGES)
+
+    results = asyncio.run(memory.retrieve(None, "ako sa volá môj pes"))
+    assert [result['user'] for result in results] == ["ako sa volá môj pes"]
+    assert "Rex" in memory.format_snippets(results)
+
+    # Aktuálna výmena (už v krátkodobej pamäti) sa preskočí a miesto dostane ďalšia najbližšia
+    memory.min_score = 0.05
+    results = asyncio.run(memory.retrieve(None, "ako sa volá môj pes", exclude={"ako sa volá môj pes"}))
+    assert [result['user'] for result in results] == ["aké je moje obľúbené jedlo"]
+    memory.min_score = 0.3
+
+    assert asyncio.run(memory.retrieve(None, "xyz qwv")) == []  # pod min_score
+
+    # Pomalý embedding dopytu - prompt ide bez spomienok
+    embedder.delay = 0.5
+    assert asyncio.run(memory.retrieve(None, "kde bývam teraz")) == []
+    assert memory.stats['timeouts'] == 1
+    embedder.delay = 0.0
+    # Dopyt z cache nepotrebuje embedding - rozpočet sa nepresiahne
+    assert asyncio.run(memory.retrieve(None, "ako sa volá môj pes"))[0]['user'] == "ako sa volá môj pes"
+    assert memory.stats['timeouts'] == 1
@@ -0,0 +1,185 @@
+# tests/test_modules.py - Moduly, manifest a smerovanie príkazov
+import asyncio
+import importlib.util
+import os
+import threading
+import time
+
+import pytest
+
+from core.command_router import CommandRouter, normalize_command
+from core.module_manifest import LazyModule, ModuleManifest, scan_module_file
+
+MODULES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Modules")
+
+
+def load_module_class(module_name, class_name):
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(MODULES_DIR, f"{module_name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+class StubModule:
+    def __init__(self, commands):
+        self.supported_commands = commands
+
+    async def handle(self, command):
+        return command
+
+
+class OpaqueModule:
+    """Modul bez zoznamu príkazov - rozhoduje len can_handle"""
+
+    def can_handle(self, command):
+        return command.startswith("!")
+
+
+def test_help_module_answers():
+    help_module = load_module_class("help_module", "HelpModule")()
+
+    assert help_module.can_handle("Pomoc prosím")
+    assert "VŠEOBECNÁ NÁPOVEDA" in asyncio.run(help_module.handle("pomoc"))
+    assert "MODULES" in asyncio.run(help_module.handle("moduly"))
+    assert "Príkazová príručka" in asyncio.run(help_module.handle("zoznam príkazov"))
+
+
+def test_router_prefers_longest_phrase_and_ignores_diacritics():
+    router = CommandRouter()
+    router.add_module("files", StubModule(["súbor", "vytvor súbor"]))
+    router.add_module("folders", StubModule(["vytvor súbor v zložke"]))
+
+    assert router.match("Vytvor subor test.txt") == "files"
+    assert router.match("vytvor súbor v zložke dokumenty") == "folders"
+    assert router.match("aké je počasie") is None
+
+
+def test_router_falls_back_to_can_handle_and_tracks_removal():
+    router = CommandRouter()
+    router.add_module("files", StubModule(["súbor"]))
+    router.add_module("opaque", OpaqueModule())
+
+    assert router.match("!reštart") == "opaque"
+    router.remove_module("files")
+    assert router.match("zmaž súbor") is None
+    assert router.get_stats()['opaque_modules'] == 1
+
+
+def test_normalize_command():
+    assert normalize_command("  Aké   je POČASIE?! ") == "ake je pocasie"
+
+
+def test_manifest_reads_commands_without_import(tmp_path):
+    module_path = tmp_path / "sample_tool.py"
+    module_path.write_text(
+        "import neexistujuca_kniznica\n\n"
+        "class SampleTool:\n"
+        "    \"\"\"Ukážkový modul\"\"\"\n"
+        "    def __init__(self):\n"
+        "        self.supported_commands = ['ukáž vzorku', 'vzorka']\n",
+        encoding='utf-8'
+    )
+
+    entry = scan_module_file(str(module_path))
+    assert entry == {'class_name': 'SampleTool', 'commands': ['ukáž vzorku', 'vzorka'],
+                     'doc': 'Ukážkový modul', 'heavy': False,
+                     'max_concurrency': 0, 'warmup_on_start': False, 'found': True}
+
+    manifest = ModuleManifest(str(tmp_path / "manifest.json"))
+    manifest.get(str(module_path))
+    manifest.save()
+    cached = ModuleManifest(str(tmp_path / "manifest.json"))
+    assert cached.entries[str(module_path.resolve())]['commands'] == ['ukáž vzorku', 'vzorka']
+
+
+def test_lazy_module_loads_on_first_command():
+    loads = []
+
+    def loader(module_name, module_path, class_name):
+        loads.append(module_name)
+        return StubModule(["ozvena"])
+
+    lazy = LazyModule("echo", "echo.py", {'class_name': 'Echo', 'commands': ['ozvena']}, loader)
+    assert not lazy.loaded
+    assert lazy.can_handle("Ozvena test")
+
+    assert asyncio.run(lazy.handle("ozvena test")) == "ozvena test"
+    asyncio.run(lazy.handle("ozvena znova"))
+    assert loads == ["echo"]
+
+
+ECHO_MODULE = '''
+class EchoTool:
+    def __init__(self):
+        self.supported_commands = ["ozvena"]
+
+    async def handle(self, command):
+        return "{answer}"
+'''
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_hot_reload_swaps_changed_module_and_keeps_old_on_error(make_assistant, tmp_path):
+    pytest.importorskip("ollama")
+    modules_dir = tmp_path / "plugins"
+    modules_dir.mkdir()
+    echo_file = modules_dir / "echo_tool.py"
+    echo_file.write_text(ECHO_MODULE.format(answer="v1"), encoding='utf-8')
+
+    assistant = make_assistant(modules_dir=str(modules_dir),
+                               hot_reload={'debounce_ms': 20, 'poll_interval': 0.05})
+    assert assistant.process_command_sync("ozvena") == "v1"
+
+    echo_file.write_text(ECHO_MODULE.format(answer="verzia 2"), encoding='utf-8')
+    assert wait_for(lambda: assistant.process_command_sync("ozvena") == "verzia 2")
+
+    # Chybná verzia sa nenačíta - ďalej slúži posledná funkčná
+    echo_file.write_text("class EchoTool(:\n", encoding='utf-8')
+    assert wait_for(lambda: assistant.get_module_reload_stats()['failed'] >= 1)
+    assert assistant.process_command_sync("ozvena") == "verzia 2"
+
+    # ... aj s vlastnosťami svojho súboru (nová verzia by bežala v procese a pod inou triedou)
+    module_file = dict(assistant.module_files["echo_tool"])
+    echo_file.write_text("MODULE_HEAVY = True\n\n\nclass EchoToolV3:\n"
+                         "    def __init__(self):\n        raise RuntimeError('pokazené')\n", encoding='utf-8')
+    assert wait_for(lambda: assistant.get_module_reload_stats()['failed'] >= 2)
+    assert assistant.module_files["echo_tool"] == module_file and not module_file['heavy']
+    assert assistant.process_command_sync("ozvena") == "verzia 2"
+
+    # Nový súbor sa zaregistruje, zmazaný odregistruje
+    (modules_dir / "ping_tool.py").write_text(
+        ECHO_MODULE.replace("EchoTool", "PingTool").replace("ozvena", "ping").format(answer="pong"),
+        encoding='utf-8')
+    assert wait_for(lambda: "ping_tool" in assistant.modules)
+    assert assistant.process_command_sync("ping") == "pong"
+
+    echo_file.unlink()
+    assert wait_for(lambda: "echo_tool" not in assistant.modules)
+    assert assistant.find_module_for_command("ozvena") == (None, None)
+
+
+def test_register_and_remove_from_ui_thread_run_in_event_loop(make_assistant):
+    pytest.importorskip("ollama")
+    assistant = make_assistant()
+    threads = []
+    for name in ("add_module", "remove_module"):
+        original = getattr(assistant.router, name)
+        setattr(assistant.router, name,
+                lambda *args, original=original: threads.append(threading.current_thread()) or original(*args))
+
+    version = assistant.modules_version
+    assistant.register_module("ozvena", StubModule(["ozvena"]), {'path': "ozvena.py", 'class_name': "Ozvena",
+                                                                 'heavy': False, 'max_concurrency': 0})
+    assert assistant.find_module_for_command("ozvena")[0] == "ozvena"
+    assert assistant.module_files["ozvena"]['class_name'] == "Ozvena"
+    assert assistant.remove_module("ozvena") and not assistant.remove_module("ozvena")
+    assert "ozvena" not in assistant.module_files and assistant.modules_version > version
+    assert threads and all(thread is assistant.event_loop.thread for thread in threads)
@@ -0,0 +1,117 @@
+# tests/test_ollama_pool.py - Pool Ollama serverov proti falošným serverom
+import asyncio
+import socket
+import time
+
+import pytest
+
+ollama = pytest.importorskip("ollama")
+
+from core.ollama_pool import OllamaPool
+from tests.fake_ollama import FakeOllamaServer
+
+MESSAGES = [{'role': 'user', 'content': 'ahoj'}]
+
+
+def make_pool(hosts, **kwargs):
+    kwargs.setdefault('health_interval', 0)
+    return OllamaPool(hosts, lambda host: ollama.AsyncClient(host=host), **kwargs)
+
+
+def unused_host() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+async def collect(stream):
+    return "".join([part['message']['content'] async for part in stream])
+
+
+def test_least_outstanding_spreads_concurrent_requests():
+    with FakeOllamaServer(latency=0.2, name="a") as a, FakeOllamaServer(latency=0.2, name="b") as b:
+        async def run():
+            pool = make_pool([a.host, b.host])
+            try:
+                await asyncio.gather(*(pool.chat(model='qwen3', messages=MESSAGES) for _ in range(4)))
+            finally:
+                await pool.close()
+
+        asyncio.run(run())
+        assert a.request_count('/api/chat') == 2
+        assert b.request_count('/api/chat') == 2
+
+
+def test_failover_to_healthy_endpoint():
+    with FakeOllamaServer(name="b") as b:
+        async def run():
+            pool = make_pool([unused_host(), b.host])
+            try:
+                response = await pool.chat(model='qwen3', messages=MESSAGES)
+                stream_text = await collect(await pool.chat(model='qwen3', messages=MESSAGES, stream=True))
+                return response, stream_text, pool.get_stats()
+            finally:
+                await pool.close()
+
+        response, stream_text, stats = asyncio.run(run())
+        assert response['message']['content'] == "Ahoj z b"
+        assert stream_text == "Ahoj z b"
+        assert stats['failovers'] == 1
+        assert stats['endpoints'][0]['healthy'] is False
+
+
+def test_server_error_fails_over_but_bad_request_does_not():
+    with FakeOllamaServer(fail_status=500, name="a") as a, FakeOllamaServer(name="b") as b:
+        async def run():
+            pool = make_pool([a.host, b.host])
+            try:
+                return await pool.chat(model='qwen3', messages=MESSAGES)
+            finally:
+                await pool.close()
+
+        assert asyncio.run(run())['message']['content'] == "Ahoj z b"
+
+    with FakeOllamaServer(fail_status=400, name="a") as a, FakeOllamaServer(name="b") as b:
+        async def run_bad():
+            pool = make_pool([a.host, b.host])
+            try:
+                await pool.chat(model='qwen3', messages=MESSAGES)
+            finally:
+                await pool.close()
+
+        with pytest.raises(ollama.ResponseError):
+            asyncio.run(run_bad())
+        assert b.request_count() == 0
+
+
+def test_hedged_stream_uses_faster_endpoint():
+    with FakeOllamaServer(latency=1.5, name="slow") as slow, FakeOllamaServer(latency=0.05, name="fast") as fast:
+        async def run():
+            pool = make_pool([slow.host, fast.host], hedge=True, hedge_min_samples=5)
+            pool._latencies['stream'].extend([0.1] * 10)  # p95 prvého tokenu ~100 ms
+            try:
+                start = time.monotonic()
+                text = await collect(await pool.chat(model='qwen3', messages=MESSAGES, stream=True))
+                return text, time.monotonic() - start, pool.get_stats()
+            finally:
+                await pool.close()
+
+        text, elapsed, stats = asyncio.run(run())
+        assert text == "Ahoj z fast"
+        assert elapsed < 1.0
+        assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+        assert all(endpoint['outstanding'] == 0 for endpoint in stats['endpoints'])
+
+
+def test_health_check_restores_endpoint():
+    with FakeOllamaServer(name="a") as a, FakeOllamaServer(name="b") as b:
+        async def run():
+            pool = make_pool([a.host, b.host])
+            try:
+                pool.endpoints[0].healthy = False
+                await pool.check_health()
+                return [endpoint.healthy for endpoint in pool.endpoints]
+            finally:
+                await pool.close()
+
+        assert asyncio.run(run()) == [True, True]
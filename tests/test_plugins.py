@@ -0,0 +1,121 @@
+# tests/test_plugins.py - BasePlugin, adaptér starších modulov a štruktúrované výsledky
+import asyncio
+import time
+
+import pytest
+
+from plugins.base_plugins import (BasePlugin, PluginAdapter, ListResult, TableResult, StreamResult,
+                                  as_plugin, render_result)
+
+PLUGIN_MODULE = '''import asyncio
+
+from plugins.base_plugins import BasePlugin, TableResult, StreamResult
+
+
+class CounterPlugin(BasePlugin):
+    """Testovací plugin"""
+
+    commands = ("počítadlo", "tabuľka", "prúd")
+    max_concurrency = 1
+    expected_cost = "io"
+
+    def __init__(self, config_manager=None):
+        super().__init__(config_manager)
+        self.warmups = 0
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+
+    async def warmup(self):
+        self.warmups += 1
+
+    async def shutdown(self):
+        self.closed = True
+
+    async def handle(self, command):
+        if "tabuľka" in command:
+            return TableResult(["modul", "stav"], [["počítadlo", "ok"]])
+        if "prúd" in command:
+            async def chunks():
+                for part in ("a", "b", "c"):
+                    yield part
+            return StreamResult(chunks())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return "hotovo"
+'''
+
+
+class LegacyModule:
+    """Starší modul bez BasePlugin"""
+
+    def __init__(self):
+        self.supported_commands = ["starý príkaz"]
+        self.started = False
+
+    def can_handle(self, command):
+        return "starý" in command
+
+    async def handle(self, command):
+        return ListResult(["jeden", "dva"], title="Položky")
+
+    def warmup(self):
+        self.started = True
+
+
+def test_results_render_and_adapter_wraps_legacy_module():
+    table = TableResult(["názov", "veľkosť"], [["a.txt", 10], ["dlhý_súbor.bin", 2048]], title="Súbory")
+    assert table.to_text().splitlines() == [
+        "**Súbory:**",
+        "názov           veľkosť",
+        "--------------  -------",
+        "a.txt           10",
+        "dlhý_súbor.bin  2048",
+    ]
+
+    module = LegacyModule()
+    plugin = as_plugin(module, "legacy")
+    assert isinstance(plugin, PluginAdapter) and plugin.name == "legacy"
+    assert plugin.commands == ("starý príkaz",) and plugin.max_concurrency == 0
+    assert plugin.can_handle("starý") and plugin.has_warmup
+    asyncio.run(plugin.warmup())
+    assert module.started
+    assert asyncio.run(render_result(asyncio.run(plugin.handle("starý príkaz")))) == \
+        "**Položky:**\n- jeden\n- dva"
+    assert plugin.health() == {'status': 'ok'}
+
+    class Native(BasePlugin):
+        commands = ("x",)
+    native = Native()
+    assert as_plugin(native) is native and native.supported_commands == ["x"] and not native.has_warmup
+
+
+def test_assistant_warms_limits_and_streams_plugin(make_assistant, tmp_path):
+    pytest.importorskip("ollama")
+    modules_dir = tmp_path / "plugins_dir"
+    modules_dir.mkdir()
+    (modules_dir / "counter_plugin.py").write_text(PLUGIN_MODULE, encoding='utf-8')
+
+    assistant = make_assistant(modules_dir=str(modules_dir))
+    # Príkazy z `commands` stačia manifestu - modul sa neimportuje pri štarte
+    assert not assistant.modules["counter_plugin"].loaded
+    assert assistant.get_plugin_health()["counter_plugin"] == {'status': 'not_loaded'}
+
+    handles = [assistant.submit_command("počítadlo", source="dashboard") for _ in range(4)]
+    assert [handle.result(5) for handle in handles] == ["hotovo"] * 4
+    plugin = assistant.modules["counter_plugin"].load()
+    assert plugin.warmups == 1 and plugin.peak == 1  # max_concurrency = 1
+
+    assert assistant.process_command_sync("tabuľka").startswith("modul")
+    chunks = []
+    assert assistant.process_command_stream_sync("prúd", chunks.append) == "abc"
+    assert chunks == ["a", "b", "c"]
+    assert assistant.get_plugin_health()["counter_plugin"] == {'status': 'ok', 'warmed': True}
+
+    assert assistant.remove_module("counter_plugin")
+    deadline = time.monotonic() + 2
+    while not plugin.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert plugin.closed
@@ -0,0 +1,90 @@
+# tests/test_process_pool.py - Ťažké moduly v samostatných procesoch
+import asyncio
+import os
+
+import pytest
+
+from core.process_pool import (ModuleProcessPool, ModuleTimeoutError, ModuleCrashError,
+                               ModuleExecutionError)
+
+WORKER_MODULE = '''import os
+import time
+
+MODULE_HEAVY = True
+
+
+class WorkerTool:
+    def __init__(self):
+        self.supported_commands = ["pid", "spi", "padni", "chyba"]
+
+    async def handle(self, command):
+        if command == "spi":
+            time.sleep(30)
+        if command == "padni":
+            os._exit(3)
+        if command == "chyba":
+            raise ValueError("zlý príkaz")
+        return "{answer}:" + str(os.getpid())
+'''
+
+
+def write_module(path, answer="v1"):
+    path.write_text(WORKER_MODULE.format(answer=answer), encoding='utf-8')
+    # Rovnaká veľkosť v tej istej milisekunde by vyzerala ako nezmenený súbor
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_pool_runs_module_in_worker_and_recovers_from_timeout_and_crash(tmp_path):
+    module_path = tmp_path / "worker_tool.py"
+    write_module(module_path)
+    pool = ModuleProcessPool(workers=1, timeout=10.0, config_dir=str(tmp_path))
+
+    def call(command, timeout=None):
+        return asyncio.run(pool.call("worker_tool", str(module_path), "WorkerTool", command, timeout=timeout))
+
+    try:
+        answer, pid = call("pid").split(":")
+        assert answer == "v1" and int(pid) != os.getpid()
+        assert call("pid") == f"v1:{pid}"  # teplý worker, tá istá inštancia procesu
+
+        with pytest.raises(ModuleExecutionError, match="zlý príkaz"):
+            call("chyba")
+        assert call("pid") == f"v1:{pid}"  # výnimka v handle workera neukončí
+
+        with pytest.raises(ModuleTimeoutError):
+            call("spi", timeout=0.5)
+        answer, restarted_pid = call("pid").split(":")
+        assert restarted_pid != pid
+
+        with pytest.raises(ModuleCrashError):
+            call("padni")
+        answer, crashed_pid = call("pid").split(":")
+        assert crashed_pid not in (pid, restarted_pid)
+
+        # Zmenený súbor sa vo workeri načíta nanovo
+        write_module(module_path, answer="v2")
+        assert call("pid").startswith("v2:")
+
+        stats = pool.get_stats()
+        assert stats['timeouts'] == 1 and stats['crashes'] == 1 and stats['errors'] == 1
+        assert stats['restarts'] == 2
+    finally:
+        pool.close()
+
+
+def test_assistant_routes_heavy_module_through_process_pool(make_assistant, tmp_path):
+    pytest.importorskip("ollama")
+    modules_dir = tmp_path / "heavy"
+    modules_dir.mkdir()
+    write_module(modules_dir / "worker_tool.py")
+
+    assistant = make_assistant(modules_dir=str(modules_dir), process_pool={'workers': 1})
+    assert assistant.is_heavy_module("worker_tool")
+    answer, pid = assistant.process_command_sync("pid").split(":")
+    assert answer == "v1" and int(pid) != os.getpid()
+
+    # Chyba workera sa vráti ako bežná chybová odpoveď, ďalší príkaz už funguje
+    assert assistant.process_command_sync("padni").startswith("❌")
+    assert assistant.process_command_sync("pid").startswith("v1:")
+    assert assistant.get_process_pool_stats()['modules'] == ["worker_tool"]
@@ -0,0 +1,261 @@
+# tests/test_remote_files.py - SFTP prenosy na pripojené zariadenia (lokálny SSH server)
+import asyncio
+import os
+import socket
+import threading
+
+import pytest
+
+paramiko = pytest.importorskip("paramiko")
+
+from core.remote_files import RemoteFiles, PART_SUFFIX, RESUME_SUFFIX  # noqa: E402
+
+USERNAME, PASSWORD = "aura", "tajne"
+
+
+class _Server(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        if (username, password) == (USERNAME, PASSWORD):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED if kind == "session" else paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class _Handle(paramiko.SFTPHandle):
+    def stat(self):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+
+class _LocalSFTP(paramiko.SFTPServerInterface):
+    """SFTP nad lokálnou zložkou `root` (ako sftp-server)"""
+
+    root = None
+
+    def _real(self, path):
+        return os.path.join(self.root, self.canonicalize(path).lstrip("/"))
+
+    def _call(self, function, *args):
+        try:
+            function(*args)
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def list_folder(self, path):
+        try:
+            real = self._real(path)
+            result = []
+            for name in os.listdir(real):
+                attributes = paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(real, name)))
+                attributes.filename = name
+                result.append(attributes)
+            return result
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._real(path)))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+    def open(self, path, flags, attr):
+        real = self._real(path)
+        try:
+            fd = os.open(real, flags | getattr(os, "O_BINARY", 0), 0o644)
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        handle = _Handle(flags)
+        handle.readfile = handle.writefile = os.fdopen(fd, mode)
+        return handle
+
+    def remove(self, path):
+        return self._call(os.remove, self._real(path))
+
+    def rename(self, oldpath, newpath):
+        if os.path.exists(self._real(newpath)):
+            return paramiko.SFTP_FAILURE
+        return self._call(os.rename, self._real(oldpath), self._real(newpath))
+
+    def posix_rename(self, oldpath, newpath):
+        return self._call(os.replace, self._real(oldpath), self._real(newpath))
+
+    def mkdir(self, path, attr):
+        return self._call(os.mkdir, self._real(path))
+
+    def rmdir(self, path):
+        return self._call(os.rmdir, self._real(path))
+
+    def chattr(self, path, attr):
+        return self._call(paramiko.SFTPServer.set_file_attr, self._real(path), attr)
+
+
+@pytest.fixture
+def sftp_server(tmp_path):
+    """SSH server s SFTP nad tmp_path/remote - vráti (port, koreň)"""
+    root = tmp_path / "remote"
+    root.mkdir()
+    host_key = paramiko.RSAKey.generate(2048)
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    transports = []
+
+    handler = type("RootedSFTP", (_LocalSFTP,), {"root": str(root)})
+
+    def serve():
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(host_key)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, handler)
+            transport.start_server(server=_Server())
+            transports.append(transport)
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield listener.getsockname()[1], root
+    listener.close()
+    for transport in transports:
+        transport.close()
+
+
+def source_key(path):
+    """Značka .aura-resume, ktorú zapisuje nahrávanie (veľkosť:mtime_ns zdroja)"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def interrupt(target, partial, key):
+    """Stav po prerušenom prenose do `target`"""
+    (target.parent / (target.name + PART_SUFFIX)).write_bytes(partial)
+    (target.parent / (target.name + RESUME_SUFFIX)).write_text(key)
+
+
+def connect(port):
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect("127.0.0.1", port=port, username=USERNAME, password=PASSWORD,
+                   allow_agent=False, look_for_keys=False)
+    return client
+
+
+def test_upload_download_sync_and_resume(sftp_server, tmp_path):
+    port, remote_root = sftp_server
+    local = tmp_path / "local"
+    (local / "photos" / "2024").mkdir(parents=True)
+    big = os.urandom(3 * 1024 * 1024 + 123)
+    (local / "photos" / "2024" / "big.raw").write_bytes(big)
+    for index in range(6):
+        (local / "photos" / f"img_{index}.jpg").write_bytes(os.urandom(20_000))
+
+    client = connect(port)
+    remote = RemoteFiles(channels=3, workers=3, chunk_size=64 * 1024)
+    try:
+        remote.attach("nas", client)
+        assert remote.has_device("nas") and not remote.has_device("neznáme")
+
+        report = remote.sync("nas", str(local / "photos"), "/backup/photos")
+        assert (report['copied'], report['skipped'], report['errors']) == (7, 0, [])
+        assert (remote_root / "backup" / "photos" / "2024" / "big.raw").read_bytes() == big
+        assert remote.get_stats()["nas"]['channels'] == 3  # paralelné prenosy, kanály sa znovu používajú
+
+        listing = remote.listdir("nas", "/backup/photos")
+        assert listing[0] == {'name': '2024', 'path': '/backup/photos/2024', 'size': listing[0]['size'],
+                              'mtime': listing[0]['mtime'], 'is_dir': True}
+        assert [item['name'] for item in listing[1:3]] == ["img_0.jpg", "img_1.jpg"]
+
+        # Druhá synchronizácia nič neprenáša
+        report = remote.sync("nas", str(local / "photos"), "/backup/photos")
+        assert (report['copied'], report['skipped'], report['bytes_transferred']) == (0, 7, 0)
+
+        # Prerušené nahrávanie - pokračuje sa od uloženej dĺžky
+        video = local / "video.mp4"
+        video.write_bytes(big)
+        interrupt(remote_root / "backup" / "video.mp4", big[:1_000_000], source_key(video))
+        report = remote.upload("nas", str(video), "/backup")
+        assert (report['resumed'], report['bytes_transferred']) == (1, len(big) - 1_000_000)
+        assert (remote_root / "backup" / "video.mp4").read_bytes() == big
+        assert not list((remote_root / "backup").glob("video.mp4.aura-*"))
+
+        # Zdroj sa medzi pokusmi zmenil na začiatku (rovnaký koniec aj veľkosť) - začne sa odznova
+        interrupt(remote_root / "backup" / "video.mp4", big[:1_000_000], source_key(video))
+        changed = b"ZMENA" + big[5:]
+        video.write_bytes(changed)
+        os.utime(video, ns=(os.stat(video).st_atime_ns, os.stat(video).st_mtime_ns + 2_000_000_000))
+        report = remote.upload("nas", str(video), "/backup/video.mp4")
+        assert (report['resumed'], report['bytes_transferred']) == (0, len(big))
+        assert (remote_root / "backup" / "video.mp4").read_bytes() == changed
+
+        # Rozpracovaný súbor bez značky (alebo s iným obsahom) sa zahodí a prenesie sa celý
+        (remote_root / "backup" / ("other.bin" + PART_SUFFIX)).write_bytes(b"x" * 5000)
+        (local / "other.bin").write_bytes(b"y" * 10000)
+        report = remote.upload("nas", str(local / "other.bin"), "/backup/other.bin")
+        assert (report['resumed'], report['bytes_transferred']) == (0, 10000)
+        assert (remote_root / "backup" / "other.bin").read_bytes() == b"y" * 10000
+
+        # Prerušené sťahovanie
+        downloads = tmp_path / "downloads"
+        downloads.mkdir()
+        remote_video = remote_root / "backup" / "video.mp4"
+        interrupt(downloads / "video.mp4", changed[:2_000_000],
+                  f"{len(changed)}:{int(os.stat(remote_video).st_mtime)}")
+        report = remote.download("nas", "/backup/video.mp4", str(downloads))
+        assert (report['resumed'], report['bytes_transferred']) == (1, len(changed) - 2_000_000)
+        assert (downloads / "video.mp4").read_bytes() == changed
+        assert sorted(os.listdir(downloads)) == ["video.mp4"]
+
+        # Synchronizácia zo zariadenia
+        report = remote.sync("nas", str(tmp_path / "restore"), "/backup/photos", direction="download")
+        assert (report['copied'], report['errors']) == (7, [])
+        assert (tmp_path / "restore" / "2024" / "big.raw").read_bytes() == big
+        assert int(os.stat(tmp_path / "restore" / "img_0.jpg").st_mtime) == \
+            int(os.stat(local / "photos" / "img_0.jpg").st_mtime)
+
+        with pytest.raises(KeyError):
+            remote.listdir("neznáme", "/")
+    finally:
+        remote.close()
+        client.close()
+
+
+def test_file_manager_remote_commands(sftp_server, tmp_path, make_file_manager):
+    port, remote_root = sftp_server
+    local = tmp_path / "local"
+    local.mkdir()
+    (local / "report.txt").write_text("ahoj")
+    manager = make_file_manager()
+    assert manager.can_handle("pripoj zariadenie nas aura@127.0.0.1")
+    connected = asyncio.run(manager.handle(f"pripoj zariadenie nas {USERNAME}@127.0.0.1:{port} {PASSWORD}"))
+    assert connected == "✅ Zariadenie 'nas' úspešne pripojené"
+
+    uploaded = asyncio.run(manager.handle(f"nahraj na zariadenie {local / 'report.txt'} nas:/inbox/"))
+    assert uploaded.startswith("✅ Nahrané") and (remote_root / "inbox" / "report.txt").read_text() == "ahoj"
+
+    listing = asyncio.run(manager.handle("vzdialený zoznam nas:/inbox"))
+    assert "report.txt" in listing
+
+    synced = asyncio.run(manager.handle(f"synchronizuj zložky nas:/inbox {tmp_path / 'mirror'}"))
+    assert "Prenesené: 1 súborov" in synced and (tmp_path / "mirror" / "report.txt").exists()
+
+    downloaded = asyncio.run(manager.handle(f"stiahni zo zariadenia nas:/inbox/report.txt {tmp_path}"))
+    assert downloaded.startswith("✅ Stiahnuté") and (tmp_path / "report.txt").read_text() == "ahoj"
+    assert "❌" in asyncio.run(manager.handle("vzdialený zoznam iné:/"))
@@ -0,0 +1,153 @@
+# tests/test_scheduler.py - Prioritná fronta požiadaviek nad event loopom asistenta
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from core.event_loop import AssistantEventLoop
+from core.scheduler import QueueFullError, RequestScheduler
+
+
+@pytest.fixture
+def make_scheduler():
+    """Továreň na RequestScheduler s vlastným event loopom; loop sa po teste zastaví"""
+    loops = []
+
+    def factory(**kwargs):
+        event_loop = AssistantEventLoop(name="test-scheduler-loop")
+        loops.append(event_loop)
+        return RequestScheduler(event_loop, **kwargs)
+
+    yield factory
+    for event_loop in loops:
+        event_loop.stop()
+
+
+def gate(scheduler):
+    """Požiadavka, ktorá obsadí pracovníka, kým sa nezavolá `release()`"""
+    event = scheduler.event_loop.submit(_new_event()).result()
+    started = threading.Event()
+
+    async def blocker():
+        started.set()
+        await event.wait()
+
+    handle = scheduler.submit(blocker, source='background', label="blokuje")
+    assert started.wait(5)
+    return handle, lambda: scheduler.event_loop.call_soon(event.set)
+
+
+async def _new_event():
+    return asyncio.Event()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "podmienka sa nesplnila včas"
+        time.sleep(0.01)
+
+
+def test_requests_run_by_source_priority_then_submission_order(make_scheduler):
+    scheduler = make_scheduler(workers=1)
+    blocker, release = gate(scheduler)
+    order = []
+
+    def request(name):
+        async def run():
+            order.append(name)
+            return name
+        return run
+
+    handles = [
+        scheduler.submit(request("dashboard"), source='dashboard'),
+        scheduler.submit(request("background"), source='background'),
+        scheduler.submit(request("chat-1"), source='chat'),
+        scheduler.submit(request("hotkey"), source='hotkey'),
+        scheduler.submit(request("chat-2"), source='chat'),
+        scheduler.submit(request("explicit"), source='background', priority=0),
+    ]
+    assert scheduler.get_stats()['queued'] == 6
+    release()
+    concurrent.futures.wait(handles + [blocker], timeout=5)
+
+    assert order == ["hotkey", "explicit", "chat-1", "chat-2", "dashboard", "background"]
+    assert [handle.result() for handle in handles[:2]] == ["dashboard", "background"]
+    stats = scheduler.get_stats()
+    assert (stats['submitted'], stats['completed'], stats['queued'], stats['running']) == (7, 7, 0, 0)
+
+
+def test_same_serial_key_runs_one_at_a_time_in_order(make_scheduler):
+    scheduler = make_scheduler(workers=3)
+    events = []
+
+    def request(name):
+        async def run():
+            events.append(("start", name))
+            await asyncio.sleep(0.05)
+            events.append(("end", name))
+        return run
+
+    handles = [scheduler.submit(request(f"chat-{index}"), serial_key="konverzácia") for index in range(3)]
+    handles.append(scheduler.submit(request("dashboard"), source='dashboard'))
+    concurrent.futures.wait(handles, timeout=5)
+
+    serial = [event for event in events if event[1].startswith("chat")]
+    assert serial == [(kind, f"chat-{index}") for index in range(3) for kind in ("start", "end")]
+    # Požiadavka bez kľúča nečaká na sériové - beží na voľnom pracovníkovi hneď
+    assert events.index(("start", "dashboard")) < events.index(("end", "chat-0"))
+
+
+def test_full_queue_rejects_immediately(make_scheduler):
+    scheduler = make_scheduler(workers=1, max_queue=2)
+    blocker, release = gate(scheduler)
+
+    async def noop():
+        return "ok"
+
+    queued = [scheduler.submit(noop) for _ in range(2)]
+    rejected = scheduler.submit(noop)
+    assert rejected.done() and isinstance(rejected.exception(), QueueFullError)
+    assert scheduler.get_stats()['rejected'] == 1
+
+    # Zrušená čakajúca požiadavka uvoľní miesto vo fronte
+    assert queued[0].cancel()
+    assert scheduler.get_stats()['queued'] == 1
+    accepted = scheduler.submit(noop)
+    assert not accepted.done()
+
+    release()
+    assert accepted.result(5) == "ok" and queued[1].result(5) == "ok"
+    stats = scheduler.get_stats()
+    assert (stats['completed'], stats['cancelled'], stats['rejected']) == (3, 1, 1)
+
+
+def test_cancel_stops_running_request_and_failures_reach_the_handle(make_scheduler):
+    scheduler = make_scheduler(workers=1)
+    started, stopped = threading.Event(), threading.Event()
+
+    async def long_request():
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        finally:
+            stopped.set()
+
+    handle = scheduler.submit(long_request, label="dlhá")
+    assert started.wait(5)
+    wait_for(lambda: handle.is_running)
+    assert handle.cancel() and handle.cancelled()
+    assert stopped.wait(5)  # zrušila sa aj bežiaca korutina, nielen handle
+    wait_for(lambda: scheduler.get_stats()['running'] == 0)
+
+    async def broken():
+        raise ValueError("zlý príkaz")
+
+    failed = scheduler.submit(broken)
+    with pytest.raises(ValueError, match="zlý príkaz"):
+        failed.result(5)
+    stats = scheduler.get_stats()
+    assert (stats['cancelled'], stats['failed'], stats['completed']) == (1, 1, 0)
+    assert not handle.is_running
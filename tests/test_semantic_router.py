@@ -0,0 +1,118 @@
+# tests/test_semantic_router.py - Sémantické smerovanie cez embeddingy (bez Ollama)
+import asyncio
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.semantic_router import SemanticRouter  # noqa: E402
+from tests.fake_ollama import fake_embedding  # noqa: E402
+
+
+class StubEmbedClient:
+    """Namiesto Ollama klienta - deterministické embeddingy, počíta embedované texty"""
+
+    def __init__(self):
+        self.texts = []
+
+    async def embed(self, model, input):
+        self.texts.extend(input)
+        return {'embeddings': [fake_embedding(text) for text in input]}
+
+
+class Weather:
+    """Predpoveď počasia"""
+    supported_commands = ["aké je počasie", "predpoveď na zajtra"]
+
+
+class Music:
+    """Prehrávanie hudby"""
+    supported_commands = ["pusti pesničku", "zastav hudbu"]
+
+
+class Timer:
+    """Minútky"""
+    supported_commands = ["nastav minútku"]
+
+
+def test_build_persists_npz_and_embeds_only_changed_modules(tmp_path):
+    index_path = str(tmp_path / "semantic_index.npz")
+    client = StubEmbedClient()
+    modules = {'weather': Weather(), 'music': Music()}
+
+    router = SemanticRouter(index_path)
+    assert not router.ready
+    asyncio.run(router.build(client, modules))
+    assert router.ready and router.get_stats()['phrases'] == 6  # príkazy + prvý riadok popisu
+    assert (tmp_path / "semantic_index.npz").exists()
+
+    # Nový router načíta maticu zo súboru - nič sa neembeduje znovu
+    client.texts.clear()
+    reloaded = SemanticRouter(index_path)
+    assert reloaded.ready and reloaded._owners == router._owners
+    asyncio.run(reloaded.build(client, modules))
+    assert client.texts == [] and reloaded.stats['embedded_phrases'] == 0
+
+    # Zmena jedného modulu prepočíta len jeho frázy
+    music = Music()
+    music.supported_commands = ["pusti pesničku", "ďalšia skladba"]
+    asyncio.run(reloaded.build(client, {'weather': Weather(), 'music': music, 'timer': Timer()}))
+    assert sorted(client.texts) == sorted(["pusti pesničku", "ďalšia skladba", "Prehrávanie hudby",
+                                           "nastav minútku", "Minútky"])
+    assert sorted(set(reloaded._owners)) == ['music', 'timer', 'weather']
+
+    # Index iného embedding modelu sa nepoužije
+    assert not SemanticRouter(index_path, model="iný-model").ready
+
+
+def test_match_applies_threshold_and_caches_query_embeddings(tmp_path):
+    client = StubEmbedClient()
+    modules = {'weather': Weather(), 'music': Music()}
+    router = SemanticRouter(str(tmp_path / "index.npz"), threshold=0.75)
+    asyncio.run(router.build(client, modules))
+
+    module, score = asyncio.run(router.match(client, "Pusti pesničku!", modules))
+    assert module == 'music' and score > 0.99
+    assert asyncio.run(router.match(client, "pusti  pesničku", modules)) is not None
+    assert router.stats['query_cache_hits'] == 1  # rovnaký normalizovaný text
+
+    # Nesúvisiaci príkaz neprejde prahom
+    assert asyncio.run(router.match(client, "koľko stojí bitcoin dnes", modules)) is None
+    router.threshold = 1.01
+    assert asyncio.run(router.match(client, "pusti pesničku", modules)) is None
+    assert (router.stats['matches'], router.stats['misses']) == (2, 2)
+
+    # Modul, ktorý už nie je zaregistrovaný, sa z (starého) indexu nevráti
+    router.threshold = 0.75
+    assert asyncio.run(router.match(client, "pusti pesničku", {'weather': Weather()})) is None
+
+
+def test_ensure_index_skips_signature_while_modules_version_is_unchanged(tmp_path):
+    client = StubEmbedClient()
+    modules = {'weather': Weather()}
+    router = SemanticRouter(str(tmp_path / "index.npz"))
+    signatures = []
+    signature = router.signature
+    router.signature = lambda current: signatures.append(1) or signature(current)
+
+    async def scenario():
+        router.ensure_index(client, modules, version=1)
+        await router._build_task
+        assert router.ready and router.stats['builds'] == 1
+
+        for _ in range(5):
+            router.ensure_index(client, modules, version=1)
+        assert len(signatures) == 2  # ensure_index + build pri prvej verzii
+
+        # Nová verzia s rovnakými frázami - podpis raz, bez prestavby
+        router.ensure_index(client, modules, version=2)
+        router.ensure_index(client, modules, version=2)
+        assert len(signatures) == 3 and router._build_task.done() and router.stats['builds'] == 1
+
+        modules['timer'] = Timer()
+        await router.match(client, "nastav minútku", modules, version=3)
+        await router._build_task
+        assert router.stats['builds'] == 2
+        assert await router.match(client, "nastav minútku", modules, version=3) == ('timer', pytest.approx(1.0))
+
+    asyncio.run(scenario())
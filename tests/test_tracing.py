@@ -0,0 +1,99 @@
+# tests/test_tracing.py - Spany, JSONL zápis na pozadí a rotácia
+import asyncio
+import json
+import os
+import time
+
+from core.tracing import NOOP_SPAN, Tracer
+
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_nested_spans_link_to_parent_across_await(tmp_path):
+    tracer = Tracer(str(tmp_path / "traces.jsonl"), enabled=True)
+
+    async def command():
+        with tracer.span("command", source="chat") as root:
+            with tracer.span("route") as route:
+                await asyncio.sleep(0)
+                with tracer.span("route.phrase") as phrase:
+                    phrase.set(module="weather")
+            with tracer.span("ollama") as ollama:
+                tracer.record("ollama.first_token", time.perf_counter() - 0.01)
+        return root, route, phrase, ollama
+
+    root, route, phrase, ollama = asyncio.run(command())
+    assert root.parent_id is None
+    assert (route.parent_id, phrase.parent_id, ollama.parent_id) == (root.span_id, route.span_id, root.span_id)
+    assert {span.trace_id for span in (root, route, phrase, ollama)} == {root.trace_id}
+    assert Tracer.current() is NOOP_SPAN  # po skončení sa kontext obnoví
+
+    # Nový koreňový span začína novú stopu
+    with tracer.span("command") as other:
+        pass
+    assert other.parent_id is None and other.trace_id != root.trace_id
+    tracer.close()
+
+    records = {record['name']: record for record in read_records(tracer.path)}
+    assert records['ollama.first_token']['parent'] == ollama.span_id
+    assert records['ollama.first_token']['ms'] >= 10
+    assert records['route.phrase']['attrs'] == {'module': 'weather'}
+
+
+def test_background_writer_emits_one_record_per_span(tmp_path):
+    tracer = Tracer(str(tmp_path / "traces" / "traces.jsonl"), enabled=True)
+    for index in range(25):
+        with tracer.span("step", index=index):
+            pass
+    try:
+        with tracer.span("failing"):
+            raise ValueError("zlé")
+    except ValueError:
+        pass
+    tracer.close()
+
+    records = read_records(tracer.path)
+    assert [record['attrs'].get('index') for record in records[:25]] == list(range(25))
+    assert len(records) == 26 and len({record['span'] for record in records}) == 26
+    assert records[-1]['attrs'] == {'error': 'ValueError'}
+    assert tracer.get_stats()['spans'] == 26 and tracer.get_stats()['dropped'] == 0
+
+
+def test_size_based_rotation_keeps_configured_backups(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+    tracer = Tracer(path, max_bytes=400, backups=2)
+    record = {'name': "step", 'attrs': {'text': "x" * 150}}
+    for _ in range(12):
+        tracer._write([record])
+
+    assert sorted(os.listdir(tmp_path)) == ["traces.jsonl", "traces.jsonl.1", "traces.jsonl.2"]
+    assert all(os.path.getsize(f"{path}{suffix}") <= 400 for suffix in ("", ".1", ".2"))
+    assert tracer.stats['rotations'] == 5  # 2 záznamy na súbor, najstaršie sa zahodili
+
+    # Bez záloh sa plný súbor len zmaže
+    single = Tracer(str(tmp_path / "single" / "traces.jsonl"), max_bytes=400, backups=0)
+    for _ in range(3):
+        single._write([record])
+    assert os.listdir(tmp_path / "single") == ["traces.jsonl"]
+    assert len(read_records(single.path)) == 1
+
+
+def test_disabled_tracer_returns_noop_span(tmp_path):
+    tracer = Tracer(str(tmp_path / "traces.jsonl"), enabled=True)
+    tracer.set_enabled(False)
+    with tracer.span("command", source="chat") as span:
+        span.set(module="weather")
+        assert Tracer.current() is NOOP_SPAN
+    assert span is NOOP_SPAN
+    tracer.record("ollama.first_token", time.perf_counter())
+    assert tracer.get_stats()['spans'] == 0
+
+    # Opätovné zapnutie za behu znovu zapisuje
+    tracer.set_enabled(True)
+    with tracer.span("command"):
+        pass
+    tracer.close()
+    assert [record['name'] for record in read_records(tracer.path)] == ["command"]
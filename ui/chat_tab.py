@@ -5,6 +5,7 @@ import asyncio
 import threading
 import time
 from typing import Callable
+from .streaming import StreamCoalescer
 
 class ChatTab:
     def __init__(self, parent, assistant, config_manager):
@@ -183,6 +184,8 @@ Jednoducho napíšte svoju otázku..."""
         
         # Auto-scroll na najnovšiu správu
         self.scroll_to_bottom()
+        
+        return message_label
     
     def scroll_to_bottom(self):
         """Automatický scroll na spodok chatu"""
@@ -211,25 +214,54 @@ Jednoducho napíšte svoju otázku..."""
         # Zobraz indikátor premýšľania
         self.show_thinking_indicator()
         
-        # Spracuj správu asynchrónne
-        threading.Thread(target=self.process_message, args=(message,), daemon=True).start()
+        # Spracuj správu asynchrónne v event loope asistenta
+        self.process_message(message)
     
     def process_message(self, message: str):
-        """Spracuje správu v samostatnom vlákne - OPRAVENÁ VERZIA"""
+        """Odošle správu asistentovi a priebežne zobrazuje odpoveď"""
         try:
-            # ✅ POUŽIJ SYNCHRONNÚ VERZIU namiesto asyncio
-            response = self.assistant.process_command_sync(message)
-            
-            # ✅ OPRAVENÉ: Použijeme after z hlavného widgetu (parent)
-            # Skry indikátor a pridaj odpoveď v hlavnom threade
-            self.parent.after(0, self.hide_thinking_indicator)
-            self.parent.after(0, lambda: self.add_message("assistant", response))
+            # ✅ Streamovaná odpoveď - text sa zobrazuje priebežne
+            view = {}
+            stream = StreamCoalescer(
+                self.parent,
+                lambda text, final: self.render_streamed_response(view, text, final)
+            )
+            future = self.assistant.submit_command_stream(message, stream.push, source="chat")
+            future.add_done_callback(lambda f: self.on_response_done(f, stream))
             
         except Exception as e:
-            error_msg = f"❌ Chyba pri spracovaní: {str(e)}"
-            # ✅ OPRAVENÉ: Použijeme after z hlavného widgetu (parent)
-            self.parent.after(0, self.hide_thinking_indicator)
-            self.parent.after(0, lambda: self.add_message("assistant", error_msg))
+            self.show_processing_error(e)
+    
+    def on_response_done(self, future, stream):
+        """Dokončí odpoveď po skončení Future (volané z event loopu asistenta)"""
+        if future.cancelled():
+            # Zrušené hotkeyom - ponechaj doteraz prijatý text
+            stream.push("\n⏹️ Prerušené")
+            stream.finish()
+            return
+        try:
+            future.result()
+            stream.finish()
+        except Exception as e:
+            self.show_processing_error(e)
+    
+    def show_processing_error(self, error):
+        """Zobrazí chybu spracovania v hlavnom threade"""
+        error_msg = f"❌ Chyba pri spracovaní: {str(error)}"
+        # ✅ OPRAVENÉ: Použijeme after z hlavného widgetu (parent)
+        self.parent.after(0, self.hide_thinking_indicator)
+        self.parent.after(0, lambda: self.add_message("assistant", error_msg))
+    
+    def render_streamed_response(self, view: dict, text: str, final: bool):
+        """Vykreslí priebežný text odpovede v hlavnom threade"""
+        if "label" not in view:
+            if not text and not final:
+                return
+            self.hide_thinking_indicator()
+            view["label"] = self.add_message("assistant", text)
+        else:
+            view["label"].configure(text=text)
+            self.scroll_to_bottom()
     
     def toggle_voice_listening(self):
         """Prepína hlasové počúvanie"""
@@ -1,6 +1,7 @@
 # ui/main_window.py - OPRAVENÁ VERZIA
 import customtkinter as ctk
 from .themes import theme_manager
+from .streaming import StreamCoalescer
 import time
 import math
 import threading
@@ -388,15 +389,26 @@ class QuantumMainWindow(ctk.CTk):
         self.simple_output.insert("end", f"\n\nVy: {message}\n")
         self.simple_output.see("end")
         
-        # Spracovať pomocou assistant
-        def process_message():
+        # Spracovať pomocou assistant - odpoveď sa vypisuje priebežne
+        view = {}
+        stream = StreamCoalescer(self, lambda text, final: self.display_stream_response(view, text, final))
+        
+        def on_done(future):
+            if future.cancelled():
+                stream.push("\n⏹️ Prerušené")
+                stream.finish()
+                return
             try:
-                response = self.assistant.process_command_sync(message)
-                self.after(0, lambda: self.display_response(response))
+                future.result()
+                stream.finish()
             except Exception as e:
-                self.after(0, lambda: self.display_response(f"❌ Chyba: {str(e)}"))
+                error_msg = f"❌ Chyba: {str(e)}"
+                self.after(0, lambda: self.display_response(error_msg))
         
-        threading.Thread(target=process_message, daemon=True).start()
+        try:
+            self.assistant.submit_command_stream(message, stream.push, source="chat").add_done_callback(on_done)
+        except Exception as e:
+            self.display_response(f"❌ Chyba: {str(e)}")
         self.chat_entry.delete(0, "end")
     
     def display_response(self, response):
@@ -404,6 +416,19 @@ class QuantumMainWindow(ctk.CTk):
         self.simple_output.insert("end", f"Asistent: {response}\n")
         self.simple_output.see("end")
     
+    def display_stream_response(self, view, text, final):
+        """Priebežne prepisuje streamovanú odpoveď v chate"""
+        if "start" not in view:
+            if not text and not final:
+                return
+            self.simple_output.insert("end", "Asistent: ")
+            view["start"] = self.simple_output.index("end-1c")
+        else:
+            self.simple_output.delete(view["start"], "end-1c")
+        
+        self.simple_output.insert("end", text + ("\n" if final else ""))
+        self.simple_output.see("end")
+    
     def setup_simple_modules(self, parent):
         """Jednoduchý zoznam modulov"""
         main_frame = ctk.CTkFrame(parent, fg_color=self.theme["bg_tertiary"], corner_radius=20)
@@ -513,6 +538,7 @@ class QuantumMainWindow(ctk.CTk):
         status_frame = ctk.CTkFrame(status_bar, fg_color="transparent")
         status_frame.pack(side="left", padx=20)
         
+        self.status_labels = {}
         for icon, text, anim_id in status_items:
             frame = ctk.CTkFrame(status_frame, fg_color="transparent", border_width=0)
             frame.pack(side="left", padx=15)
@@ -524,6 +550,27 @@ class QuantumMainWindow(ctk.CTk):
                 text_color=self.theme["text_secondary"]
             )
             label.pack(pady=10)
+            self.status_labels[anim_id] = label
+    
+    def set_ai_status(self, state, message):
+        """Aktualizuje stav AI modelu v status bare (volať v Tk vlákne)"""
+        colors = {
+            "warming": self.theme["warning"],
+            "ready": self.theme["success"],
+            "offline": self.theme["error"],
+            "error": self.theme["error"]
+        }
+        icons = {"warming": "⏳", "ready": "✅", "offline": "⚠️", "error": "❌"}
+        label = getattr(self, "status_labels", {}).get("ai_status")
+        if label is None:
+            return
+        try:
+            label.configure(
+                text=f"🤖 AI {icons.get(state, '')} {message}",
+                text_color=colors.get(state, self.theme["text_secondary"])
+            )
+        except Exception as e:
+            print(f"⚠️ Chyba pri aktualizácii stavu AI: {e}")
     
     def start_background_animations(self):
         """Spustí pozadie animácií"""
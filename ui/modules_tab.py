@@ -491,7 +491,7 @@ class {class_name}:
                 
                 # Pridaj modul do asistenta
                 module_class = getattr(module, class_name)
-                self.assistant.modules[name] = module_class()
+                self.assistant.register_module(name, module_class())
                 
                 self.show_message(f"✅ Modul '{name}' bol úspešne vytvorený a načítaný!", "success")
                 self.refresh_installed_modules_list()
@@ -516,6 +516,8 @@ class {class_name}:
         
         template = f'''import asyncio
 
+# MODULE_HEAVY = True  # odkomentuj pre pomalý modul - beží v samostatnom procese
+
 class {class_name}:
     def __init__(self):
         self.supported_commands = {commands}
@@ -566,46 +568,32 @@ class {class_name}:
     
     def remove_module(self, module_name):
         """Odstráni modul"""
-        if module_name in self.assistant.modules:
-            del self.assistant.modules[module_name]
-            
-            # Pokús sa odstrániť súbor
-            module_file = f"modules/{module_name}.py"
-            if os.path.exists(module_file):
-                try:
-                    os.remove(module_file)
-                except:
-                    pass
-            
+        if self.assistant.remove_module(module_name, delete_file=True):
             self.show_message(f"✅ Modul '{module_name}' bol odstránený", "success")
             self.refresh_installed_modules_list()
         else:
             self.show_message(f"❌ Modul '{module_name}' nebol nájdený", "error")
     
     def restart_module(self, module_name):
-        """Reštartuje modul"""
-        if module_name in self.assistant.modules:
-            module_file = f"modules/{module_name}.py"
-            if os.path.exists(module_file):
-                try:
-                    # Znova načítaj modul
-                    spec = importlib.util.spec_from_file_location(module_name, module_file)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    class_name = module_name.title().replace('_', '')
-                    module_class = getattr(module, class_name)
-                    self.assistant.modules[module_name] = module_class()
-                    
-                    self.show_message(f"✅ Modul '{module_name}' bol reštartovaný", "success")
-                    self.refresh_installed_modules_list()
-                    
-                except Exception as e:
-                    self.show_message(f"❌ Chyba pri reštartovaní modulu: {e}", "error")
-            else:
-                self.show_message(f"❌ Súbor modulu '{module_name}' neexistuje", "error")
-        else:
+        """Reštartuje modul (znovu načíta súbor na pozadí, stará verzia slúži do úspešného načítania)"""
+        if module_name not in self.assistant.modules:
             self.show_message(f"❌ Modul '{module_name}' nebol nájdený", "error")
+            return
+        
+        def on_done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = str(e)
+            if result in ('reloaded', 'added'):
+                self.after(0, lambda: (self.show_message(f"✅ Modul '{module_name}' bol reštartovaný", "success"),
+                                       self.refresh_installed_modules_list()))
+            elif result == 'removed':
+                self.after(0, lambda: self.show_message(f"❌ Súbor modulu '{module_name}' neexistuje", "error"))
+            else:
+                self.after(0, lambda: self.show_message(f"❌ Chyba pri reštartovaní modulu '{module_name}'", "error"))
+        
+        self.assistant.reload_module(module_name).add_done_callback(on_done)
     
     def refresh_modules(self):
         """Obnoví všetky moduly"""
@@ -2,6 +2,7 @@
 import customtkinter as ctk
 from customtkinter import CTkScrollableFrame
 from .themes import theme_manager
+from .streaming import StreamCoalescer
 import time
 import threading
 import asyncio
@@ -345,6 +346,8 @@ Som váš Quantum AI asistent, pripravený pomôcť s:
         
         # Ulož históriu
         self.save_chat_history()
+        
+        return message_label
     
     def animate_message_appear(self, widget):
         """Animácia objavenia správy"""
@@ -373,8 +376,8 @@ Som váš Quantum AI asistent, pripravený pomôcť s:
         # Zobraz indikátor premýšľania
         self.show_thinking_indicator()
         
-        # Spracuj správu
-        threading.Thread(target=self.process_message, args=(message,), daemon=True).start()
+        # Spracuj správu (odošle sa do event loopu asistenta, UI neblokuje)
+        self.process_message(message)
     
     def send_quick_command(self, command):
         """Odošle rýchly príkaz"""
@@ -419,21 +422,59 @@ Som váš Quantum AI asistent, pripravený pomôcť s:
     def process_message(self, message):
         """Spracuje správu pomocou AI assistant"""
         try:
-            # Použij existujúci assistant na spracovanie
-            if hasattr(self.assistant, 'process_command_sync'):
-                response = self.assistant.process_command_sync(message)
-            else:
-                # Fallback ak metóda neexistuje
-                response = f"🤖 AI Response to: {message}\n\nToto je simulovaná odpoveď. Skutočná AI integrácia bude čoskoro dostupná."
+            # Streamuj odpoveď, aby bol prvý token viditeľný hneď
+            if hasattr(self.assistant, 'submit_command_stream'):
+                view = {}
+                stream = StreamCoalescer(self, lambda text, final: self.render_streamed_response(view, text, final))
+                future = self.assistant.submit_command_stream(message, stream.push, source="chat")
+                future.add_done_callback(lambda f: self.on_response_done(f, stream))
+                return
             
-            # Skry indikátor a pridaj odpoveď
+            # Fallback ak metóda neexistuje
+            response = f"🤖 AI Response to: {message}\n\nToto je simulovaná odpoveď. Skutočná AI integrácia bude čoskoro dostupná."
             self.after(0, self.hide_thinking)
             self.after(0, lambda: self.add_message("assistant", response))
             
         except Exception as e:
-            error_msg = f"❌ Chyba pri spracovaní: {str(e)}"
-            self.after(0, self.hide_thinking)
-            self.after(0, lambda: self.add_message("assistant", error_msg))
+            self.show_processing_error(e)
+    
+    def on_response_done(self, future, stream):
+        """Dokončí streamovanú odpoveď (volané z event loopu asistenta)"""
+        if future.cancelled():
+            # Zrušené hotkeyom - ponechaj doteraz prijatý text
+            stream.push("\n⏹️ Prerušené")
+            stream.finish()
+            return
+        try:
+            future.result()
+            stream.finish()
+        except Exception as e:
+            self.show_processing_error(e)
+    
+    def show_processing_error(self, error):
+        """Zobrazí chybu spracovania v chate"""
+        error_msg = f"❌ Chyba pri spracovaní: {str(error)}"
+        self.after(0, self.hide_thinking)
+        self.after(0, lambda: self.add_message("assistant", error_msg))
+    
+    def render_streamed_response(self, view, text, final):
+        """Vykreslí priebežný text streamovanej odpovede (volané v Tk vlákne)"""
+        try:
+            if "label" not in view:
+                if not text and not final:
+                    return
+                self.hide_thinking()
+                view["label"] = self.add_message("assistant", text)
+                view["entry"] = self.message_history[-1]
+            else:
+                view["label"].configure(text=text)
+                view["entry"]["text"] = text
+                self.messages_frame._parent_canvas.yview_moveto(1.0)
+            
+            if final:
+                self.save_chat_history()
+        except Exception as e:
+            print(f"Chyba pri vykresľovaní odpovede: {e}")
     
     def hide_thinking(self):
         """Skryje indikátor premýšľania"""
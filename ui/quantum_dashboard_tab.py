@@ -6,6 +6,7 @@ import time
 import threading
 from datetime import datetime
 import os
+from collections import deque
 
 class QuantumDashboardTab(ctk.CTkFrame):
     def __init__(self, parent, assistant, config_manager):
@@ -120,6 +121,8 @@ class QuantumDashboardTab(ctk.CTkFrame):
         self.setup_quick_commands()
         self.setup_modules_status()
         self.setup_recent_activity()
+        self.setup_cache_status()
+        self.setup_performance_panel()
     
     def setup_system_widgets(self):
         """Vytvorí widgety systémových metrík"""
@@ -372,6 +375,152 @@ class QuantumDashboardTab(ctk.CTkFrame):
         self.activity_text.insert("1.0", "Žiadne aktivity...\n")
         self.activity_text.configure(state="disabled")
     
+    def setup_cache_status(self):
+        """Vytvorí widget štatistík cache odpovedí AI"""
+        cache_frame = ctk.CTkFrame(
+            self.dashboard_scroll,
+            fg_color=self.theme["bg_tertiary"],
+            corner_radius=15,
+            border_width=2,
+            border_color=self.theme["accent_secondary"]
+        )
+        cache_frame.grid(row=3, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
+        
+        ctk.CTkLabel(
+            cache_frame,
+            text="⚡ AI CACHE",
+            font=("Segoe UI", 16, "bold"),
+            text_color=self.theme["accent_glow"]
+        ).pack(anchor="w", padx=20, pady=15)
+        
+        self.cache_label = ctk.CTkLabel(
+            cache_frame,
+            text="Cache nie je dostupná",
+            font=("Consolas", 11),
+            text_color=self.theme["text_secondary"]
+        )
+        self.cache_label.pack(anchor="w", padx=20, pady=(0, 15))
+    
+    def update_cache_status(self):
+        """Aktualizuje štatistiky cache odpovedí"""
+        if not hasattr(self.assistant, 'get_cache_stats'):
+            return
+        stats = self.assistant.get_cache_stats()
+        if not stats.get('enabled'):
+            self.cache_label.configure(text="Cache vypnutá")
+            return
+        
+        self.cache_label.configure(
+            text=(f"Zásahy: {stats['hits']} (RAM {stats['memory_hits']} / disk {stats['disk_hits']}) | "
+                  f"Nezásahy: {stats['misses']} | Úspešnosť: {stats['hit_rate'] * 100:.0f}% | "
+                  f"V pamäti: {stats['memory_size']}")
+        )
+    
+    PERFORMANCE_COLUMNS = ("Cieľ", "Požiad.", "/min", "p50", "p95", "p99", "Chyby")
+    THROUGHPUT_WINDOW = 60  # sekúnd pre výpočet priepustnosti
+    
+    def setup_performance_panel(self):
+        """Vytvorí tabuľku výkonu - riadky pribúdajú pri nových moduloch/modeloch, existujúce sa len prepisujú"""
+        perf_frame = ctk.CTkFrame(
+            self.dashboard_scroll,
+            fg_color=self.theme["bg_tertiary"],
+            corner_radius=15,
+            border_width=2,
+            border_color=self.theme["accent_secondary"]
+        )
+        perf_frame.grid(row=4, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
+        
+        ctk.CTkLabel(
+            perf_frame,
+            text="🚀 VÝKON ASISTENTA",
+            font=("Segoe UI", 16, "bold"),
+            text_color=self.theme["accent_glow"]
+        ).pack(anchor="w", padx=20, pady=15)
+        
+        self.performance_table = ctk.CTkFrame(perf_frame, fg_color="transparent")
+        self.performance_table.pack(fill="x", padx=20, pady=(0, 15))
+        self.performance_table.grid_columnconfigure(0, weight=1)
+        
+        for column, title in enumerate(self.PERFORMANCE_COLUMNS):
+            ctk.CTkLabel(
+                self.performance_table,
+                text=title,
+                font=("Segoe UI", 11, "bold"),
+                text_color=self.theme["accent_glow"]
+            ).grid(row=0, column=column, padx=8, pady=2, sticky="w" if column == 0 else "e")
+        
+        # kľúč -> labely stĺpcov; kľúč -> história (čas, počet) na priepustnosť
+        self.performance_rows = {}
+        self.performance_history = {}
+    
+    def update_performance_panel(self):
+        """Prepíše hodnoty v tabuľke výkonu (widgety sa vytvárajú len pre nové riadky)"""
+        if not hasattr(self.assistant, 'get_performance_stats'):
+            return
+        stats = self.assistant.get_performance_stats()
+        now = time.monotonic()
+        
+        rows = [(f"🔧 {row['labels'].get('module')}", row) for row in stats['modules']]
+        rows += [(f"🤖 {row['labels'].get('model')}", row) for row in stats['models']]
+        
+        for key, row in rows:
+            labels = self.performance_rows.get(key)
+            if labels is None:
+                labels = self._add_performance_row(key)
+            
+            # Priepustnosť za posledné okno z rozdielu počtov
+            history = self.performance_history.setdefault(key, deque())
+            history.append((now, row['count']))
+            while len(history) > 2 and now - history[1][0] >= self.THROUGHPUT_WINDOW:
+                history.popleft()
+            first_time, first_count = history[0]
+            elapsed = now - first_time
+            per_minute = (row['count'] - first_count) * 60 / elapsed if elapsed > 0 else 0.0
+            
+            error_rate = row['errors'] / row['count'] * 100 if row['count'] else 0.0
+            values = (
+                str(row['count']),
+                f"{per_minute:.1f}",
+                self._format_latency(row['p50']),
+                self._format_latency(row['p95']),
+                self._format_latency(row['p99']),
+                f"{error_rate:.1f}%"
+            )
+            for label, value in zip(labels, values):
+                if label.cget("text") != value:
+                    label.configure(text=value)
+    
+    def _add_performance_row(self, key):
+        """Pridá riadok tabuľky výkonu a vráti labely hodnôt"""
+        row_index = len(self.performance_rows) + 1
+        ctk.CTkLabel(
+            self.performance_table,
+            text=key,
+            font=("Consolas", 11),
+            text_color=self.theme["text_secondary"]
+        ).grid(row=row_index, column=0, padx=8, pady=1, sticky="w")
+        
+        labels = []
+        for column in range(1, len(self.PERFORMANCE_COLUMNS)):
+            label = ctk.CTkLabel(
+                self.performance_table,
+                text="-",
+                font=("Consolas", 11),
+                text_color=self.theme["text_secondary"]
+            )
+            label.grid(row=row_index, column=column, padx=8, pady=1, sticky="e")
+            labels.append(label)
+        self.performance_rows[key] = labels
+        return labels
+    
+    @staticmethod
+    def _format_latency(value_ms):
+        if value_ms is None:
+            return "-"
+        if value_ms >= 1000:
+            return f"{value_ms / 1000:.1f}s"
+        return f"{value_ms:.0f}ms"
+    
     def refresh_modules_status(self):
         """Obnoví stav modulov"""
         # Vymaž starý obsah
@@ -421,15 +570,22 @@ class QuantumDashboardTab(ctk.CTkFrame):
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.add_activity(f"Spustený príkaz: {command}")
         
-        # Spustenie príkazu v samostatnom vlákne
-        def run_command():
+        # Spustenie príkazu v event loope asistenta
+        def on_done(future):
+            if future.cancelled():
+                self.after(0, lambda: self.add_activity(f"Zrušené: {command}"))
+                return
             try:
-                response = self.assistant.process_command_sync(command)
+                response = future.result()
                 self.after(0, lambda: self.add_activity(f"Odpoveď: {response[:100]}..."))
             except Exception as e:
-                self.after(0, lambda: self.add_activity(f"Chyba: {str(e)}"))
+                error_msg = f"Chyba: {str(e)}"
+                self.after(0, lambda: self.add_activity(error_msg))
         
-        threading.Thread(target=run_command, daemon=True).start()
+        try:
+            self.assistant.submit_command(command, source="dashboard").add_done_callback(on_done)
+        except Exception as e:
+            self.add_activity(f"Chyba: {str(e)}")
     
     def add_activity(self, activity_text):
         """Pridá aktivitu do histórie"""
@@ -484,6 +640,12 @@ class QuantumDashboardTab(ctk.CTkFrame):
             except:
                 self.battery_label.configure(text="N/A")
                 self.battery_progress.set(0)
+            
+            # Cache odpovedí AI
+            self.update_cache_status()
+            
+            # Latencie a priepustnosť modulov a modelov
+            self.update_performance_panel()
                 
         except Exception as e:
             print(f"Chyba pri aktualizácii metrík: {e}")
@@ -22,6 +22,10 @@ class QuantumModulesTab(ctk.CTkFrame):
         self.load_installed_modules()
         self.load_available_modules()
         self.refresh_installed_modules()
+        
+        # Hot reload - zmeny súborov modulov obnovia zoznam (callback príde z vlákna na pozadí)
+        if hasattr(self.assistant, 'add_module_listener'):
+            self.assistant.add_module_listener(self.on_module_changed)
     
     def setup_quantum_modules_ui(self):
         """Vytvorí quantum modules interface"""
@@ -669,10 +673,39 @@ class QuantumModulesTab(ctk.CTkFrame):
         
         print(f"✅ Obnova dokončená. Modulov: {module_count}")
     
+    def destroy(self):
+        """Odhlási sa z notifikácií o zmenách modulov"""
+        if hasattr(self.assistant, 'remove_module_listener'):
+            self.assistant.remove_module_listener(self.on_module_changed)
+        super().destroy()
+    
+    def on_module_changed(self, module_name, action):
+        """Modul bol za behu načítaný alebo odstránený - obnov zoznam v hlavnom vlákne"""
+        try:
+            self.after(0, self.refresh_modules)
+        except RuntimeError:
+            pass  # okno sa už zatvára
+    
     def restart_module(self, module_name):
-        """Reštartuje modul"""
+        """Reštartuje modul - znovu ho načíta zo súboru na pozadí, stará verzia slúži do úspešného načítania"""
         print(f"🔄 Reštartujem modul: {module_name}")
-        # Tu by sa reštartoval skutočný modul
+        self.modules_status.configure(text=f"🔄 Načítavam {module_name}...", text_color=self.theme["warning"])
+        future = self.assistant.reload_module(module_name)
+        
+        def on_done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = f"failed ({e})"
+            if result in ('reloaded', 'added'):
+                text, color = f"♻️ {module_name} znovu načítaný", self.theme["success"]
+            elif result == 'removed':
+                text, color = f"🗑️ {module_name} už neexistuje", self.theme["warning"]
+            else:
+                text, color = f"❌ {module_name}: načítanie zlyhalo, beží predchádzajúca verzia", self.theme["error"]
+            self.after(0, lambda: self.modules_status.configure(text=text, text_color=color))
+        
+        future.add_done_callback(on_done)
     
     def configure_module(self, module_name):
         """Konfiguruje modul"""
@@ -680,9 +713,15 @@ class QuantumModulesTab(ctk.CTkFrame):
         # Otvoriť konfiguračné okno pre modul
     
     def remove_module(self, module_name):
-        """Odstráni modul"""
+        """Odstráni modul z asistenta aj jeho súbor"""
         print(f"🗑️ Odstraňujem modul: {module_name}")
-        # Odstrániť modul zo systému
+        if self.assistant.remove_module(module_name, delete_file=True):
+            self.installed_modules.pop(module_name, None)
+            self.expanded_modules.pop(module_name, None)
+            self.refresh_modules()
+            self.modules_status.configure(text=f"🗑️ {module_name} odstránený", text_color=self.theme["warning"])
+        else:
+            self.modules_status.configure(text=f"❌ Modul {module_name} nebol nájdený", text_color=self.theme["error"])
     
     def install_module(self, module_id):
         """Inštaluje modul"""
@@ -715,6 +754,8 @@ class QuantumModulesTab(ctk.CTkFrame):
             module_template = f'''
 import asyncio
 
+# MODULE_HEAVY = True  # odkomentuj pre pomalý modul - beží v samostatnom procese
+
 class {name.title().replace('_', '')}:
     """{description}"""
     
@@ -0,0 +1,64 @@
+# ui/streaming.py - Zlučovanie streamovaných odpovedí pre Tk
+import threading
+import time
+from typing import Callable
+
+
+class StreamCoalescer:
+    """Zbiera časti odpovede z pracovného vlákna a prekresľuje UI najviac raz za interval.
+
+    `push` sa volá z ľubovoľného vlákna, `render(text, final)` vždy v Tk vlákne
+    cez `widget.after` s celým doteraz prijatým textom. Prvá časť sa vykreslí
+    hneď, ďalšie sa zlúčia do jedného prekreslenia každých `interval_ms`.
+    """
+
+    def __init__(self, widget, render: Callable[[str, bool], None], interval_ms: int = 50):
+        self.widget = widget
+        self.render = render
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._parts = []
+        self._text = ""
+        self._scheduled = False
+        self._finished = False
+        self._last_flush = 0.0
+
+    def push(self, chunk: str):
+        """Pridá časť odpovede (volané z pracovného vlákna)"""
+        with self._lock:
+            self._parts.append(chunk)
+            if self._scheduled or self._finished:
+                return
+            self._scheduled = True
+            elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+            delay = max(0, int(self.interval_ms - elapsed_ms))
+        self.widget.after(delay, self._flush)
+
+    def finish(self):
+        """Ukončí stream a vykreslí finálny text"""
+        with self._lock:
+            self._finished = True
+        self.widget.after(0, self._flush_final)
+
+    def text(self) -> str:
+        """Vráti doteraz prijatý text"""
+        with self._lock:
+            return self._collect()
+
+    def _collect(self) -> str:
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts.clear()
+        return self._text
+
+    def _flush(self):
+        with self._lock:
+            self._scheduled = False
+            if self._finished:
+                return
+            self._last_flush = time.monotonic()
+            text = self._collect()
+        self.render(text, False)
+
+    def _flush_final(self):
+        self.render(self.text(), True)